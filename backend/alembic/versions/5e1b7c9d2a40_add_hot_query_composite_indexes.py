@@ -0,0 +1,60 @@
+"""add composite indexes for draw and expert hot queries
+
+Revision ID: 5e1b7c9d2a40
+Revises: 8f7c2c11e0ab
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e1b7c9d2a40"
+down_revision = "8f7c2c11e0ab"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_expert_specialties_specialty_expert", "expert_specialties", ["specialty_id", "expert_id"]),
+    ("ix_experts_active_region", "experts", ["is_active", "region_id"]),
+    ("ix_experts_active_title", "experts", ["is_active", "title_id"]),
+    ("ix_experts_active_organization", "experts", ["is_active", "organization_id"]),
+    (
+        "ix_expert_documents_expert_type_order",
+        "expert_documents",
+        ["expert_id", "doc_type", "sort_order"],
+    ),
+    (
+        "ix_draw_results_draw_backup_ordinal",
+        "draw_results",
+        ["draw_id", "is_backup", "ordinal"],
+    ),
+    (
+        "ix_draw_results_draw_backup_status",
+        "draw_results",
+        ["draw_id", "is_backup", "contact_status"],
+    ),
+]
+
+
+def _existing_indexes(conn, table_name: str) -> set[str]:
+    inspector = sa.inspect(conn)
+    return {item["name"] for item in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for name, table_name, columns in INDEXES:
+        if name in _existing_indexes(conn, table_name):
+            continue
+        op.create_index(name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for name, table_name, _columns in reversed(INDEXES):
+        if name not in _existing_indexes(conn, table_name):
+            continue
+        op.drop_index(name, table_name=table_name)
@@ -0,0 +1,41 @@
+"""add draw execution claim columns
+
+Revision ID: 7a3d5f1e9c62
+Revises: 5e1b7c9d2a40
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7a3d5f1e9c62"
+down_revision = "5e1b7c9d2a40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("draw_applications") as batch_op:
+        batch_op.add_column(sa.Column("execution_key", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("executed_at", sa.DateTime(timezone=True), nullable=True))
+
+    # Draws that already have results count as executed so they cannot be
+    # claimed a second time.
+    op.execute(
+        """
+        UPDATE draw_applications
+        SET executed_at = updated_at
+        WHERE EXISTS (
+            SELECT 1 FROM draw_results
+            WHERE draw_results.draw_id = draw_applications.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("draw_applications") as batch_op:
+        batch_op.drop_column("executed_at")
+        batch_op.drop_column("execution_key")
@@ -0,0 +1,65 @@
+"""add change feed log
+
+Revision ID: a8e2d4c6f913
+Revises: f3c8a1d6b247
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a8e2d4c6f913"
+down_revision = "f3c8a1d6b247"
+branch_labels = None
+depends_on = None
+
+
+FEED_TABLES = ("experts", "organizations", "regions", "titles", "specialties", "rules")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_log",
+        sa.Column("seq", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("entity", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("op", sa.String(length=10), nullable=False),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("seq"),
+        sa.UniqueConstraint("entity", "entity_id", name="uq_change_log_entity"),
+    )
+    op.create_table(
+        "change_sequence",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Existing rows become upserts so a sync from the start sees everything.
+    bind = op.get_bind()
+    offset = 0
+    for table_name in FEED_TABLES:
+        op.execute(
+            f"""
+            INSERT INTO change_log (seq, entity, entity_id, op)
+            SELECT {offset} + ROW_NUMBER() OVER (ORDER BY id), '{table_name}', id,
+                   'upsert'
+            FROM {table_name}
+            """
+        )
+        offset += bind.execute(
+            sa.text(f"SELECT COUNT(*) FROM {table_name}")
+        ).scalar_one()
+    op.execute(f"INSERT INTO change_sequence (id, value) VALUES (1, {offset})")
+
+
+def downgrade() -> None:
+    op.drop_table("change_sequence")
+    op.drop_table("change_log")
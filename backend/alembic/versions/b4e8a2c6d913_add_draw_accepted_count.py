@@ -0,0 +1,45 @@
+"""add accepted count to draws
+
+Revision ID: b4e8a2c6d913
+Revises: 7a3d5f1e9c62
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b4e8a2c6d913"
+down_revision = "7a3d5f1e9c62"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("draw_applications") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "accepted_count",
+                sa.Integer(),
+                nullable=False,
+                server_default=sa.text("0"),
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE draw_applications
+        SET accepted_count = (
+            SELECT COUNT(*) FROM draw_results
+            WHERE draw_results.draw_id = draw_applications.id
+              AND draw_results.is_backup = false
+              AND draw_results.contact_status = 'accepted'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("draw_applications") as batch_op:
+        batch_op.drop_column("accepted_count")
@@ -0,0 +1,26 @@
+"""add excluded ids to draw candidate snapshots
+
+Revision ID: b9d3f5a7c214
+Revises: a8e2d4c6f913
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b9d3f5a7c214"
+down_revision = "a8e2d4c6f913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("draw_candidate_snapshots") as batch_op:
+        batch_op.add_column(sa.Column("excluded_ids", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("draw_candidate_snapshots") as batch_op:
+        batch_op.drop_column("excluded_ids")
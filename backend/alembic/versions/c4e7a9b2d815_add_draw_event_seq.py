@@ -0,0 +1,36 @@
+"""order draw events by a commit sequence
+
+Revision ID: c4e7a9b2d815
+Revises: b9d3f5a7c214
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c4e7a9b2d815"
+down_revision = "b9d3f5a7c214"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("draw_events") as batch_op:
+        batch_op.add_column(sa.Column("seq", sa.Integer(), nullable=True))
+    op.execute("UPDATE draw_events SET seq = id")
+    with op.batch_alter_table("draw_events") as batch_op:
+        batch_op.alter_column("seq", existing_type=sa.Integer(), nullable=False)
+        batch_op.create_index("ix_draw_events_seq", ["seq"], unique=True)
+    op.execute(
+        "INSERT INTO change_sequence (id, value) "
+        "SELECT 2, COALESCE(MAX(id), 0) FROM draw_events"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM change_sequence WHERE id = 2")
+    with op.batch_alter_table("draw_events") as batch_op:
+        batch_op.drop_index("ix_draw_events_seq")
+        batch_op.drop_column("seq")
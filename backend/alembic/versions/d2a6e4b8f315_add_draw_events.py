@@ -0,0 +1,43 @@
+"""add draw events outbox
+
+Revision ID: d2a6e4b8f315
+Revises: c7f1d3a5e208
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d2a6e4b8f315"
+down_revision = "c7f1d3a5e208"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "draw_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("draw_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=40), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_draw_events_draw_id", "draw_events", ["draw_id"], unique=False)
+    op.create_index(
+        "ix_draw_events_created_at", "draw_events", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_draw_events_created_at", table_name="draw_events")
+    op.drop_index("ix_draw_events_draw_id", table_name="draw_events")
+    op.drop_table("draw_events")
@@ -0,0 +1,85 @@
+"""add rule link tables
+
+Revision ID: f3c8a1d6b247
+Revises: e5b9c3f7a142
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f3c8a1d6b247"
+down_revision = "e5b9c3f7a142"
+branch_labels = None
+depends_on = None
+
+LINKS = (
+    ("rule_specialties", "specialty_id", "specialties", "specialty_ids"),
+    ("rule_titles", "title_id", "titles", "title_required_ids"),
+    ("rule_regions", "region_id", "regions", "region_required_ids"),
+)
+
+
+def _normalize_ids(values) -> list[int]:
+    unique: list[int] = []
+    for item in values or []:
+        try:
+            value = int(item)
+        except (TypeError, ValueError):
+            continue
+        if value not in unique:
+            unique.append(value)
+    return unique
+
+
+def upgrade() -> None:
+    for table_name, column, target, _attribute in LINKS:
+        op.create_table(
+            table_name,
+            sa.Column("rule_id", sa.Integer(), nullable=False),
+            sa.Column(column, sa.Integer(), nullable=False),
+            sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+            sa.ForeignKeyConstraint(["rule_id"], ["rules.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint([column], [f"{target}.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("rule_id", column),
+        )
+        op.create_index(
+            f"ix_{table_name}_{column}", table_name, [column], unique=False
+        )
+
+    bind = op.get_bind()
+    rules = sa.table(
+        "rules",
+        sa.column("id", sa.Integer),
+        sa.column("specialty_ids", sa.JSON),
+        sa.column("title_required_ids", sa.JSON),
+        sa.column("region_required_ids", sa.JSON),
+    )
+    rows = bind.execute(sa.select(rules)).mappings().all()
+    for table_name, column, target, attribute in LINKS:
+        existing = set(bind.execute(sa.text(f"SELECT id FROM {target}")).scalars())
+        links = []
+        for row in rows:
+            ids = [item for item in _normalize_ids(row[attribute]) if item in existing]
+            links.extend(
+                {"rule_id": row["id"], column: value, "position": position}
+                for position, value in enumerate(ids)
+            )
+        if links:
+            op.bulk_insert(
+                sa.table(
+                    table_name,
+                    sa.column("rule_id", sa.Integer),
+                    sa.column(column, sa.Integer),
+                    sa.column("position", sa.Integer),
+                ),
+                links,
+            )
+
+
+def downgrade() -> None:
+    for table_name, column, _target, _attribute in reversed(LINKS):
+        op.drop_index(f"ix_{table_name}_{column}", table_name=table_name)
+        op.drop_table(table_name)
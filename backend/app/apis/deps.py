@@ -1,6 +1,6 @@
 from typing import Any, Generator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
@@ -32,6 +32,9 @@ oauth2_scheme = OAuth2PasswordBearer(
         "role:write": "管理角色与权限",
     },
 )
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl="/api/v1/auth/login", auto_error=False
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -75,21 +78,61 @@ def get_current_user(
     return user
 
 
+def _check_scopes(payload: dict[str, Any], required_scopes: list[str]) -> None:
+    token_scopes = payload.get("scopes", [])
+    if "*" in token_scopes:
+        return
+    missing = [scope for scope in required_scopes if scope not in token_scopes]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+
+def get_token_payload(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> dict[str, Any]:
+    """Token claims, for endpoints whose required scopes depend on the request."""
+    _user, payload = _get_user_and_payload(token, db)
+    return payload
+
+
 def require_scopes(required_scopes: list[str]):
     def dependency(
         token: str = Depends(oauth2_scheme),
         db: Session = Depends(get_db),
     ) -> None:
         _user, payload = _get_user_and_payload(token, db)
-        token_scopes = payload.get("scopes", [])
-        if "*" in token_scopes:
-            return None
-        missing = [scope for scope in required_scopes if scope not in token_scopes]
-        if missing:
+        _check_scopes(payload, required_scopes)
+        return None
+
+    return dependency
+
+
+def require_stream_user(required_scopes: list[str]):
+    """Authenticate long-lived streams without holding a DB session open.
+
+    EventSource cannot send headers, so the token may also come from the
+    ``access_token`` query parameter.
+    """
+
+    def dependency(
+        token: str | None = Depends(optional_oauth2_scheme),
+        access_token: str | None = Query(default=None),
+    ) -> User:
+        raw_token = token or access_token
+        if not raw_token:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions",
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
             )
-        return None
+        with SessionLocal() as db:
+            user, payload = _get_user_and_payload(raw_token, db)
+            db.expunge(user)
+        _check_scopes(payload, required_scopes)
+        return user
 
     return dependency
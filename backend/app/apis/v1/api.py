@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from app.apis.v1.endpoints import (
     auth,
     categories,
+    changes,
     draws,
     experts,
     organizations,
@@ -30,3 +31,4 @@ api_router.include_router(rules.router, prefix="/rules", tags=["rules"])
 api_router.include_router(draws.router, prefix="/draws", tags=["draws"])
 api_router.include_router(titles.router, prefix="/titles", tags=["titles"])
 api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
@@ -5,7 +5,9 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
+from app.core.responses import OrjsonResponse
 from app.models.user import User
+from app.schemas.batch import BatchGet, BatchGetResult
 from app.schemas.category import (
     CategoryBatchAction,
     CategoryBatchResult,
@@ -43,7 +45,21 @@ def list_category_tree(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return category_service.list_category_tree(db)
+    return OrjsonResponse(category_service.list_category_tree(db))
+
+
+@router.post(
+    "/batch-get",
+    dependencies=[Depends(require_scopes(["category:read"]))],
+    response_model=BatchGetResult[CategoryOut],
+)
+def batch_get_categories(
+    payload: BatchGet,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    items, missing_ids = category_service.get_categories_by_ids(db, payload.ids)
+    return BatchGetResult(items=items, missing_ids=missing_ids)
 
 
 @router.post(
@@ -0,0 +1,27 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.apis.deps import _check_scopes, get_db, get_token_payload
+from app.core.query_budget import query_budget
+from app.core.responses import OrjsonResponse
+from app.schemas.change import MAX_CHANGE_LIMIT, ChangePage
+from app.services import changes as change_service
+
+router = APIRouter()
+
+
+@router.get("", response_model=ChangePage)
+@query_budget(max_queries=15)
+def list_changes(
+    since: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=MAX_CHANGE_LIMIT),
+    entities: str | None = Query(default=None),
+    payload: dict[str, Any] = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+):
+    """Upserts and deletes after ``since``; each entity needs its read scope."""
+    kinds = change_service.parse_entities(entities)
+    _check_scopes(payload, [change_service.STREAMS[kind].scope for kind in kinds])
+    return OrjsonResponse(change_service.list_changes(db, since, limit, kinds))
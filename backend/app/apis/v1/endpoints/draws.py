@@ -1,21 +1,32 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.apis.deps import get_current_user, get_db, require_scopes
+from app.apis.deps import get_current_user, get_db, require_scopes, require_stream_user
+from app.core.query_budget import query_budget
+from app.core.responses import OrjsonResponse
+from app.db.session import SessionLocal
 from app.models.user import User
 from app.schemas.draw import (
     DrawApply,
     DrawBatchDelete,
+    DrawCandidateSnapshotOut,
     DrawOut,
+    DrawPoolPreviewOut,
+    DrawPreview,
     DrawReplace,
     DrawResultContactOut,
     DrawResultContactUpdate,
+    DrawResultDelta,
     DrawResultOut,
+    DrawTopUp,
     DrawUpdate,
 )
-from app.schemas.pagination import Page, PageParams
+from app.schemas.pagination import FieldsPageParams, Page
+from app.services import draw_events
 from app.services import draws as draw_service
+from app.services import projection
 
 router = APIRouter()
 
@@ -25,12 +36,20 @@ router = APIRouter()
     dependencies=[Depends(require_scopes(["draw:read"]))],
     response_model=Page[DrawOut],
 )
+@query_budget(max_queries=10)
 def list_draws(
-    params: PageParams = Depends(),
+    params: FieldsPageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    items, total = draw_service.list_draws(db, params)
+    fields = projection.parse_fields(params.fields, DrawOut)
+    items, total = draw_service.list_draws(db, params, fields)
+    if fields is not None:
+        return OrjsonResponse(
+            projection.project_page(
+                DrawOut, items, total, params.page, params.page_size, fields
+            )
+        )
     return Page(items=items, total=total, page=params.page, page_size=params.page_size)
 
 
@@ -48,11 +67,32 @@ def apply_draw(
     return draw_service.create_draw(db, payload, current_user.id)
 
 
+@router.post(
+    "/preview",
+    dependencies=[Depends(require_scopes(["draw:apply"]))],
+    response_model=DrawPoolPreviewOut,
+)
+def preview_draw(
+    payload: DrawPreview,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return draw_service.preview_candidate_pool(
+        db,
+        payload.rule_id,
+        payload.avoid_units,
+        payload.avoid_persons,
+        payload.expert_count,
+        payload.backup_count,
+    )
+
+
 @router.get(
     "/{draw_id}",
     dependencies=[Depends(require_scopes(["draw:read"]))],
     response_model=DrawOut,
 )
+@query_budget(max_queries=10)
 def get_draw(
     draw_id: int,
     db: Session = Depends(get_db),
@@ -108,10 +148,13 @@ def batch_delete_draws(
 )
 def execute_draw(
     draw_id: int,
+    idempotency_key: str | None = Header(
+        default=None, alias="Idempotency-Key", max_length=255
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return draw_service.execute_draw(db, draw_id)
+    return draw_service.execute_draw(db, draw_id, idempotency_key)
 
 
 @router.get(
@@ -119,20 +162,63 @@ def execute_draw(
     dependencies=[Depends(require_scopes(["draw:read"]))],
     response_model=Page[DrawResultOut],
 )
+@query_budget(max_queries=14)
 def list_draw_results(
     draw_id: int,
-    params: PageParams = Depends(),
+    params: FieldsPageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    items, total = draw_service.list_results_page(db, draw_id, params)
+    fields = projection.parse_fields(params.fields, DrawResultOut)
+    items, total = draw_service.list_results_page(db, draw_id, params, fields)
+    if fields is not None:
+        return OrjsonResponse(
+            projection.project_page(
+                DrawResultOut, items, total, params.page, params.page_size, fields
+            )
+        )
     return Page(items=items, total=total, page=params.page, page_size=params.page_size)
 
 
+def _read_draw_status(draw_id: int) -> dict:
+    with SessionLocal() as db:
+        return draw_service.get_draw_status(db, draw_id)
+
+
+@router.get("/{draw_id}/events")
+async def stream_draw_events(
+    draw_id: int,
+    request: Request,
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+    current_user: User = Depends(require_stream_user(["draw:read"])),
+):
+    # No request-scoped session here: the stream can stay open for hours.
+    initial = await run_in_threadpool(_read_draw_status, draw_id)
+    return StreamingResponse(
+        draw_events.stream(draw_id, initial, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/{draw_id}/candidate-snapshot",
+    dependencies=[Depends(require_scopes(["draw:read"]))],
+    response_model=DrawCandidateSnapshotOut,
+)
+def get_draw_candidate_snapshot(
+    draw_id: int,
+    include_ids: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return draw_service.get_candidate_snapshot(db, draw_id, include_ids)
+
+
 @router.post(
     "/{draw_id}/replace",
     dependencies=[Depends(require_scopes(["draw:execute"]))],
-    response_model=list[DrawResultOut],
+    response_model=DrawResultDelta,
 )
 def replace_draw_result(
     draw_id: int,
@@ -143,6 +229,20 @@ def replace_draw_result(
     return draw_service.replace_draw_result(db, draw_id, payload.result_id)
 
 
+@router.post(
+    "/{draw_id}/top-up",
+    dependencies=[Depends(require_scopes(["draw:execute"]))],
+    response_model=DrawResultDelta,
+)
+def top_up_draw_backups(
+    draw_id: int,
+    payload: DrawTopUp,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return draw_service.top_up_draw_backups(db, draw_id, payload.count)
+
+
 @router.get(
     "/{draw_id}/results/{result_id}/contact",
     dependencies=[Depends(require_scopes(["draw:execute"]))],
@@ -160,7 +260,7 @@ def get_draw_result_contact(
 @router.put(
     "/{draw_id}/results/{result_id}/contact",
     dependencies=[Depends(require_scopes(["draw:execute"]))],
-    response_model=list[DrawResultOut],
+    response_model=DrawResultDelta,
 )
 def update_draw_result_contact(
     draw_id: int,
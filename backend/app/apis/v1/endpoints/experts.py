@@ -5,9 +5,13 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
+from app.core.query_budget import query_budget
+from app.core.responses import OrjsonResponse
 from app.models.user import User
+from app.schemas.batch import BatchGet, BatchGetResult, BatchUpdateResult
 from app.schemas.expert import (
     ExpertBatchDelete,
+    ExpertBatchUpdate,
     ExpertCreate,
     ExpertOut,
     ExpertQuery,
@@ -15,6 +19,7 @@ from app.schemas.expert import (
 )
 from app.schemas.pagination import Page
 from app.services import experts as expert_service
+from app.services import projection
 
 router = APIRouter()
 
@@ -24,12 +29,20 @@ router = APIRouter()
     dependencies=[Depends(require_scopes(["expert:read"]))],
     response_model=Page[ExpertOut],
 )
+@query_budget(max_queries=12)
 def list_experts(
     params: ExpertQuery = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    items, total = expert_service.list_experts(db, params)
+    fields = projection.parse_fields(params.fields, ExpertOut)
+    items, total = expert_service.list_experts(db, params, fields)
+    if fields is not None:
+        return OrjsonResponse(
+            projection.project_page(
+                ExpertOut, items, total, params.page, params.page_size, fields
+            )
+        )
     return Page(items=items, total=total, page=params.page, page_size=params.page_size)
 
 
@@ -38,6 +51,7 @@ def list_experts(
     dependencies=[Depends(require_scopes(["expert:read"]))],
     response_model=list[ExpertOut],
 )
+@query_budget(max_queries=10)
 def list_experts_all(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -45,6 +59,21 @@ def list_experts_all(
     return expert_service.list_experts_all(db)
 
 
+@router.post(
+    "/batch-get",
+    dependencies=[Depends(require_scopes(["expert:read"]))],
+    response_model=BatchGetResult[ExpertOut],
+)
+@query_budget(max_queries=12)
+def batch_get_experts(
+    payload: BatchGet,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    items, missing_ids = expert_service.get_experts_by_ids(db, payload.ids)
+    return BatchGetResult(items=items, missing_ids=missing_ids)
+
+
 @router.post(
     "",
     dependencies=[Depends(require_scopes(["expert:write"]))],
@@ -94,6 +123,7 @@ def export_experts(
     dependencies=[Depends(require_scopes(["expert:read"]))],
     response_model=ExpertOut,
 )
+@query_budget(max_queries=10)
 def get_expert(
     expert_id: int,
     db: Session = Depends(get_db),
@@ -130,6 +160,20 @@ def delete_expert(
     return None
 
 
+@router.post(
+    "/batch-update",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=BatchUpdateResult,
+)
+@query_budget(max_queries=30)
+def batch_update_experts(
+    payload: ExpertBatchUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return expert_service.update_experts(db, payload.ids, payload.patch)
+
+
 @router.post(
     "/batch-delete",
     dependencies=[Depends(require_scopes(["expert:write"]))],
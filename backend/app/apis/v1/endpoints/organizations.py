@@ -2,7 +2,9 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
+from app.core.query_budget import query_budget
 from app.models.user import User
+from app.schemas.batch import BatchDeleteResult, BatchGet, BatchGetResult
 from app.schemas.organization import (
     OrganizationBatchDelete,
     OrganizationCreate,
@@ -20,6 +22,7 @@ router = APIRouter()
     dependencies=[Depends(require_scopes(["organization:read"]))],
     response_model=Page[OrganizationOut],
 )
+@query_budget(max_queries=12)
 def list_organizations(
     params: PageParams = Depends(),
     db: Session = Depends(get_db),
@@ -34,6 +37,7 @@ def list_organizations(
     dependencies=[Depends(require_scopes(["organization:read"]))],
     response_model=list[OrganizationOut],
 )
+@query_budget(max_queries=12)
 def list_organizations_all(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -41,6 +45,21 @@ def list_organizations_all(
     return organization_service.list_organizations_all(db)
 
 
+@router.post(
+    "/batch-get",
+    dependencies=[Depends(require_scopes(["organization:read"]))],
+    response_model=BatchGetResult[OrganizationOut],
+)
+@query_budget(max_queries=12)
+def batch_get_organizations(
+    payload: BatchGet,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    items, missing_ids = organization_service.get_organizations_by_ids(db, payload.ids)
+    return BatchGetResult(items=items, missing_ids=missing_ids)
+
+
 @router.post(
     "",
     dependencies=[Depends(require_scopes(["organization:write"]))],
@@ -99,6 +118,7 @@ def delete_organization(
 @router.post(
     "/batch-delete",
     dependencies=[Depends(require_scopes(["organization:write"]))],
+    response_model=BatchDeleteResult,
 )
 def batch_delete_organizations(
     payload: OrganizationBatchDelete,
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
 from app.models.user import User
+from app.schemas.batch import BatchDeleteResult, BatchGet, BatchGetResult
 from app.schemas.pagination import Page, PageParams
 from app.schemas.region import (
     RegionBatchDelete,
@@ -41,6 +42,20 @@ def list_regions_all(
     return region_service.list_regions_all(db)
 
 
+@router.post(
+    "/batch-get",
+    dependencies=[Depends(require_scopes(["region:read"]))],
+    response_model=BatchGetResult[RegionOut],
+)
+def batch_get_regions(
+    payload: BatchGet,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    items, missing_ids = region_service.get_regions_by_ids(db, payload.ids)
+    return BatchGetResult(items=items, missing_ids=missing_ids)
+
+
 @router.post(
     "",
     dependencies=[Depends(require_scopes(["region:write"]))],
@@ -99,6 +114,7 @@ def delete_region(
 @router.post(
     "/batch-delete",
     dependencies=[Depends(require_scopes(["region:write"]))],
+    response_model=BatchDeleteResult,
 )
 def batch_delete_regions(
     payload: RegionBatchDelete,
@@ -3,8 +3,10 @@ from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
 from app.models.user import User
+from app.schemas.draw import DrawPoolPreviewOut
 from app.schemas.pagination import Page, PageParams
 from app.schemas.rule import RuleCreate, RuleOut, RuleUpdate
+from app.services import draws as draw_service
 from app.services import rules as rule_service
 
 router = APIRouter()
@@ -63,6 +65,19 @@ def get_rule(
     return rule_service.get_rule(db, rule_id)
 
 
+@router.get(
+    "/{rule_id}/pool-size",
+    dependencies=[Depends(require_scopes(["rule:read"]))],
+    response_model=DrawPoolPreviewOut,
+)
+def get_rule_pool_size(
+    rule_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return draw_service.preview_candidate_pool(db, rule_id)
+
+
 @router.put(
     "/{rule_id}",
     dependencies=[Depends(require_scopes(["rule:write"]))],
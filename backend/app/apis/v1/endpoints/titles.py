@@ -2,10 +2,13 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from app.apis.deps import get_current_user, get_db, require_scopes
+from app.core.responses import OrjsonResponse
 from app.models.user import User
+from app.schemas.batch import BatchDeleteResult, BatchGet, BatchGetResult
 from app.schemas.pagination import Page, PageParams
 from app.schemas.title import (
     TitleBatchAction,
+    TitleBatchDelete,
     TitleBatchResult,
     TitleCreate,
     TitleOut,
@@ -40,7 +43,7 @@ def list_title_tree(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return title_service.list_title_tree(db)
+    return OrjsonResponse(title_service.list_title_tree(db))
 
 
 @router.get(
@@ -55,6 +58,20 @@ def list_titles_all(
     return title_service.list_titles_all(db)
 
 
+@router.post(
+    "/batch-get",
+    dependencies=[Depends(require_scopes(["title:read"]))],
+    response_model=BatchGetResult[TitleOut],
+)
+def batch_get_titles(
+    payload: BatchGet,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    items, missing_ids = title_service.get_titles_by_ids(db, payload.ids)
+    return BatchGetResult(items=items, missing_ids=missing_ids)
+
+
 @router.post(
     "",
     dependencies=[Depends(require_scopes(["title:write"]))],
@@ -110,6 +127,19 @@ def delete_title(
     return None
 
 
+@router.post(
+    "/batch-delete",
+    dependencies=[Depends(require_scopes(["title:write"]))],
+    response_model=BatchDeleteResult,
+)
+def batch_delete_titles(
+    payload: TitleBatchDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return title_service.delete_titles(db, payload.ids)
+
+
 @router.post(
     "/batch",
     dependencies=[Depends(require_scopes(["title:write"]))],
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import shutil
-from pathlib import Path
-from uuid import uuid4
+import re
 
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from starlette.datastructures import UploadFile
 
 from app.apis.deps import require_scopes
 from app.core.config import settings
-from app.schemas.upload import UploadResponse
+from app.schemas.upload import UploadResponse, UploadSessionCreate, UploadSessionOut
+from app.services import derivatives
+from app.services import uploads as upload_service
 
 router = APIRouter()
 
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".pdf"}
+READ_CHUNK_SIZE = 256 * 1024
+# Room for multipart boundaries and headers around the file part.
+MULTIPART_OVERHEAD = 64 * 1024
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
 
 
 def _normalize_prefix(prefix: str) -> str:
@@ -32,39 +36,130 @@ def _build_file_url(relative_path: str, base_url: str | None) -> str:
     return url_path
 
 
+def _to_response(
+    request: Request, stored: upload_service.StoredFile
+) -> UploadResponse:
+    # Derivatives are built off the request path; a miss is filled on demand.
+    derivatives.schedule(stored.path)
+    base_url = str(request.base_url).rstrip("/") if request else None
+    return UploadResponse(
+        url=_build_file_url(stored.path, base_url),
+        path=stored.path,
+        filename=stored.filename,
+        sha256=stored.sha256,
+        size=stored.size,
+        deduplicated=stored.deduplicated,
+    )
+
+
+def _content_length(request: Request) -> int | None:
+    value = request.headers.get("content-length")
+    return int(value) if value and value.isdigit() else None
+
+
+async def _read_upload(file: UploadFile):
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        yield chunk
+
+
 @router.post(
     "/expert-credential",
     dependencies=[Depends(require_scopes(["expert:write"]))],
     response_model=UploadResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def upload_expert_credential(
+async def upload_expert_credential(request: Request):
+    # Reject oversized bodies before the multipart parser spools them.
+    length = _content_length(request)
+    if length is not None:
+        upload_service.check_declared_size(length - MULTIPART_OVERHEAD)
+    async with request.form(max_files=1, max_fields=1) as form:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Missing file",
+            )
+        suffix = upload_service.validate_suffix(file.filename)
+        stored = await upload_service.store_stream(_read_upload(file), suffix)
+    return _to_response(request, stored)
+
+
+@router.put(
+    "/expert-credential",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=UploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def stream_expert_credential(
     request: Request,
-    file: UploadFile = File(...),
+    filename: str = Query(min_length=1, max_length=255),
 ):
-    if not file.filename:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Missing filename"
-        )
-    suffix = Path(file.filename).suffix.lower()
-    if suffix not in ALLOWED_EXTENSIONS:
+    """Upload the raw request body, streamed straight to disk."""
+    suffix = upload_service.validate_suffix(filename)
+    upload_service.check_declared_size(_content_length(request))
+    stored = await upload_service.store_stream(request.stream(), suffix)
+    return _to_response(request, stored)
+
+
+@router.post(
+    "/sessions",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=UploadSessionOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_upload_session(payload: UploadSessionCreate):
+    return upload_service.create_session(payload.filename, payload.size)
+
+
+@router.get(
+    "/sessions/{upload_id}",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=UploadSessionOut,
+)
+def get_upload_session(upload_id: str):
+    return upload_service.get_session(upload_id)
+
+
+@router.put(
+    "/sessions/{upload_id}",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=UploadSessionOut,
+)
+async def upload_session_chunk(
+    upload_id: str,
+    request: Request,
+    content_range: str = Header(alias="Content-Range"),
+):
+    match = CONTENT_RANGE.fullmatch(content_range.strip())
+    if match is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type"
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Content-Range"
         )
+    start, end, total = match.groups()
+    return await upload_service.append_chunk(
+        upload_id,
+        int(start),
+        int(end),
+        None if total == "*" else int(total),
+        request.stream(),
+    )
 
-    base_dir = Path(settings.upload_dir).resolve()
-    target_dir = base_dir / "experts"
-    target_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{uuid4().hex}{suffix}"
-    target_path = target_dir / filename
 
-    with target_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+@router.post(
+    "/sessions/{upload_id}/complete",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    response_model=UploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def complete_upload_session(upload_id: str, request: Request):
+    return _to_response(request, upload_service.complete_session(upload_id))
 
-    relative_path = f"experts/{filename}"
-    base_url = str(request.base_url).rstrip("/") if request else None
-    return UploadResponse(
-        url=_build_file_url(relative_path, base_url),
-        path=relative_path,
-        filename=filename,
-    )
+
+@router.delete(
+    "/sessions/{upload_id}",
+    dependencies=[Depends(require_scopes(["expert:write"]))],
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def cancel_upload_session(upload_id: str):
+    upload_service.cancel_session(upload_id)
@@ -11,6 +11,34 @@ class Settings(BaseSettings):
     upload_dir: str = "./uploads"
     upload_url_prefix: str = "/uploads"
     upload_base_url: str | None = None
+    upload_staging_dir: str = "./uploads-staging"
+    upload_max_mb: int = 20
+    upload_chunk_mb: int = 4
+    upload_session_ttl_hours: int = 24
+    static_cache_seconds: int = 3600
+    derivative_workers: int = 2
+    derivative_timeout_seconds: float = 20
+    compression_enabled: bool = True
+    compression_min_bytes: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    metrics_enabled: bool = False
+    query_budget_mode: str = "off"
+    query_repeat_threshold: int = 10
+    slow_query_ms: float | None = None
+    eligibility_cache_ttl_seconds: int = 60
+    dimension_cache_check_seconds: float = 5
+    event_broker: str = "database"
+    event_poll_interval_ms: int = 500
+    event_queue_size: int = 100
+    scheduler_enabled: bool = False
+    scheduler_lead_minutes: int = 60
+    scheduler_spread_minutes: int = 30
+    scheduler_poll_seconds: int = 15
+    scheduler_lease_seconds: int = 60
+    scheduler_max_concurrency: int = 2
+    scheduler_max_attempts: int = 3
+    scheduler_job_timeout_seconds: int = 300
 
 
 settings = Settings()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections.abc import Iterable
+
+# Format: version byte, then zlib-compressed LEB128 varints holding the gaps
+# between consecutive sorted ids.
+FORMAT_VERSION = 1
+
+
+def pack_ids(ids: Iterable[int]) -> bytes:
+    buffer = bytearray()
+    previous = 0
+    for value in sorted(set(ids)):
+        if value < 0:
+            raise ValueError("ids must be non-negative")
+        gap = value - previous
+        previous = value
+        while gap >= 0x80:
+            buffer.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        buffer.append(gap)
+    return bytes([FORMAT_VERSION]) + zlib.compress(bytes(buffer))
+
+
+def unpack_ids(data: bytes) -> list[int]:
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError("Unsupported id pack format")
+    raw = zlib.decompress(data[1:])
+    ids: list[int] = []
+    current = 0
+    gap = 0
+    shift = 0
+    for byte in raw:
+        gap |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += gap
+        ids.append(current)
+        gap = 0
+        shift = 0
+    return ids
+
+
+def ids_checksum(ids: Iterable[int]) -> str:
+    """SHA-256 over the sorted ids, independent of the packed encoding."""
+    digest = hashlib.sha256()
+    for value in sorted(set(ids)):
+        digest.update(f"{value}\n".encode("ascii"))
+    return digest.hexdigest()
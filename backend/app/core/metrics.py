@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Mount, get_route_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    rows: int = 0
+    db_time: float = 0.0
+    # Populated only when a consumer (e.g. the query budget detector) opts in.
+    statements: Counter[str] | None = None
+    slow_threshold: float | None = None
+    slow_statements: list[tuple[str, float]] = field(default_factory=list)
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_stats() -> RequestStats | None:
+    return _current_stats.get()
+
+
+def bind_request_stats() -> tuple[RequestStats, Token | None]:
+    """Return the stats for the current request, creating them if needed."""
+    stats = _current_stats.get()
+    if stats is not None:
+        return stats, None
+    stats = RequestStats()
+    return stats, _current_stats.set(stats)
+
+
+def release_request_stats(token: Token | None) -> None:
+    if token is not None:
+        _current_stats.reset(token)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[tuple[tuple[str, str], ...], Histogram]] = {}
+        self._counters: dict[str, dict[tuple[tuple[str, str], ...], float]] = {}
+        self._help: dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: dict[str, str],
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name: str, labels: dict[str, str], amount: float = 1) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._render_header(lines, name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name, series in sorted(self._histograms.items()):
+                self._render_header(lines, name, "histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        labels = _format_labels(key + (("le", _format_value(bound)),))
+                        lines.append(f"{name}_bucket{labels} {cumulative}")
+                    labels = _format_labels(key + (("le", "+Inf"),))
+                    lines.append(f"{name}_bucket{labels} {histogram.count}")
+                    lines.append(
+                        f"{name}_sum{_format_labels(key)} {_format_value(histogram.total)}"
+                    )
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _render_header(self, lines: list[str], name: str, kind: str) -> None:
+        help_text = self._help.get(name)
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_labels(key: tuple[tuple[str, str], ...]) -> str:
+    if not key:
+        return ""
+    parts = []
+    for label, value in key:
+        escaped = (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        parts.append(f'{label}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+registry.describe("http_requests_total", "HTTP requests by route and status.")
+registry.describe("http_request_duration_seconds", "Wall time per request.")
+registry.describe("http_request_db_queries", "SQL statements executed per request.")
+registry.describe("http_request_db_duration_seconds", "SQL execution time per request.")
+registry.describe("http_request_db_rows_total", "Rows reported by the DB driver.")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats.queries += 1
+    stats.db_time += elapsed
+    if stats.statements is not None:
+        stats.statements[statement] += 1
+    if stats.slow_threshold is not None and elapsed >= stats.slow_threshold:
+        stats.slow_statements.append((statement, elapsed))
+    rowcount = getattr(cursor, "rowcount", -1)
+    if rowcount is not None and rowcount > 0:
+        stats.rows += rowcount
+
+
+def install_query_listeners(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_template(scope: Scope) -> str:
+    # Label by the matched route's own template, so repeated values keep their
+    # names. Depending on the FastAPI version that template may or may not
+    # carry the include_router prefix, so whatever precedes the route's own
+    # match in the path is taken as the prefix.
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    root_path = scope.get("root_path", "")
+    if isinstance(route, Mount):
+        # A matched mount has already moved its path into root_path.
+        return f"{root_path}/{{path}}"
+    path_format = getattr(route, "path_format", None)
+    path_regex = getattr(route, "path_regex", None)
+    if path_format is None or path_regex is None:
+        return scope.get("path", "")
+    path = get_route_path(scope)
+    start = 0
+    while True:
+        if path_regex.match(path[start:]):
+            return root_path + path[:start] + path_format
+        if start == len(path):
+            return root_path + path_format
+        start = path.find("/", start + 1)
+        if start == -1:
+            # Routes declared as "" match nothing past the prefix.
+            start = len(path)
+
+
+class MetricsMiddleware:
+    """Record per-route wall time and SQL usage, and emit Server-Timing."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = bind_request_stats()
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - started
+                timing = (
+                    f"app;dur={elapsed * 1000:.1f}, "
+                    f"db;dur={stats.db_time * 1000:.1f};desc=\"{stats.queries} queries\""
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            release_request_stats(token)
+            elapsed = time.perf_counter() - started
+            labels = {"method": scope["method"], "route": route_template(scope)}
+            registry.increment(
+                "http_requests_total", {**labels, "status": str(status_code)}
+            )
+            registry.observe("http_request_duration_seconds", elapsed, labels)
+            registry.observe(
+                "http_request_db_queries",
+                stats.queries,
+                labels,
+                buckets=QUERY_COUNT_BUCKETS,
+            )
+            registry.observe("http_request_db_duration_seconds", stats.db_time, labels)
+            if stats.rows:
+                registry.increment("http_request_db_rows_total", labels, stats.rows)
@@ -0,0 +1,34 @@
+"""Pytest plugin that fails tests whose requests break a query budget.
+
+Enable with ``pytest -p app.core.pytest_query_budget`` (the backend suite loads
+it from ``tests/conftest.py``). The plugin switches the
+detector into ``collect`` mode before ``app.main`` is imported, so requests made
+through ``TestClient`` are checked against their ``@query_budget`` declarations
+and the repeated-statement threshold. Mark a test with
+``@pytest.mark.allow_query_budget`` to opt out.
+"""
+
+import pytest
+
+from app.core import query_budget
+from app.core.config import settings
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    settings.query_budget_mode = "collect"
+    config.addinivalue_line(
+        "markers", "allow_query_budget: do not fail the test on query budget violations"
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    # Checked around the test body so a violation fails the test itself
+    # rather than erroring in teardown.
+    query_budget.drain_violations()
+    result = yield
+    violations = query_budget.drain_violations()
+    if violations and item.get_closest_marker("allow_query_budget") is None:
+        lines = "\n".join(f"  {violation}" for violation in violations)
+        pytest.fail(f"Query budget violations:\n{lines}", pytrace=False)
+    return result
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import bind_request_stats, release_request_stats, route_template
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+BUDGET_ATTR = "__query_budget__"
+MAX_RECORDED_VIOLATIONS = 1000
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|:\w+|\?|__\[POSTCOMPILE_\w+\]")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"VALUES\s*\(\?\)(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_queries: int | None = None
+    max_repeats: int | None = None
+
+
+@dataclass(frozen=True)
+class BudgetViolation:
+    method: str
+    route: str
+    kind: str
+    detail: str
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.route}: {self.kind} - {self.detail}"
+
+
+_violations: list[BudgetViolation] = []
+_violations_lock = threading.Lock()
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so that calls differing only by values match."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _VALUES_LIST.sub("VALUES (?)", normalized)
+
+
+def query_budget(
+    max_queries: int | None = None, max_repeats: int | None = None
+) -> Callable[[F], F]:
+    """Declare the SQL budget of an endpoint; place it below the route decorator."""
+
+    def decorator(func: F) -> F:
+        setattr(func, BUDGET_ATTR, QueryBudget(max_queries, max_repeats))
+        return func
+
+    return decorator
+
+
+def resolve_budget(scope: Scope, default_max_repeats: int | None) -> QueryBudget:
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    budget = getattr(endpoint, BUDGET_ATTR, None)
+    if budget is None:
+        return QueryBudget(max_repeats=default_max_repeats)
+    if budget.max_repeats is None:
+        return QueryBudget(budget.max_queries, default_max_repeats)
+    return budget
+
+
+def check_budget(
+    budget: QueryBudget, queries: int, statements: Counter[str]
+) -> list[tuple[str, str]]:
+    problems: list[tuple[str, str]] = []
+    if budget.max_queries is not None and queries > budget.max_queries:
+        problems.append(
+            ("query_budget", f"{queries} queries exceed budget of {budget.max_queries}")
+        )
+    if budget.max_repeats is None:
+        return problems
+    shapes: Counter[str] = Counter()
+    for statement, count in statements.items():
+        shapes[fingerprint(statement)] += count
+    for shape, count in shapes.most_common():
+        if count <= budget.max_repeats:
+            break
+        problems.append(("repeated_statement", f"{count}x {shape}"))
+    return problems
+
+
+def record_violation(violation: BudgetViolation) -> None:
+    with _violations_lock:
+        if len(_violations) < MAX_RECORDED_VIOLATIONS:
+            _violations.append(violation)
+
+
+def drain_violations() -> list[BudgetViolation]:
+    with _violations_lock:
+        items = list(_violations)
+        _violations.clear()
+    return items
+
+
+class QueryBudgetMiddleware:
+    """Flag requests that exceed their query budget or repeat a statement shape."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_repeats: int | None = 10,
+        slow_query_ms: float | None = None,
+        collect: bool = False,
+    ) -> None:
+        self.app = app
+        self.max_repeats = max_repeats
+        self.slow_threshold = slow_query_ms / 1000 if slow_query_ms else None
+        self.collect = collect
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = bind_request_stats()
+        stats.statements = Counter()
+        stats.slow_threshold = self.slow_threshold
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            release_request_stats(token)
+            self._report(scope, stats.queries, stats.statements, stats.slow_statements)
+
+    def _report(
+        self,
+        scope: Scope,
+        queries: int,
+        statements: Counter[str],
+        slow_statements: list[tuple[str, float]],
+    ) -> None:
+        method = scope["method"]
+        route = route_template(scope)
+        for statement, elapsed in slow_statements:
+            logger.warning(
+                "Slow query (%.1f ms) in %s %s: %s",
+                elapsed * 1000,
+                method,
+                route,
+                fingerprint(statement),
+            )
+        budget = resolve_budget(scope, self.max_repeats)
+        for kind, detail in check_budget(budget, queries, statements):
+            violation = BudgetViolation(method, route, kind, detail)
+            logger.warning("Query budget violation: %s", violation)
+            if self.collect:
+                record_violation(violation)
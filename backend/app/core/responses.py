@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON rendered by orjson.
+
+    For content that is already validated or built from trusted internal
+    dicts (e.g. the category/title trees): returning it directly from an
+    endpoint skips ``response_model`` validation, which is kept on the route
+    for the OpenAPI schema only.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import stat
+from pathlib import Path
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.services import derivatives
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# Preferred first; the files are produced by the frontend build.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE_SUFFIXES = {
+    ".css",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+}
+# Vite emits assets/<name>-<hash>.<ext>.
+HASHED_ASSET = re.compile(r".+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+# Content-addressed uploads and their derivatives: <sha256>[.<kind>].<ext>.
+HASHED_UPLOAD = re.compile(r"^([0-9a-f]{64})(\.[a-z]+)?\.[A-Za-z0-9]+$")
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    accepted: set[str] = set()
+    for item in (header or "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name)
+    return accepted
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control headers and precompressed variants.
+
+    When ``precompressed`` is set, a ``<file>.br``/``<file>.gz`` next to a text
+    file is served instead of the file itself if the client accepts it.
+    """
+
+    def __init__(self, *args, precompressed: bool = False, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.precompressed = precompressed
+
+    def cache_control(self, full_path: str) -> str:
+        return f"public, max-age={settings.static_cache_seconds}"
+
+    def response_headers(self, full_path: str) -> dict[str, str]:
+        headers = {"Cache-Control": self.cache_control(full_path)}
+        if self.precompressed and Path(full_path).suffix in COMPRESSIBLE_SUFFIXES:
+            headers["Vary"] = "Accept-Encoding"
+        return headers
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.precompressed and scope["method"] in ("GET", "HEAD"):
+            response = await self._precompressed_response(path, scope)
+            if response is not None:
+                return response
+        return await super().get_response(path, scope)
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Response | None:
+        if path in ("", "."):
+            path = "index.html"
+        if Path(path).suffix not in COMPRESSIBLE_SUFFIXES:
+            return None
+        request_headers = Headers(scope=scope)
+        # Byte ranges are only meaningful against the identity encoding.
+        if "range" in request_headers:
+            return None
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        for encoding, suffix in PRECOMPRESSED:
+            if encoding not in accepted:
+                continue
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, f"{path}{suffix}"
+                )
+            except (OSError, ValueError):
+                return None
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            headers = self.response_headers(os.path.join(os.path.dirname(full_path), path))
+            headers["Content-Encoding"] = encoding
+            headers["Vary"] = "Accept-Encoding"
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=mimetypes.guess_type(path)[0] or "text/plain",
+                headers=headers,
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers=self.response_headers(str(full_path)),
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class FrontendStaticFiles(CachedStaticFiles):
+    """Built frontend: hashed assets are immutable, everything else revalidates."""
+
+    def cache_control(self, full_path: str) -> str:
+        path = Path(full_path)
+        if path.name == "index.html":
+            return REVALIDATE
+        if path.parent.name == "assets" and HASHED_ASSET.match(path.name):
+            return IMMUTABLE
+        return super().cache_control(full_path)
+
+
+class UploadStaticFiles(CachedStaticFiles):
+    """Upload mount that builds missing thumbnails/previews on first request.
+
+    Content-addressed files never change, so they are cached as immutable and
+    carry their digest as a stable ETag across servers.
+    """
+
+    def cache_control(self, full_path: str) -> str:
+        if HASHED_UPLOAD.match(Path(full_path).name):
+            return IMMUTABLE
+        return super().cache_control(full_path)
+
+    def response_headers(self, full_path: str) -> dict[str, str]:
+        headers = super().response_headers(full_path)
+        match = HASHED_UPLOAD.match(Path(full_path).name)
+        if match:
+            kind = (match.group(2) or "").lstrip(".")
+            headers["ETag"] = f'"{match.group(1)}{"-" + kind if kind else ""}"'
+        return headers
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as exc:
+            if exc.status_code != 404:
+                raise
+            parsed = derivatives.parse_derivative(path)
+            if parsed is None:
+                raise
+        kind, stem_path = parsed
+        source = await asyncio.to_thread(derivatives.find_source, stem_path)
+        if source is None:
+            raise HTTPException(status_code=404)
+        try:
+            await asyncio.wait_for(
+                asyncio.wrap_future(derivatives.schedule(source)),
+                settings.derivative_timeout_seconds,
+            )
+        except Exception:
+            logger.warning("Serving original for %s %s", kind, source, exc_info=True)
+            if source.lower().endswith(".pdf"):
+                raise HTTPException(status_code=404) from None
+            response = await super().get_response(source, scope)
+            # Stand-in only: the derivative URL must not stay pinned to it.
+            response.headers["Cache-Control"] = REVALIDATE
+            response.headers.pop("ETag", None)
+            return response
+        return await super().get_response(path, scope)
+
+
+class SpaIndex:
+    """``index.html`` kept in memory, with its precompressed variants, for
+    serving client-side routes from the 404 handler."""
+
+    def __init__(self, path: Path) -> None:
+        self.content = path.read_bytes()
+        digest = hashlib.md5(self.content, usedforsecurity=False).hexdigest()
+        self.etag = f'"{digest}"'
+        self.variants: dict[str, bytes] = {}
+        for encoding, suffix in PRECOMPRESSED:
+            variant = path.with_name(f"{path.name}{suffix}")
+            if variant.is_file():
+                self.variants[encoding] = variant.read_bytes()
+
+    @classmethod
+    def load(cls, path: Path) -> SpaIndex | None:
+        try:
+            return cls(path)
+        except OSError:
+            return None
+
+    def response(self, request: Request) -> Response:
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        encoding = next(
+            (name for name, _ in PRECOMPRESSED if name in accepted and name in self.variants),
+            None,
+        )
+        etag = self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+        headers = {"Cache-Control": REVALIDATE, "ETag": etag, "Vary": "Accept-Encoding"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        body = self.content
+        if encoding is not None:
+            body = self.variants[encoding]
+            headers["Content-Encoding"] = encoding
+        return Response(body, media_type="text/html", headers=headers)
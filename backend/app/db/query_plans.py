@@ -0,0 +1,176 @@
+import sys
+from typing import Callable
+
+from sqlalchemy import Select, and_, create_engine, func, or_, select
+from sqlalchemy.engine import Engine
+
+from app.db.base import Base
+from app.models.draw import DrawResult
+from app.models.expert import Expert
+from app.models.expert_document import ExpertDocument
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+
+# Hot queries issued by the draw and expert services. Each entry mirrors the
+# statement shape used in the service so that EXPLAIN reflects production plans.
+HOT_QUERIES: dict[str, Callable[[], Select]] = {
+    "draws.list_results": lambda: (
+        select(DrawResult)
+        .where(DrawResult.draw_id == 1)
+        .order_by(DrawResult.is_backup, DrawResult.ordinal)
+    ),
+    "draws.replace_draw_result.backup": lambda: (
+        select(DrawResult)
+        .where(DrawResult.draw_id == 1, DrawResult.is_backup.is_(True))
+        .order_by(DrawResult.ordinal, DrawResult.id)
+    ),
+    "draws.execute_draw.candidates": lambda: (
+        select(Expert.id)
+        .where(Expert.is_active.is_(True))
+        .distinct()
+        .join(ExpertSpecialty, ExpertSpecialty.expert_id == Expert.id)
+        .join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
+        .where(Specialty.id.in_([1, 2, 3]))
+    ),
+    "experts.list_experts.region": lambda: select(Expert).where(
+        or_(
+            and_(Expert.is_active.is_(True), Expert.region_id == 1),
+            and_(
+                Expert.is_active.is_(True),
+                Expert.region_id.is_(None),
+                Expert.region == "region",
+            ),
+        ),
+    ),
+    "experts.list_experts.title": lambda: select(Expert).where(
+        Expert.is_active.is_(True), Expert.title_id.in_([1, 2])
+    ),
+    "experts.list_experts.specialty": lambda: (
+        select(Expert.id)
+        .join(ExpertSpecialty, ExpertSpecialty.expert_id == Expert.id)
+        .where(ExpertSpecialty.specialty_id.in_([1, 2]))
+    ),
+    "experts._attach_expert_details.specialties": lambda: (
+        select(ExpertSpecialty.expert_id, Specialty)
+        .join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
+        .where(ExpertSpecialty.expert_id.in_([1, 2]))
+        .order_by(Specialty.sort_order, Specialty.id)
+    ),
+    "experts._attach_expert_details.documents": lambda: (
+        select(ExpertDocument)
+        .where(
+            ExpertDocument.expert_id.in_([1, 2]),
+            ExpertDocument.doc_type == "appointment_letter",
+        )
+        .order_by(ExpertDocument.sort_order, ExpertDocument.id)
+    ),
+    "experts._ensure_id_card_unique": lambda: select(Expert.id).where(
+        Expert.id_card_no == "000000000000000000"
+    ),
+    "organizations._attach_expert_counts": lambda: (
+        select(Expert.organization_id, func.count())
+        .where(Expert.organization_id.in_([1, 2]))
+        .group_by(Expert.organization_id)
+    ),
+}
+
+
+def explain(engine: Engine, stmt: Select) -> list[str]:
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+    return [str(row[-1]) for row in rows]
+
+
+def find_full_scans(plan: list[str]) -> list[str]:
+    return [
+        line
+        for line in plan
+        if line.startswith("SCAN ") and not line.startswith("SCAN CONSTANT ROW")
+    ]
+
+
+# Index and leading key columns each hot query is expected to search by; a plan
+# that falls back to another index, or to fewer columns of the right one, is
+# reported just like a full scan. SQLite names the index behind a table's
+# unique constraint sqlite_autoindex_<table>_<n>.
+EXPECTED_INDEXES: dict[str, tuple[str, str]] = {
+    "draws.list_results": ("ix_draw_results_draw_backup_ordinal", "draw_id=?"),
+    "draws.replace_draw_result.backup": (
+        "ix_draw_results_draw_backup_ordinal",
+        "draw_id=? AND is_backup=?",
+    ),
+    "draws.execute_draw.candidates": (
+        "sqlite_autoindex_expert_specialties_1",
+        "expert_id=? AND specialty_id=?",
+    ),
+    "experts.list_experts.region": (
+        "ix_experts_active_region",
+        "is_active=? AND region_id=?",
+    ),
+    "experts.list_experts.title": (
+        "ix_experts_active_title",
+        "is_active=? AND title_id=?",
+    ),
+    "experts.list_experts.specialty": (
+        "ix_expert_specialties_specialty_expert",
+        "specialty_id=?",
+    ),
+    "experts._attach_expert_details.specialties": (
+        "sqlite_autoindex_expert_specialties_1",
+        "expert_id=?",
+    ),
+    "experts._attach_expert_details.documents": (
+        "ix_expert_documents_expert_type_order",
+        "expert_id=? AND doc_type=?",
+    ),
+    "experts._ensure_id_card_unique": ("ix_experts_id_card_no", "id_card_no=?"),
+    "organizations._attach_expert_counts": (
+        "ix_experts_organization_id",
+        "organization_id=?",
+    ),
+}
+
+
+def find_problems(name: str, plan: list[str]) -> list[str]:
+    problems = find_full_scans(plan)
+    expected = EXPECTED_INDEXES.get(name)
+    if expected is None:
+        problems.append("no expected index declared")
+        return problems
+    index, keys = expected
+    if not any(f"INDEX {index} ({keys}" in line for line in plan):
+        problems.append(f"expected index {index} ({keys}) not used")
+    return problems
+
+
+def check_hot_queries(engine: Engine) -> dict[str, list[str]]:
+    failures: dict[str, list[str]] = {}
+    for name, build in HOT_QUERIES.items():
+        problems = find_problems(name, explain(engine, build()))
+        if problems:
+            failures[name] = problems
+    return failures
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    verbose = "-v" in sys.argv[1:]
+    failed = False
+    for name, build in HOT_QUERIES.items():
+        plan = explain(engine, build())
+        problems = find_problems(name, plan)
+        print(f"{name}: {'FAIL' if problems else 'ok'}")
+        for problem in problems:
+            print(f"  ! {problem}")
+        if verbose or problems:
+            for line in plan:
+                print(f"    {line}")
+        failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
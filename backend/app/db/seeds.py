@@ -3,7 +3,7 @@ import os
 import random
 from pathlib import Path
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.codes import generate_code
@@ -21,6 +21,7 @@ from app.models.title import Title
 from app.models.user import User
 from app.repo.specialties import SpecialtyRepo
 from app.repo.titles import TitleRepo
+from app.services import changes
 from app.services import experts as expert_service
 
 SCOPE_DEFINITIONS = {
@@ -293,6 +294,10 @@ def seed_titles_from_json(db: Session) -> None:
 
     existing_title_ids = db.execute(select(Title.id)).scalars().all()
     if existing_title_ids:
+        changes.record_where(
+            db, Expert, or_(Expert.title_id.is_not(None), Expert.title.is_not(None))
+        )
+        changes.record_where(db, Rule)
         db.execute(
             Expert.__table__.update().values(title_id=None, title=None)
         )
@@ -302,6 +307,7 @@ def seed_titles_from_json(db: Session) -> None:
             )
         )
         db.execute(delete(Title))
+        changes.record_deletes(db, "titles", existing_title_ids)
         db.commit()
 
     payload = _load_json_payload(source)
@@ -357,6 +363,10 @@ def seed_regions_from_json(db: Session) -> None:
 
     existing_ids = db.execute(select(Region.id)).scalars().all()
     if existing_ids:
+        changes.record_where(
+            db, Expert, or_(Expert.region_id.is_not(None), Expert.region.is_not(None))
+        )
+        changes.record_where(db, Rule)
         db.execute(
             Expert.__table__.update().values(region_id=None, region=None)
         )
@@ -368,6 +378,7 @@ def seed_regions_from_json(db: Session) -> None:
             )
         )
         db.execute(delete(Region))
+        changes.record_deletes(db, "regions", existing_ids)
         db.commit()
 
     payload = _load_json_payload(source)
@@ -419,11 +430,17 @@ def seed_experts(db: Session) -> None:
     if source is not None:
         with source.open("rb") as file_obj:
             expert_service.import_experts(db, _SeedFile(file_obj))
-    _seed_random_experts(db)
+    if _get_seed_bulk():
+        _seed_random_experts_bulk(db)
+    else:
+        _seed_random_experts(db)
 
 
-def _seed_random_experts(db: Session) -> None:
-    target_total = _get_seed_expert_target()
+def _seed_random_experts(
+    db: Session, target_total: int | None = None, seed: int | None = None
+) -> None:
+    if target_total is None:
+        target_total = _get_seed_expert_target()
     if target_total <= 0:
         return
 
@@ -454,7 +471,7 @@ def _seed_random_experts(db: Session) -> None:
     used_id_cards = set(db.execute(select(Expert.id_card_no)).scalars().all())
     used_phones = set(db.execute(select(Expert.phone)).scalars().all())
     used_names = set(db.execute(select(Expert.name)).scalars().all())
-    rng = random.Random()
+    rng = random.Random(seed)
 
     start_index = current_total + 1
     for offset in range(missing):
@@ -483,8 +500,136 @@ def _seed_random_experts(db: Session) -> None:
             db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty_id))
 
 
+def _seed_random_experts_bulk(
+    db: Session,
+    target_total: int | None = None,
+    seed: int | None = None,
+    batch_size: int = 5000,
+) -> None:
+    if target_total is None:
+        target_total = _get_seed_expert_target()
+    if target_total <= 0:
+        return
+
+    current_total = db.execute(select(func.count()).select_from(Expert)).scalar_one()
+    missing = target_total - current_total
+    if missing <= 0:
+        return
+
+    regions = db.execute(select(Region)).scalars().all()
+    specialties = db.execute(select(Specialty)).scalars().all()
+    leaf_specialties = _filter_leaf_items(specialties)
+    if not leaf_specialties:
+        return
+    organizations = _ensure_seed_organizations(db, 40)
+    specialty_ids_all = [item.id for item in leaf_specialties]
+    procurement_ids = _select_procurement_specialties(leaf_specialties)
+    procurement_set = set(procurement_ids)
+    specialty_ids_other = [
+        item for item in specialty_ids_all if item not in procurement_set
+    ] or specialty_ids_all
+    leaf_titles = _filter_leaf_items(db.execute(select(Title)).scalars().all())
+    kunming_regions, other_regions = _split_kunming_regions(regions)
+    organization_values = [(item.id, item.name) for item in organizations] or [
+        (None, None)
+    ]
+    title_values = [(item.id, item.name) for item in leaf_titles]
+
+    rng = random.Random(seed)
+    next_id = (db.execute(select(func.max(Expert.id))).scalar_one() or 0) + 1
+    remaining = missing
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        ids = list(range(next_id, next_id + size))
+        id_cards = _bulk_id_cards(db, rng, size)
+        organizations_batch = rng.choices(organization_values, k=size)
+        regions_batch = _bulk_regions(rng, kunming_regions, other_regions, size)
+        titles_batch = [
+            rng.choice(title_values)
+            if title_values and rng.random() >= 0.3
+            else (None, None)
+            for _ in range(size)
+        ]
+        expert_rows = []
+        specialty_rows = []
+        for index, expert_id in enumerate(ids):
+            organization_id, organization_name = organizations_batch[index]
+            region_id, region_name = regions_batch[index]
+            title_id, title_name = titles_batch[index]
+            expert_rows.append(
+                {
+                    "id": expert_id,
+                    "name": _random_chinese_name(rng),
+                    "id_card_no": id_cards[index],
+                    "gender": _random_gender(rng),
+                    "phone": _bulk_phone(expert_id),
+                    "company": organization_name,
+                    "organization_id": organization_id,
+                    "region_id": region_id,
+                    "region": region_name,
+                    "title_id": title_id,
+                    "title": title_name,
+                    "is_active": _random_active(rng),
+                }
+            )
+            count = rng.randint(1, 5)
+            picks = [
+                rng.choice(procurement_ids)
+                if procurement_ids and rng.random() < 0.6
+                else rng.choice(specialty_ids_other)
+                for _ in range(count)
+            ]
+            for specialty_id in dict.fromkeys(picks):
+                specialty_rows.append(
+                    {"expert_id": expert_id, "specialty_id": specialty_id}
+                )
+        db.execute(insert(Expert), expert_rows)
+        changes.record(db, "experts", ids)
+        db.execute(insert(ExpertSpecialty), specialty_rows)
+        next_id += size
+        remaining -= size
+
+
+def _bulk_id_cards(db: Session, rng: random.Random, size: int) -> list[str]:
+    values = list(
+        dict.fromkeys(str(rng.randint(10**17, 10**18 - 1)) for _ in range(size))
+    )
+    while True:
+        taken = set(
+            db.execute(select(Expert.id_card_no).where(Expert.id_card_no.in_(values)))
+            .scalars()
+            .all()
+        )
+        values = [item for item in values if item not in taken]
+        if len(values) >= size:
+            return values[:size]
+        values.extend(
+            str(rng.randint(10**17, 10**18 - 1)) for _ in range(size - len(values))
+        )
+        values = list(dict.fromkeys(values))
+
+
+def _bulk_regions(
+    rng: random.Random,
+    kunming_regions: list[Region],
+    other_regions: list[Region],
+    size: int,
+) -> list[tuple[int | None, str | None]]:
+    result: list[tuple[int | None, str | None]] = []
+    for _ in range(size):
+        region = _pick_region(rng, kunming_regions, other_regions)
+        result.append((region.id, region.name) if region else (None, None))
+    return result
+
+
+def _bulk_phone(expert_id: int) -> str:
+    prefixes = ["13", "15", "17", "18", "19"]
+    # 7919 is coprime with 10**9, so distinct ids map to distinct numbers.
+    return f"{prefixes[expert_id % len(prefixes)]}{(expert_id * 7919) % 10**9:09d}"
+
+
 def _get_seed_expert_target() -> int:
-    raw = os.getenv("SEED_EXPERT_COUNT")
+    raw = os.getenv("SEED_EXPERT_TARGET") or os.getenv("SEED_EXPERT_COUNT")
     if raw:
         try:
             return int(raw)
@@ -493,6 +638,11 @@ def _get_seed_expert_target() -> int:
     return 3200
 
 
+def _get_seed_bulk() -> bool:
+    raw = os.getenv("SEED_EXPERT_BULK", "")
+    return raw.strip().lower() in {"1", "true", "yes", "y"}
+
+
 def _ensure_seed_organizations(db: Session, count: int) -> list[Organization]:
     existing = db.execute(select(Organization)).scalars().all()
     if existing:
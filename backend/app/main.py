@@ -1,22 +1,67 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
 from app.apis.v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-
-app = FastAPI(title="PickOne API")
+from app.core.metrics import MetricsMiddleware, install_query_listeners, registry
+from app.core.query_budget import QueryBudgetMiddleware
+from app.core.static_files import FrontendStaticFiles, SpaIndex, UploadStaticFiles
+from app.db.session import engine
+from app.services import derivatives
+from app.services.draw_scheduler import DrawScheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop = asyncio.Event()
+    task = None
+    if settings.scheduler_enabled:
+        task = asyncio.create_task(DrawScheduler().run(stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        if task is not None:
+            await task
+        derivatives.shutdown()
+
+
+app = FastAPI(title="PickOne API", lifespan=lifespan)
+
+if settings.metrics_enabled or settings.query_budget_mode != "off":
+    install_query_listeners(engine)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+if settings.query_budget_mode != "off":
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        max_repeats=settings.query_repeat_threshold,
+        slow_query_ms=settings.slow_query_ms,
+        collect=settings.query_budget_mode == "collect",
+    )
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_bytes,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
 
 app.include_router(api_router, prefix="/api/v1")
 
 logger = logging.getLogger(__name__)
 DIST_DIR = Path(__file__).resolve().parents[2] / "frontend" / "dist"
 INDEX_PATH = DIST_DIR / "index.html"
+# Read once: the dist directory is only picked up at startup anyway.
+SPA_INDEX = SpaIndex.load(INDEX_PATH)
 UPLOAD_DIR = Path(settings.upload_dir).resolve()
 UPLOAD_URL_PREFIX = settings.upload_url_prefix or "/uploads"
 if not UPLOAD_URL_PREFIX.startswith("/"):
@@ -39,19 +84,28 @@ def health():
     return {"status": "ok"}
 
 
+if settings.metrics_enabled:
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def metrics():
+        return PlainTextResponse(
+            registry.render(), media_type="text/plain; version=0.0.4"
+        )
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse | FileResponse:
+) -> Response:
     request_path = request.url.path
     if (
         exc.status_code == 404
-        and INDEX_PATH.exists()
+        and SPA_INDEX is not None
         and not request_path.startswith("/api")
         and not request_path.startswith("/assets")
         and not Path(request_path).suffix
     ):
-        return FileResponse(INDEX_PATH)
+        return SPA_INDEX.response(request)
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
@@ -60,7 +114,11 @@ async def http_exception_handler(
 
 def _mount_frontend(app: FastAPI) -> None:
     if DIST_DIR.exists():
-        app.mount("/", StaticFiles(directory=str(DIST_DIR), html=True), name="static")
+        app.mount(
+            "/",
+            FrontendStaticFiles(directory=str(DIST_DIR), html=True, precompressed=True),
+            name="static",
+        )
     else:
         logger.info("Frontend dist not found at %s", DIST_DIR)
 
@@ -72,7 +130,9 @@ def _mount_uploads(app: FastAPI) -> None:
         logger.exception("Failed to create upload dir at %s", UPLOAD_DIR)
         return
     app.mount(
-        UPLOAD_URL_PREFIX, StaticFiles(directory=str(UPLOAD_DIR)), name="uploads"
+        UPLOAD_URL_PREFIX,
+        UploadStaticFiles(directory=str(UPLOAD_DIR)),
+        name="uploads",
     )
 
 
@@ -1,6 +1,20 @@
-from app.models.associations import role_permissions, user_roles
+from app.models.associations import (
+    role_permissions,
+    rule_regions,
+    rule_specialties,
+    rule_titles,
+    user_roles,
+)
 from app.models.audit_log import AuditLog
-from app.models.draw import DrawApplication, DrawResult
+from app.models.change import ChangeLog, ChangeSequence
+from app.models.draw import (
+    DrawApplication,
+    DrawCandidateSnapshot,
+    DrawEvent,
+    DrawJob,
+    DrawResult,
+    SchedulerLease,
+)
 from app.models.expert import Expert
 from app.models.expert_document import ExpertDocument
 from app.models.expert_specialty import ExpertSpecialty
@@ -15,7 +29,12 @@ from app.models.user import User
 
 __all__ = [
     "AuditLog",
+    "ChangeLog",
+    "ChangeSequence",
     "DrawApplication",
+    "DrawCandidateSnapshot",
+    "DrawEvent",
+    "DrawJob",
     "DrawResult",
     "Expert",
     "ExpertDocument",
@@ -25,9 +44,13 @@ __all__ = [
     "Role",
     "Region",
     "Rule",
+    "SchedulerLease",
     "Specialty",
     "Title",
     "User",
     "role_permissions",
+    "rule_regions",
+    "rule_specialties",
+    "rule_titles",
     "user_roles",
 ]
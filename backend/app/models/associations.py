@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Integer, Table
 
 from app.db.base import Base
 
@@ -19,3 +19,43 @@ role_permissions = Table(
         primary_key=True,
     ),
 )
+
+# Rule criteria; position keeps the order of the ids as they were selected.
+rule_specialties = Table(
+    "rule_specialties",
+    Base.metadata,
+    Column("rule_id", ForeignKey("rules.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "specialty_id",
+        ForeignKey("specialties.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    Column("position", Integer, nullable=False, default=0),
+)
+
+rule_titles = Table(
+    "rule_titles",
+    Base.metadata,
+    Column("rule_id", ForeignKey("rules.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "title_id",
+        ForeignKey("titles.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    Column("position", Integer, nullable=False, default=0),
+)
+
+rule_regions = Table(
+    "rule_regions",
+    Base.metadata,
+    Column("rule_id", ForeignKey("rules.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "region_id",
+        ForeignKey("regions.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    Column("position", Integer, nullable=False, default=0),
+)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, Integer, String, UniqueConstraint, event, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# Rows of change_sequence.
+CHANGE_LOG_SEQUENCE = 1
+DRAW_EVENT_SEQUENCE = 2
+
+
+class ChangeLog(Base):
+    """Latest change of each feed row, numbered in commit order."""
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        UniqueConstraint("entity", "entity_id", name="uq_change_log_entity"),
+    )
+
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    entity: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    op: Mapped[str] = mapped_column(String(10), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class ChangeSequence(Base):
+    """Counters handed out in commit order; a row's lock orders its writers."""
+
+    __tablename__ = "change_sequence"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+event.listen(
+    ChangeSequence.__table__,
+    "after_create",
+    DDL("INSERT INTO change_sequence (id, value) VALUES (1, 0), (2, 0)"),
+)
@@ -1,6 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -22,6 +33,7 @@ class DrawApplication(Base, TimestampMixin):
     expert_count: Mapped[int] = mapped_column(Integer, nullable=False)
     total_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     backup_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    accepted_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     draw_method: Mapped[str] = mapped_column(
         String(50), default="random", nullable=False
     )
@@ -30,6 +42,8 @@ class DrawApplication(Base, TimestampMixin):
     avoid_units: Mapped[str | None] = mapped_column(String(255))
     avoid_persons: Mapped[str | None] = mapped_column(String(255))
     status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    execution_key: Mapped[str | None] = mapped_column(String(255))
+    executed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     rule_id: Mapped[int | None] = mapped_column(ForeignKey("rules.id"))
     created_by_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
@@ -39,11 +53,29 @@ class DrawApplication(Base, TimestampMixin):
     results = relationship(
         "DrawResult", back_populates="draw", cascade="all, delete-orphan"
     )
+    candidate_snapshot = relationship(
+        "DrawCandidateSnapshot",
+        back_populates="draw",
+        cascade="all, delete-orphan",
+        uselist=False,
+    )
+    job = relationship(
+        "DrawJob", back_populates="draw", cascade="all, delete-orphan", uselist=False
+    )
 
 
 class DrawResult(Base, TimestampMixin):
     __tablename__ = "draw_results"
-    __table_args__ = (UniqueConstraint("draw_id", "expert_id", name="uq_draw_expert"),)
+    __table_args__ = (
+        UniqueConstraint("draw_id", "expert_id", name="uq_draw_expert"),
+        Index("ix_draw_results_draw_backup_ordinal", "draw_id", "is_backup", "ordinal"),
+        Index(
+            "ix_draw_results_draw_backup_status",
+            "draw_id",
+            "is_backup",
+            "contact_status",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     draw_id: Mapped[int] = mapped_column(
@@ -63,3 +95,69 @@ class DrawResult(Base, TimestampMixin):
 
     draw = relationship("DrawApplication", back_populates="results")
     expert = relationship("Expert")
+
+
+class DrawCandidateSnapshot(Base, TimestampMixin):
+    __tablename__ = "draw_candidate_snapshots"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    draw_id: Mapped[int] = mapped_column(
+        ForeignKey("draw_applications.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    signature: Mapped[str] = mapped_column(String(64), nullable=False)
+    filters: Mapped[dict] = mapped_column(JSON, nullable=False)
+    expert_total: Mapped[int] = mapped_column(Integer, nullable=False)
+    expert_ids: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    checksum: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Experts replaced out of the draw; never drawn again for it.
+    excluded_ids: Mapped[bytes | None] = mapped_column(LargeBinary)
+
+    draw = relationship("DrawApplication", back_populates="candidate_snapshot")
+
+
+class DrawEvent(Base):
+    __tablename__ = "draw_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Commit-ordered position; also the SSE event id.
+    seq: Mapped[int] = mapped_column(Integer, unique=True, index=True, nullable=False)
+    draw_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(40), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True, nullable=False
+    )
+
+
+class DrawJob(Base, TimestampMixin):
+    """Scheduled automatic execution of a draw ahead of its review time."""
+
+    __tablename__ = "draw_jobs"
+    __table_args__ = (Index("ix_draw_jobs_status_run_at", "status", "run_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    draw_id: Mapped[int] = mapped_column(
+        ForeignKey("draw_applications.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="queued", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String(500))
+    locked_by: Mapped[str | None] = mapped_column(String(64))
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    draw = relationship("DrawApplication", back_populates="job")
+
+
+class SchedulerLease(Base):
+    """Leader lease row; only the current holder runs scheduled jobs."""
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    holder: Mapped[str | None] = mapped_column(String(64))
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -7,6 +7,11 @@ from app.models.mixins import TimestampMixin
 
 class Expert(Base, TimestampMixin):
     __tablename__ = "experts"
+    __table_args__ = (
+        Index("ix_experts_active_region", "is_active", "region_id"),
+        Index("ix_experts_active_title", "is_active", "title_id"),
+        Index("ix_experts_active_organization", "is_active", "organization_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(80), index=True, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -7,6 +7,14 @@ from app.models.mixins import TimestampMixin
 
 class ExpertDocument(Base, TimestampMixin):
     __tablename__ = "expert_documents"
+    __table_args__ = (
+        Index(
+            "ix_expert_documents_expert_type_order",
+            "expert_id",
+            "doc_type",
+            "sort_order",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     expert_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, UniqueConstraint
+from sqlalchemy import Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -9,6 +9,7 @@ class ExpertSpecialty(Base, TimestampMixin):
     __tablename__ = "expert_specialties"
     __table_args__ = (
         UniqueConstraint("expert_id", "specialty_id", name="uq_expert_specialty"),
+        Index("ix_expert_specialties_specialty_expert", "specialty_id", "expert_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
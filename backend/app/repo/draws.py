@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.draw import DrawApplication
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, load_fields, paginate
 
 
 class DrawRepo(BaseRepo):
@@ -19,6 +19,7 @@ class DrawRepo(BaseRepo):
         sort_order: str,
         page: int,
         page_size: int,
+        fields: set[str] | None = None,
     ) -> tuple[list[DrawApplication], int]:
         stmt = select(DrawApplication)
         stmt = apply_keyword(
@@ -54,6 +55,7 @@ class DrawRepo(BaseRepo):
         stmt = apply_sort(
             stmt, effective_sort, effective_order, sort_map, DrawApplication.id
         )
+        stmt = load_fields(stmt, DrawApplication, fields)
         return paginate(self.db, stmt, page, page_size)
 
     def get_by_id(self, draw_id: int) -> DrawApplication | None:
@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.expert import Expert
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, fetch_by_ids, paginate
 
 
 class ExpertRepo(BaseRepo):
@@ -49,3 +49,6 @@ class ExpertRepo(BaseRepo):
     def get_by_id(self, expert_id: int) -> Expert | None:
         stmt = select(Expert).where(Expert.id == expert_id)
         return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_by_ids(self, ids: list[int]) -> list[Expert]:
+        return fetch_by_ids(self.db, select(Expert), Expert.id, ids)
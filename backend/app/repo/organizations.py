@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.organization import Organization
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, fetch_by_ids, paginate
 
 
 class OrganizationRepo(BaseRepo):
@@ -39,6 +39,9 @@ class OrganizationRepo(BaseRepo):
         stmt = select(Organization).where(Organization.id == organization_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_by_ids(self, ids: list[int]) -> list[Organization]:
+        return fetch_by_ids(self.db, select(Organization), Organization.id, ids)
+
     def get_by_name(self, name: str) -> Organization | None:
         stmt = select(Organization).where(Organization.name == name)
         return self.db.execute(stmt).scalar_one_or_none()
@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.region import Region
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, fetch_by_ids, paginate
 
 
 class RegionRepo(BaseRepo):
@@ -37,6 +37,9 @@ class RegionRepo(BaseRepo):
         stmt = select(Region).where(Region.id == region_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_by_ids(self, ids: list[int]) -> list[Region]:
+        return fetch_by_ids(self.db, select(Region), Region.id, ids)
+
     def get_by_name(self, name: str) -> Region | None:
         stmt = select(Region).where(Region.name == name)
         return self.db.execute(stmt).scalar_one_or_none()
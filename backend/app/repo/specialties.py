@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.specialty import Specialty
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, fetch_by_ids, paginate
 
 
 class SpecialtyRepo(BaseRepo):
@@ -49,6 +49,9 @@ class SpecialtyRepo(BaseRepo):
         stmt = select(Specialty).where(Specialty.id == specialty_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_by_ids(self, ids: list[int]) -> list[Specialty]:
+        return fetch_by_ids(self.db, select(Specialty), Specialty.id, ids)
+
     def get_by_code(self, code: str) -> Specialty | None:
         stmt = select(Specialty).where(Specialty.code == code)
         return self.db.execute(stmt).scalar_one_or_none()
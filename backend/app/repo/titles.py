@@ -4,7 +4,7 @@ from sqlalchemy import select
 
 from app.models.title import Title
 from app.repo.base import BaseRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, fetch_by_ids, paginate
 
 
 class TitleRepo(BaseRepo):
@@ -40,6 +40,9 @@ class TitleRepo(BaseRepo):
         stmt = select(Title).where(Title.id == title_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_by_ids(self, ids: list[int]) -> list[Title]:
+        return fetch_by_ids(self.db, select(Title), Title.id, ids)
+
     def get_by_name(self, name: str) -> Title | None:
         stmt = select(Title).where(Title.name == name)
         return self.db.execute(stmt).scalars().first()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence, TypeVar
 
-from sqlalchemy import Select, func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, func, or_, select, update
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.sql import ColumnElement
 
+from app.models.change import ChangeSequence
+
+T = TypeVar("T")
+
+# Well under SQLite's historical 999 bound-parameter limit and small enough to
+# keep MySQL packets modest.
+IN_CHUNK_SIZE = 500
+
 
 def apply_keyword(
     stmt: Select, keyword: str | None, columns: Iterable[ColumnElement]
@@ -39,6 +47,50 @@ def apply_sort(
     return stmt.order_by(direction, default.asc())
 
 
+def load_fields(
+    stmt: Select,
+    entity: type,
+    fields: Iterable[str] | None,
+    extra: Iterable[ColumnElement] = (),
+) -> Select:
+    """Restrict the loaded columns of ``entity`` to ``fields`` (None loads all).
+
+    ``extra`` columns are always loaded, e.g. the sort column, which some
+    backends require in the select list of a DISTINCT query.
+    """
+    if fields is None:
+        return stmt
+    columns = entity.__table__.columns
+    attrs = [getattr(entity, name) for name in fields if name in columns]
+    attrs.extend(column for column in extra if column.key in columns)
+    return stmt.options(load_only(*attrs))
+
+
+def chunked(values: Sequence[T], size: int = IN_CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def fetch_by_ids(
+    db: Session, stmt: Select, column: ColumnElement, ids: Iterable[int]
+) -> list:
+    """Rows of ``stmt`` whose ``column`` is in ``ids``, in the order of ``ids``.
+
+    Duplicates are dropped and missing ids skipped; the IN list is chunked.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    found: dict = {}
+    for chunk in chunked(unique_ids):
+        for item in db.execute(stmt.where(column.in_(chunk))).scalars():
+            found[getattr(item, column.key)] = item
+    return [found[item_id] for item_id in unique_ids if item_id in found]
+
+
+def missing_ids(ids: Iterable[int], items: Iterable) -> list[int]:
+    found = {item.id for item in items}
+    return [item_id for item_id in dict.fromkeys(ids) if item_id not in found]
+
+
 def paginate(
     db: Session, stmt: Select, page: int, page_size: int
 ) -> tuple[list, int]:
@@ -50,3 +102,20 @@ def paginate(
         .all()
     )
     return list(items), total
+
+
+def reserve_sequence(db: Session, sequence_id: int, count: int = 1) -> int:
+    """Take ``count`` numbers from a change_sequence row; returns the last one.
+
+    The update locks the counter row until the transaction ends, so numbers
+    become visible in the order they were handed out.
+    """
+    db.execute(
+        update(ChangeSequence)
+        .where(ChangeSequence.id == sequence_id)
+        .values(value=ChangeSequence.value + count)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(
+        select(ChangeSequence.value).where(ChangeSequence.id == sequence_id)
+    ).scalar_one()
@@ -0,0 +1,38 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+MAX_BATCH_GET_IDS = 500
+
+
+class BatchGet(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class BatchGetResult(BaseModel, Generic[T]):
+    # Items follow the order of the requested ids; duplicates are collapsed.
+    items: list[T] = Field(default_factory=list)
+    missing_ids: list[int] = Field(default_factory=list)
+
+
+class BatchItemError(BaseModel):
+    id: int
+    detail: str
+
+
+class BatchDeleteResult(BaseModel):
+    deleted: int = 0
+    skipped: int = 0
+    # Ids actually removed (including cascaded descendants for trees).
+    deleted_ids: list[int] = Field(default_factory=list)
+    # One entry per skipped id, with the reason it was kept.
+    errors: list[BatchItemError] = Field(default_factory=list)
+
+
+class BatchUpdateResult(BaseModel):
+    updated: int = 0
+    skipped: int = 0
+    updated_ids: list[int] = Field(default_factory=list)
+    errors: list[BatchItemError] = Field(default_factory=list)
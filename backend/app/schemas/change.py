@@ -0,0 +1,20 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+MAX_CHANGE_LIMIT = 1000
+
+
+class ChangeOut(BaseModel):
+    entity: str
+    op: Literal["upsert", "delete"]
+    id: int
+    # Compact row for upserts (same masking as the list endpoints); None for deletes.
+    data: dict[str, Any] | None = None
+
+
+class ChangePage(BaseModel):
+    changes: list[ChangeOut] = Field(default_factory=list)
+    # Pass back as ``since`` to continue; unchanged when nothing new was found.
+    next_cursor: str | None = None
+    has_more: bool = False
@@ -40,6 +40,7 @@ class DrawOut(BaseModel):
     expert_count: int
     total_count: int
     backup_count: int
+    accepted_count: int = 0
     draw_method: str
     review_time: datetime | None = None
     review_location: str | None = None
@@ -47,6 +48,7 @@ class DrawOut(BaseModel):
     avoid_persons: str | None = None
     status: str
     rule_id: int | None = None
+    executed_at: datetime | None = None
 
 
 class DrawUpdate(BaseModel):
@@ -74,6 +76,10 @@ class DrawReplace(BaseModel):
     result_id: int
 
 
+class DrawTopUp(BaseModel):
+    count: int = Field(ge=1, le=100)
+
+
 class DrawBatchDelete(BaseModel):
     ids: list[int] = Field(default_factory=list, min_length=1)
 
@@ -127,6 +133,50 @@ class DrawResultOut(BaseModel):
     expert: DrawResultExpert | None = None
 
 
+class DrawResultDelta(BaseModel):
+    draw_id: int
+    status: str
+    accepted_count: int
+    changed: list[DrawResultOut] = Field(default_factory=list)
+    removed_ids: list[int] = Field(default_factory=list)
+
+
+class DrawPreview(BaseModel):
+    rule_id: int
+    expert_count: int | None = None
+    backup_count: int = 0
+    avoid_units: str | None = None
+    avoid_persons: str | None = None
+
+
+class PoolBucket(BaseModel):
+    id: int | None = None
+    name: str | None = None
+    count: int
+
+
+class DrawPoolPreviewOut(BaseModel):
+    rule_id: int
+    eligible_count: int
+    required_count: int | None = None
+    feasible: bool | None = None
+    by_specialty: list[PoolBucket] = Field(default_factory=list)
+    by_region: list[PoolBucket] = Field(default_factory=list)
+    by_title: list[PoolBucket] = Field(default_factory=list)
+
+
+class DrawCandidateSnapshotOut(BaseModel):
+    draw_id: int
+    signature: str
+    filters: dict
+    expert_total: int
+    checksum: str
+    checksum_valid: bool
+    results_in_pool: bool
+    created_at: datetime | None = None
+    expert_ids: list[int] | None = None
+
+
 class DrawExecuteResult(BaseModel):
     results: list[DrawResultOut] = Field(default_factory=list)
 
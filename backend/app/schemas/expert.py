@@ -1,7 +1,9 @@
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from app.schemas.specialty import SpecialtyOut
-from app.schemas.pagination import PageParams
+from app.schemas.pagination import FieldsPageParams
+
+MAX_BATCH_UPDATE_IDS = 1000
 
 
 class ExpertBase(BaseModel):
@@ -39,6 +41,12 @@ class ExpertUpdate(BaseModel):
     appointment_letter_urls: list[str] | None = None
 
 
+class AppointmentLetterOut(BaseModel):
+    url: str
+    thumb_url: str | None = None
+    preview_url: str | None = None
+
+
 class ExpertOut(ExpertBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -46,6 +54,7 @@ class ExpertOut(ExpertBase):
     specialties: list[SpecialtyOut] = Field(default_factory=list)
     specialty_ids: list[int] = Field(default_factory=list)
     appointment_letter_urls: list[str] = Field(default_factory=list)
+    appointment_letters: list[AppointmentLetterOut] = Field(default_factory=list)
 
     @field_serializer("name")
     def _mask_name(self, value: str | None) -> str | None:
@@ -87,7 +96,33 @@ class ExpertBatchDelete(BaseModel):
     ids: list[int] = Field(default_factory=list, min_length=1)
 
 
-class ExpertQuery(PageParams):
+class ExpertBatchPatch(BaseModel):
+    """Changes applied to every selected expert; unset fields are left alone.
+
+    Organization, region and title follow ``ExpertUpdate``: an id or a name
+    selects (or, for names, creates) the entry, explicit nulls clear it.
+    ``specialty_ids`` replaces the specialties; ``add_specialty_ids`` and
+    ``remove_specialty_ids`` adjust them instead.
+    """
+
+    is_active: bool | None = None
+    company: str | None = None
+    organization_id: int | None = None
+    region: str | None = None
+    region_id: int | None = None
+    title: str | None = None
+    title_id: int | None = None
+    specialty_ids: list[int] | None = None
+    add_specialty_ids: list[int] = Field(default_factory=list)
+    remove_specialty_ids: list[int] = Field(default_factory=list)
+
+
+class ExpertBatchUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_UPDATE_IDS)
+    patch: ExpertBatchPatch
+
+
+class ExpertQuery(FieldsPageParams):
     organization_id: int | None = None
     region_id: int | None = None
     title_id: int | None = None
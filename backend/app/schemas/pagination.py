@@ -14,6 +14,11 @@ class PageParams(BaseModel):
     keyword: str | None = None
 
 
+class FieldsPageParams(PageParams):
+    # Comma-separated sparse fieldset, e.g. "id,name"; omitted returns all fields.
+    fields: str | None = None
+
+
 class Page(BaseModel, Generic[T]):
     items: list[T] = Field(default_factory=list)
     total: int = 0
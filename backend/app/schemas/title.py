@@ -35,6 +35,10 @@ class TitleTreeOut(TitleOut):
     children: list[TitleTreeOut] = Field(default_factory=list)
 
 
+class TitleBatchDelete(BaseModel):
+    ids: list[int] = Field(default_factory=list, min_length=1)
+
+
 class TitleBatchItem(BaseModel):
     id: int
 
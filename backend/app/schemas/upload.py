@@ -1,7 +1,24 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class UploadResponse(BaseModel):
     url: str
     path: str
     filename: str
+    sha256: str | None = None
+    size: int | None = None
+    deduplicated: bool = False
+
+
+class UploadSessionCreate(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(gt=0)
+
+
+class UploadSessionOut(BaseModel):
+    upload_id: str
+    filename: str
+    size: int
+    received: int
+    chunk_size: int
+    complete: bool
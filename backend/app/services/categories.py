@@ -82,6 +82,12 @@ def list_category_tree(db: Session):
     return specialty_service.list_specialty_tree(db)
 
 
+def get_categories_by_ids(
+    db: Session, ids: list[int]
+) -> tuple[list[Specialty], list[int]]:
+    return specialty_service.get_specialties_by_ids(db, ids)
+
+
 def create_category(db: Session, payload: CategoryCreate) -> Specialty:
     return specialty_service.create_specialty(db, payload)
 
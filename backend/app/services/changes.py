@@ -0,0 +1,266 @@
+"""Incremental change feed over experts and reference data.
+
+Every write to a feed table leaves one row in ``change_log`` per changed
+entity, replacing that entity's previous row. ORM writes are picked up on
+flush; bulk statements call :func:`record`/:func:`record_deletes` before
+they run. Sequence numbers are handed out from ``change_sequence`` while
+committing, and the counter's row lock is held until the commit finishes,
+so sequence order is commit order and a cursor never skips a transaction
+that was still open when it was issued. Paging from the start returns the
+current state of every row.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.change import CHANGE_LOG_SEQUENCE, ChangeLog
+from app.models.expert import Expert
+from app.models.organization import Organization
+from app.models.region import Region
+from app.models.rule import Rule
+from app.models.specialty import Specialty
+from app.models.title import Title
+from app.repo.utils import chunked, reserve_sequence
+from app.schemas.expert import ExpertOut
+from app.schemas.organization import OrganizationOut
+from app.schemas.region import RegionOut
+from app.schemas.rule import RuleOut
+from app.schemas.specialty import SpecialtyOut
+from app.schemas.title import TitleOut
+from app.services.projection import project
+
+PENDING_KEY = "change_log_writes"
+
+
+@dataclass(frozen=True)
+class Stream:
+    entity: str
+    model: type
+    schema: type[BaseModel]
+    scope: str
+    fields: frozenset[str]
+    prepare: Callable[[Session, list[Any]], None] | None = None
+
+
+def _fields(schema: type[BaseModel], exclude: Iterable[str] = ()) -> frozenset[str]:
+    return frozenset(schema.model_fields) - set(exclude)
+
+
+def _attach_specialty_ids(db: Session, experts: list[Expert]) -> None:
+    from app.services.experts import _attach_expert_details
+
+    _attach_expert_details(db, experts, documents=False)
+
+
+STREAMS: dict[str, Stream] = {
+    stream.entity: stream
+    for stream in (
+        Stream(
+            "experts",
+            Expert,
+            ExpertOut,
+            "expert:read",
+            _fields(
+                ExpertOut,
+                ("specialties", "appointment_letter_urls", "appointment_letters"),
+            ),
+            _attach_specialty_ids,
+        ),
+        Stream(
+            "organizations",
+            Organization,
+            OrganizationOut,
+            "organization:read",
+            _fields(OrganizationOut, ("expert_count",)),
+        ),
+        Stream(
+            "regions",
+            Region,
+            RegionOut,
+            "region:read",
+            _fields(RegionOut, ("expert_count",)),
+        ),
+        Stream("titles", Title, TitleOut, "title:read", _fields(TitleOut)),
+        Stream(
+            "specialties", Specialty, SpecialtyOut, "category:read", _fields(SpecialtyOut)
+        ),
+        Stream("rules", Rule, RuleOut, "rule:read", _fields(RuleOut)),
+    )
+}
+_ENTITIES: dict[type, str] = {
+    stream.model: entity for entity, stream in STREAMS.items()
+}
+
+
+def _pending(db: Session) -> dict[tuple[str, int], str]:
+    return db.info.setdefault(PENDING_KEY, {})
+
+
+def record(db: Session, entity: str, ids: Iterable[int]) -> None:
+    """Queue upserts for rows changed by bulk statements; ORM writes need no call."""
+    pending = _pending(db)
+    for item in ids:
+        pending.setdefault((entity, item), "upsert")
+
+
+def record_where(db: Session, model: type, *criteria) -> None:
+    """Queue upserts for the rows a bulk update on ``criteria`` is about to change."""
+    ids = db.execute(select(model.id).where(*criteria)).scalars()
+    record(db, _ENTITIES[model], ids)
+
+
+def record_deletes(db: Session, entity: str, ids: Iterable[int]) -> None:
+    """Queue deletes for rows removed by bulk statements."""
+    pending = _pending(db)
+    for item in ids:
+        pending[(entity, item)] = "delete"
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, _flush_context) -> None:
+    for obj in session.new:
+        entity = _ENTITIES.get(type(obj))
+        if entity is not None:
+            record(session, entity, [obj.id])
+    for obj in session.dirty:
+        entity = _ENTITIES.get(type(obj))
+        if entity is not None and session.is_modified(obj, include_collections=False):
+            record(session, entity, [obj.id])
+    for obj in session.deleted:
+        entity = _ENTITIES.get(type(obj))
+        if entity is not None:
+            record_deletes(session, entity, [obj.id])
+
+
+@event.listens_for(Session, "before_commit")
+def _write_log(session: Session) -> None:
+    session.flush()
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    # The numbers below are only visible once every lower one is committed.
+    last = reserve_sequence(session, CHANGE_LOG_SEQUENCE, len(pending))
+    by_entity: dict[str, list[int]] = {}
+    for entity, item in pending:
+        by_entity.setdefault(entity, []).append(item)
+    for entity, ids in by_entity.items():
+        for chunk in chunked(ids):
+            session.execute(
+                delete(ChangeLog).where(
+                    ChangeLog.entity == entity, ChangeLog.entity_id.in_(chunk)
+                )
+            )
+    first = last - len(pending) + 1
+    session.execute(
+        insert(ChangeLog),
+        [
+            {"seq": first + index, "entity": entity, "entity_id": item, "op": op}
+            for index, ((entity, item), op) in enumerate(pending.items())
+        ],
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def parse_entities(value: str | None) -> list[str]:
+    if not value:
+        return list(STREAMS)
+    names = [item.strip() for item in value.split(",") if item.strip()]
+    names = list(dict.fromkeys(names))
+    unknown = [name for name in names if name not in STREAMS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown entities: {', '.join(unknown)}",
+        )
+    return names or list(STREAMS)
+
+
+def encode_cursor(seq: int) -> str:
+    return base64.urlsafe_b64encode(str(seq).encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        return int(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+
+def list_changes(
+    db: Session, since: str | None, limit: int, entities: list[str]
+) -> dict[str, Any]:
+    cursor = decode_cursor(since) if since else 0
+    entries = (
+        db.execute(
+            select(ChangeLog)
+            .where(ChangeLog.seq > cursor, ChangeLog.entity.in_(entities))
+            .order_by(ChangeLog.seq)
+            .limit(limit + 1)
+        )
+        .scalars()
+        .all()
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    wanted: dict[str, list[int]] = {}
+    for entry in entries:
+        if entry.op == "upsert":
+            wanted.setdefault(entry.entity, []).append(entry.entity_id)
+    payloads: dict[tuple[str, int], dict[str, Any]] = {}
+    for entity, ids in wanted.items():
+        stream = STREAMS[entity]
+        model = stream.model
+        rows: list[Any] = []
+        for chunk in chunked(ids):
+            rows.extend(
+                db.execute(select(model).where(model.id.in_(chunk))).scalars()
+            )
+        if stream.prepare is not None:
+            stream.prepare(db, rows)
+        for row, data in zip(rows, project(stream.schema, rows, set(stream.fields))):
+            payloads[(entity, row.id)] = data
+
+    changes: list[dict[str, Any]] = []
+    for entry in entries:
+        if entry.op == "delete":
+            changes.append(
+                {
+                    "entity": entry.entity,
+                    "op": "delete",
+                    "id": entry.entity_id,
+                    "data": None,
+                }
+            )
+            continue
+        data = payloads.get((entry.entity, entry.entity_id))
+        if data is None:
+            # Removed by a transaction that committed after this entry; its
+            # delete comes later in the feed.
+            continue
+        changes.append(
+            {
+                "entity": entry.entity,
+                "op": "upsert",
+                "id": entry.entity_id,
+                "data": data,
+            }
+        )
+    next_cursor = encode_cursor(entries[-1].seq) if entries else since
+    return {"changes": changes, "next_cursor": next_cursor, "has_more": has_more}
@@ -0,0 +1,222 @@
+"""Resized WebP derivatives (thumbnails and previews) of uploaded credentials.
+
+Derivatives live next to the original as ``<stem>.<kind>.webp``. They are
+generated by a process pool right after upload and, as a fallback, on the
+first request for a missing derivative.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SIZES = {"thumb": 320, "preview": 1280}
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+PDF_SUFFIXES = {".pdf"}
+WEBP_QUALITY = 80
+
+
+def _upload_root() -> Path:
+    return Path(settings.upload_dir).resolve()
+
+
+def _url_prefix() -> str:
+    prefix = (settings.upload_url_prefix or "/uploads").strip()
+    if not prefix.startswith("/"):
+        prefix = f"/{prefix}"
+    return prefix.rstrip("/")
+
+
+def _escapes(relative_path: str) -> bool:
+    path = PurePosixPath(relative_path)
+    return path.is_absolute() or ".." in path.parts
+
+
+def _inside(root: Path, relative_path: str) -> bool:
+    """Whether ``relative_path`` names a location under ``root``.
+
+    Request paths reach this module straight from the URL, so anything that
+    climbs out of the upload dir (``..``, absolute paths, symlinks) is refused
+    before a file is read or written.
+    """
+    if not relative_path or _escapes(relative_path):
+        return False
+    try:
+        (root / relative_path).resolve().relative_to(root.resolve())
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def supports(relative_path: str) -> bool:
+    suffix = PurePosixPath(relative_path).suffix.lower()
+    return suffix in IMAGE_SUFFIXES or suffix in PDF_SUFFIXES
+
+
+def derivative_path(relative_path: str, kind: str) -> str:
+    path = PurePosixPath(relative_path)
+    return str(path.with_name(f"{path.stem}.{kind}.webp"))
+
+
+def parse_derivative(relative_path: str) -> tuple[str, str] | None:
+    """Map ``x/abc.thumb.webp`` back to its kind and candidate stem path."""
+    if _escapes(relative_path):
+        return None
+    path = PurePosixPath(relative_path)
+    parts = path.name.split(".")
+    if len(parts) != 3 or parts[2] != "webp" or parts[1] not in SIZES:
+        return None
+    return parts[1], str(path.with_name(parts[0]))
+
+
+def find_source(stem_path: str) -> str | None:
+    root = _upload_root()
+    if not _inside(root, stem_path):
+        return None
+    for suffix in sorted(IMAGE_SUFFIXES | PDF_SUFFIXES):
+        candidate = f"{stem_path}{suffix}"
+        if (root / candidate).is_file():
+            return candidate
+    return None
+
+
+def relative_path_from_url(url: str) -> str | None:
+    path = urlsplit(url).path
+    prefix = f"{_url_prefix()}/"
+    if not path.startswith(prefix):
+        return None
+    relative = path[len(prefix) :]
+    if not relative or _escapes(relative):
+        return None
+    return relative
+
+
+def describe(url: str) -> dict[str, str | None]:
+    """Original URL plus derivative URLs, for the expert API."""
+    relative = relative_path_from_url(url)
+    if relative is None or not supports(relative):
+        return {"url": url, "thumb_url": None, "preview_url": None}
+    base = url[: len(url) - len(relative)]
+    return {
+        "url": url,
+        "thumb_url": f"{base}{derivative_path(relative, 'thumb')}",
+        "preview_url": f"{base}{derivative_path(relative, 'preview')}",
+    }
+
+
+def _load_source(source: Path):
+    from PIL import Image, ImageOps
+
+    if source.suffix.lower() in PDF_SUFFIXES:
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(str(source))
+        try:
+            page = pdf[0]
+            width, height = page.get_size()
+            scale = max(SIZES.values()) / max(width, height, 1)
+            image = page.render(scale=max(scale, 0.1)).to_pil()
+            page.close()
+        finally:
+            pdf.close()
+        return image
+    image = Image.open(source)
+    # Phone photos carry their orientation in EXIF only.
+    return ImageOps.exif_transpose(image)
+
+
+def generate(upload_root: str, relative_path: str) -> list[str]:
+    """Write every missing derivative of one file; runs in a worker process."""
+    root = Path(upload_root)
+    if not _inside(root, relative_path):
+        raise ValueError(f"Path outside the upload dir: {relative_path}")
+    source = root / relative_path
+    pending = [
+        kind
+        for kind in SIZES
+        if not (root / derivative_path(relative_path, kind)).exists()
+    ]
+    if not pending:
+        return []
+    image = _load_source(source)
+    if image.mode not in {"RGB", "RGBA"}:
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    written: list[str] = []
+    for kind in sorted(pending, key=lambda item: -SIZES[item]):
+        image.thumbnail((SIZES[kind], SIZES[kind]))
+        target = root / derivative_path(relative_path, kind)
+        temp = target.with_name(f".{uuid4().hex}.tmp")
+        image.save(temp, "WEBP", quality=WEBP_QUALITY, method=4)
+        os.replace(temp, target)
+        written.append(str(target.relative_to(root)))
+    return written
+
+
+_pool: ProcessPoolExecutor | None = None
+_pending: dict[str, Future] = {}
+_lock = threading.RLock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Spawn: forking a threaded server process is not safe.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.derivative_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def _submit(relative_path: str) -> Future:
+    global _pool
+    try:
+        return _get_pool().submit(generate, str(_upload_root()), relative_path)
+    except BrokenProcessPool:
+        # A crashed worker (e.g. a decoder segfault) breaks the whole pool.
+        _pool = None
+        return _get_pool().submit(generate, str(_upload_root()), relative_path)
+
+
+def _done(relative_path: str, future: Future) -> None:
+    with _lock:
+        _pending.pop(relative_path, None)
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.warning(
+            "Derivative generation failed for %s: %s", relative_path, error
+        )
+
+
+def schedule(relative_path: str) -> Future | None:
+    """Queue derivative generation; concurrent requests share one job."""
+    if not supports(relative_path) or not _inside(_upload_root(), relative_path):
+        return None
+    with _lock:
+        future = _pending.get(relative_path)
+        if future is None:
+            future = _submit(relative_path)
+            _pending[relative_path] = future
+            future.add_done_callback(lambda item: _done(relative_path, item))
+    return future
+
+
+def shutdown() -> None:
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,265 @@
+"""Process-wide name/id/code cache for organizations, regions and titles.
+
+Each cache holds a snapshot versioned by a cheap fingerprint (row count, max
+id, max updated_at). The fingerprint is re-checked at most every
+``dimension_cache_check_seconds``, so writes from other workers show up
+within that window. Writes made through this process are staged on the
+session and applied to the snapshot only when the session commits; lookups
+inside the same transaction see them straight away.
+
+Resolved ids end up in expert rows, so a snapshot hit is only a hint: it is
+confirmed against the table in the same query that loads the misses, and a
+row deleted or renamed by another worker falls back to a fresh lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import zip_longest
+
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.codes import generate_code
+from app.core.config import settings
+from app.models.organization import Organization
+from app.models.region import Region
+from app.models.title import Title
+from app.repo.utils import chunked
+
+PENDING_KEY = "dimension_writes"
+
+
+@dataclass(frozen=True)
+class DimensionRef:
+    id: int
+    name: str
+
+
+@dataclass
+class _Snapshot:
+    fingerprint: tuple
+    checked_at: float
+    by_id: dict[int, str]
+    by_name: dict[str, int]
+    codes: set[str]
+
+
+@dataclass
+class _Pending:
+    refs: dict[int, DimensionRef] = field(default_factory=dict)
+    by_name: dict[str, int] = field(default_factory=dict)
+    codes: set[str] = field(default_factory=set)
+
+
+class DimensionCache:
+    def __init__(self, model: type, code_prefix: str) -> None:
+        self.model = model
+        self.code_prefix = code_prefix
+        self._snapshot: _Snapshot | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        return self.model.__tablename__
+
+    def _fingerprint(self, db: Session) -> tuple:
+        row = db.execute(
+            select(
+                func.count(self.model.id),
+                func.max(self.model.id),
+                func.max(self.model.updated_at),
+            )
+        ).one()
+        return tuple(row)
+
+    def _build(self, db: Session, fingerprint: tuple) -> _Snapshot:
+        by_id: dict[int, str] = {}
+        by_name: dict[str, int] = {}
+        codes: set[str] = set()
+        rows = db.execute(
+            select(self.model.id, self.model.name, self.model.code).order_by(
+                self.model.id
+            )
+        )
+        for item_id, name, code in rows:
+            by_id[item_id] = name
+            # Titles may share a name; the lowest id wins, as in the repos.
+            by_name.setdefault(name, item_id)
+            if code:
+                codes.add(code)
+        return _Snapshot(fingerprint, time.monotonic(), by_id, by_name, codes)
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        snapshot = self._snapshot
+        interval = settings.dimension_cache_check_seconds
+        if snapshot is not None and time.monotonic() - snapshot.checked_at < interval:
+            return snapshot
+        fingerprint = self._fingerprint(db)
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                snapshot.checked_at = time.monotonic()
+            else:
+                snapshot = self._snapshot = self._build(db, fingerprint)
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def _pending(self, db: Session) -> _Pending:
+        return db.info.setdefault(PENDING_KEY, {}).setdefault(self.key, _Pending())
+
+    def stage(self, db: Session, item) -> None:
+        """Write-through for a created or renamed row, applied on commit."""
+        pending = self._pending(db)
+        previous = pending.refs.get(item.id)
+        if previous is not None and pending.by_name.get(previous.name) == item.id:
+            del pending.by_name[previous.name]
+        ref = DimensionRef(item.id, item.name)
+        pending.refs[item.id] = ref
+        known = self._snapshot.by_name.get(item.name) if self._snapshot else None
+        if known is None or known > item.id:
+            pending.by_name.setdefault(item.name, item.id)
+        if item.code:
+            pending.codes.add(item.code)
+
+    def _apply(self, pending: _Pending) -> None:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return
+            for ref in pending.refs.values():
+                old_name = snapshot.by_id.get(ref.id)
+                if old_name is not None and snapshot.by_name.get(old_name) == ref.id:
+                    del snapshot.by_name[old_name]
+                snapshot.by_id[ref.id] = ref.name
+                if snapshot.by_name.get(ref.name, ref.id) >= ref.id:
+                    snapshot.by_name[ref.name] = ref.id
+            snapshot.codes |= pending.codes
+
+    def get_by_id(self, db: Session, item_id: int) -> DimensionRef | None:
+        pending = self._pending(db)
+        if item_id in pending.refs:
+            return pending.refs[item_id]
+        row = db.execute(
+            select(self.model).where(self.model.id == item_id)
+        ).scalar_one_or_none()
+        if row is None:
+            if self._snapshot is not None and item_id in self._snapshot.by_id:
+                self.invalidate()
+            return None
+        self.stage(db, row)
+        return DimensionRef(row.id, row.name)
+
+    def get_by_name(self, db: Session, name: str) -> DimensionRef | None:
+        return self.get_by_names(db, [name]).get(name)
+
+    def get_by_names(self, db: Session, names: list[str]) -> dict[str, DimensionRef]:
+        """Resolve many names at once in one chunked query.
+
+        Snapshot hits are verified by id in the same query that loads the
+        misses; names whose cached row has gone are looked up again.
+        """
+        pending = self._pending(db)
+        snapshot = self.snapshot(db)
+        found: dict[str, DimensionRef] = {}
+        hints: dict[int, str] = {}
+        misses: list[str] = []
+        for name in dict.fromkeys(item for item in names if item):
+            item_id = pending.by_name.get(name)
+            if item_id is not None:
+                found[name] = DimensionRef(item_id, name)
+            elif name in snapshot.by_name:
+                hints[snapshot.by_name[name]] = name
+            else:
+                misses.append(name)
+        rows = self._load(db, list(hints), misses)
+        stale = [
+            name
+            for item_id, name in hints.items()
+            if item_id not in rows or rows[item_id].name != name
+        ]
+        if stale:
+            self.invalidate()
+            rows.update(self._load(db, [], stale))
+        lookups = {*misses, *stale}
+        for row in sorted(rows.values(), key=lambda item: item.id):
+            wanted = row.name in lookups or hints.get(row.id) == row.name
+            if wanted and row.name not in found:
+                self.stage(db, row)
+                found[row.name] = DimensionRef(row.id, row.name)
+        return found
+
+    def _load(self, db: Session, ids: list[int], names: list[str]) -> dict[int, object]:
+        rows: dict[int, object] = {}
+        for id_chunk, name_chunk in zip_longest(chunked(ids), chunked(names)):
+            conditions = []
+            if id_chunk:
+                conditions.append(self.model.id.in_(id_chunk))
+            if name_chunk:
+                conditions.append(self.model.name.in_(name_chunk))
+            for row in db.execute(
+                select(self.model).where(or_(*conditions))
+            ).scalars():
+                rows[row.id] = row
+        return rows
+
+    def reserve_code(self, db: Session) -> str:
+        """A code unused by any known or pending row, without a DB round trip.
+
+        The unique constraint on ``code`` remains the final guard against a
+        row created by another worker since the last snapshot.
+        """
+        pending = self._pending(db)
+        codes = self.snapshot(db).codes
+        code = generate_code(prefix=self.code_prefix)
+        while code in codes or code in pending.codes:
+            code = generate_code(prefix=self.code_prefix)
+        pending.codes.add(code)
+        return code
+
+    def create_many(self, db: Session, names: list[str]) -> dict[str, DimensionRef]:
+        """Insert active rows for ``names`` with reserved codes, in one flush."""
+        items = [
+            self.model(
+                name=name, code=self.reserve_code(db), is_active=True, sort_order=0
+            )
+            for name in dict.fromkeys(item for item in names if item)
+        ]
+        if not items:
+            return {}
+        db.add_all(items)
+        db.flush()
+        for item in items:
+            self.stage(db, item)
+        return {item.name: DimensionRef(item.id, item.name) for item in items}
+
+    def resolve_names(
+        self, db: Session, names: list[str], create_if_missing: bool = False
+    ) -> dict[str, DimensionRef]:
+        found = self.get_by_names(db, names)
+        if create_if_missing:
+            missing = [name for name in names if name and name not in found]
+            found.update(self.create_many(db, missing))
+        return found
+
+
+organizations = DimensionCache(Organization, "org")
+regions = DimensionCache(Region, "region")
+titles = DimensionCache(Title, "title")
+CACHES = {cache.key: cache for cache in (organizations, regions, titles)}
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for key, pending in session.info.pop(PENDING_KEY, {}).items():
+        CACHES[key]._apply(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.change import DRAW_EVENT_SEQUENCE
+from app.models.draw import DrawEvent
+from app.repo.utils import reserve_sequence
+
+logger = logging.getLogger(__name__)
+
+RETENTION = timedelta(hours=1)
+PRUNE_INTERVAL_SECONDS = 300
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+
+@dataclass
+class Event:
+    id: int | None
+    draw_id: int
+    event_type: str
+    payload: dict[str, Any]
+
+
+@dataclass(eq=False)
+class Subscription:
+    draw_id: int
+    queue: asyncio.Queue[Event]
+    loop: asyncio.AbstractEventLoop
+    overflowed: bool = False
+
+    def _offer(self, event: Event) -> None:
+        # Bounded queue: a slow client loses its oldest events and is told to
+        # resync instead of growing memory without limit.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.overflowed = True
+        self.queue.put_nowait(event)
+
+
+@dataclass
+class EventHub:
+    """In-process fan-out of draw events to SSE subscribers."""
+
+    queue_size: int
+    _subscriptions: dict[int, set[Subscription]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def subscribe(self, draw_id: int) -> Subscription:
+        subscription = Subscription(
+            draw_id, asyncio.Queue(self.queue_size), asyncio.get_running_loop()
+        )
+        with self._lock:
+            self._subscriptions.setdefault(draw_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.draw_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.draw_id]
+
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscriptions)
+
+    def dispatch(self, event: Event) -> None:
+        """Deliver an event; safe to call from worker threads."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.draw_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+
+class MemoryBroker:
+    """Single-process broker: events go straight to the local hub."""
+
+    def __init__(self, hub: EventHub) -> None:
+        self.hub = hub
+
+    def publish(self, event: Event, bind: Engine | Connection) -> None:
+        self.hub.dispatch(event)
+
+    def high_water(self) -> int:
+        return 0
+
+    def replay(self, draw_id: int, after_id: int) -> list[Event]:
+        return []
+
+    def ensure_started(self, after_id: int) -> None:
+        return None
+
+
+class DatabaseBroker:
+    """Outbox table shared by all workers, standing in for an external broker.
+
+    Publishers insert into draw_events; each worker runs one poller that reads
+    new rows and fans them out to its local hub, so subscribers connected to
+    any process see events published by every other process. Publishers also
+    prune rows past the retention window, whether or not anyone listens.
+
+    Rows are read by ``seq`` rather than ``id``: ids are handed out at insert
+    time, so a lower id can commit after a higher one has been polled and
+    would be skipped. ``seq`` comes from a counter whose row lock is held until
+    commit, so every row below the highest visible ``seq`` is already visible.
+    """
+
+    def __init__(self, hub: EventHub, poll_interval: float) -> None:
+        self.hub = hub
+        self.poll_interval = poll_interval
+        self._last_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._last_prune = 0.0
+
+    def publish(self, event: Event, bind: Engine | Connection) -> None:
+        # Same database as the change being announced, on its own transaction.
+        with Session(bind=bind) as db:
+            self._prune(db)
+            db.execute(
+                insert(DrawEvent).values(
+                    seq=reserve_sequence(db, DRAW_EVENT_SEQUENCE),
+                    draw_id=event.draw_id,
+                    event_type=event.event_type,
+                    payload=event.payload,
+                )
+            )
+            db.commit()
+        if self._loop is not None and self._wake is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass
+
+    def _prune(self, db: Session) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        cutoff = datetime.now(timezone.utc) - RETENTION
+        db.execute(delete(DrawEvent).where(DrawEvent.created_at < cutoff))
+
+    def high_water(self) -> int:
+        with SessionLocal() as db:
+            return db.execute(select(func.max(DrawEvent.seq))).scalar() or 0
+
+    def replay(self, draw_id: int, after_id: int) -> list[Event]:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(DrawEvent)
+                .where(DrawEvent.draw_id == draw_id, DrawEvent.seq > after_id)
+                .order_by(DrawEvent.seq)
+            ).scalars()
+            return [_to_event(row) for row in rows]
+
+    def ensure_started(self, after_id: int) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._last_id = after_id
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self.hub.has_subscribers():
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                events = await asyncio.to_thread(self._fetch)
+            except Exception:
+                logger.exception("Failed to poll draw events")
+                continue
+            for event in events:
+                self._last_id = event.id
+                self.hub.dispatch(event)
+        self._task = None
+
+    def _fetch(self) -> list[Event]:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(DrawEvent)
+                .where(DrawEvent.seq > self._last_id)
+                .order_by(DrawEvent.seq)
+                .limit(500)
+            ).scalars()
+            return [_to_event(row) for row in rows]
+
+
+def _to_event(row: DrawEvent) -> Event:
+    return Event(row.seq, row.draw_id, row.event_type, row.payload)
+
+
+hub = EventHub(queue_size=settings.event_queue_size)
+if settings.event_broker == "memory":
+    broker: MemoryBroker | DatabaseBroker = MemoryBroker(hub)
+else:
+    broker = DatabaseBroker(hub, settings.event_poll_interval_ms / 1000)
+
+
+def publish(db: Session, draw_id: int, event_type: str, payload: dict[str, Any]) -> None:
+    try:
+        broker.publish(Event(None, draw_id, event_type, payload), db.get_bind())
+    except Exception:
+        # Events are best effort; the committed change must not fail because
+        # of the notification channel.
+        logger.exception("Failed to publish draw event")
+
+
+def format_sse(event: Event) -> str:
+    data = json.dumps(event.payload, ensure_ascii=False, default=str)
+    lines = []
+    if event.id is not None:
+        lines.append(f"id: {event.id}")
+    lines.append(f"event: {event.event_type}")
+    lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream(
+    draw_id: int,
+    initial: dict[str, Any],
+    last_event_id: int | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    # Take the high-water mark before subscribing and replay past it once
+    # subscribed, so nothing published in between is missed.
+    high_water = await asyncio.to_thread(broker.high_water)
+    subscription = hub.subscribe(draw_id)
+    broker.ensure_started(high_water)
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        yield format_sse(Event(None, draw_id, "status", initial))
+        delivered = last_event_id if last_event_id is not None else high_water
+        for event in await asyncio.to_thread(broker.replay, draw_id, delivered):
+            delivered = event.id
+            yield format_sse(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    break
+                yield ": ping\n\n"
+                continue
+            if event.id is not None and event.id <= delivered:
+                continue
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield format_sse(Event(None, draw_id, "resync", {}))
+            if event.id is not None:
+                delivered = event.id
+            yield format_sse(event)
+    finally:
+        hub.unsubscribe(subscription)
@@ -0,0 +1,214 @@
+"""Automatic execution of pending draws ahead of their review time.
+
+Every process may run the scheduler loop, but only the holder of the
+``draw-scheduler`` lease claims jobs, so a draw is never executed twice even
+with several API workers. Run it inside the API (``SCHEDULER_ENABLED=true``) or
+as a dedicated worker with ``python -m app.services.draw_scheduler``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.draw import DrawJob, SchedulerLease
+from app.services import draws as draw_service
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "draw-scheduler"
+RETRY_BACKOFF = timedelta(minutes=1)
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def acquire_lease(db: Session, holder: str) -> bool:
+    """Take or renew the leader lease; returns True while this holder leads."""
+    now = _now()
+    expires_at = now + timedelta(seconds=settings.scheduler_lease_seconds)
+    result = db.execute(
+        update(SchedulerLease)
+        .where(
+            SchedulerLease.name == LEASE_NAME,
+            or_(
+                SchedulerLease.holder == holder,
+                SchedulerLease.holder.is_(None),
+                SchedulerLease.expires_at < now,
+            ),
+        )
+        .values(holder=holder, expires_at=expires_at)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+    if db.get(SchedulerLease, LEASE_NAME) is not None:
+        db.rollback()
+        return False
+    db.add(SchedulerLease(name=LEASE_NAME, holder=holder, expires_at=expires_at))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+def release_lease(db: Session, holder: str) -> None:
+    db.execute(
+        update(SchedulerLease)
+        .where(SchedulerLease.name == LEASE_NAME, SchedulerLease.holder == holder)
+        .values(holder=None, expires_at=None)
+    )
+    db.commit()
+
+
+def claim_due_jobs(db: Session, holder: str, limit: int) -> list[int]:
+    now = _now()
+    # Jobs left running by a crashed leader become claimable again.
+    db.execute(
+        update(DrawJob)
+        .where(DrawJob.status == "running", DrawJob.locked_until < now)
+        .values(status="queued", locked_by=None, locked_until=None)
+    )
+    due_ids = (
+        db.execute(
+            select(DrawJob.id)
+            .where(DrawJob.status == "queued", DrawJob.run_at <= now)
+            .order_by(DrawJob.run_at, DrawJob.id)
+            .limit(limit)
+        )
+        .scalars()
+        .all()
+    )
+    claimed: list[int] = []
+    locked_until = now + timedelta(seconds=settings.scheduler_job_timeout_seconds)
+    for job_id in due_ids:
+        result = db.execute(
+            update(DrawJob)
+            .where(DrawJob.id == job_id, DrawJob.status == "queued")
+            .values(
+                status="running",
+                locked_by=holder,
+                locked_until=locked_until,
+                attempts=DrawJob.attempts + 1,
+            )
+        )
+        if result.rowcount:
+            claimed.append(job_id)
+    db.commit()
+    return claimed
+
+
+def run_job(job_id: int, holder: str) -> str:
+    with SessionLocal() as db:
+        job = db.get(DrawJob, job_id)
+        if job is None or job.locked_by != holder:
+            return "skipped"
+        draw = job.draw
+        attempts = job.attempts
+        values: dict[str, object] = {"last_error": None}
+        if draw.executed_at is not None:
+            values["status"] = "done"
+        elif draw.status != "pending":
+            values["status"] = "cancelled"
+        elif draw.review_time and draw_service.as_utc(draw.review_time) <= _now():
+            values.update(status="expired", last_error="Review time has passed")
+        else:
+            try:
+                draw_service.execute_draw(
+                    db, draw.id, idempotency_key=f"draw-job:{job_id}"
+                )
+                values["status"] = "done"
+            except HTTPException as exc:
+                # Business rule failures (e.g. not enough experts) will not
+                # fix themselves; leave them for an operator.
+                db.rollback()
+                values.update(status="failed", last_error=str(exc.detail)[:500])
+            except Exception as exc:
+                db.rollback()
+                logger.exception("Scheduled execution of draw %s failed", draw.id)
+                values["last_error"] = (str(exc) or exc.__class__.__name__)[:500]
+                if attempts < settings.scheduler_max_attempts:
+                    values.update(
+                        status="queued", run_at=_now() + RETRY_BACKOFF * attempts
+                    )
+                else:
+                    values["status"] = "failed"
+        db.execute(
+            update(DrawJob)
+            .where(DrawJob.id == job_id, DrawJob.locked_by == holder)
+            .values(locked_by=None, locked_until=None, **values)
+        )
+        db.commit()
+        return str(values["status"])
+
+
+class DrawScheduler:
+    def __init__(self, holder: str = INSTANCE_ID) -> None:
+        self.holder = holder
+        self.max_concurrency = max(1, settings.scheduler_max_concurrency)
+        self._in_flight: set[asyncio.Task] = set()
+
+    def _lead_and_claim(self, limit: int) -> list[int]:
+        with SessionLocal() as db:
+            if not acquire_lease(db, self.holder):
+                return []
+            if limit <= 0:
+                return []
+            return claim_due_jobs(db, self.holder, limit)
+
+    def _release(self) -> None:
+        with SessionLocal() as db:
+            release_lease(db, self.holder)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        logger.info("Draw scheduler started as %s", self.holder)
+        while not stop.is_set():
+            free = self.max_concurrency - len(self._in_flight)
+            try:
+                job_ids = await asyncio.to_thread(self._lead_and_claim, free)
+            except Exception:
+                logger.exception("Draw scheduler tick failed")
+                job_ids = []
+            for job_id in job_ids:
+                task = asyncio.create_task(
+                    asyncio.to_thread(run_job, job_id, self.holder)
+                )
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+            try:
+                await asyncio.wait_for(stop.wait(), settings.scheduler_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        try:
+            await asyncio.to_thread(self._release)
+        except Exception:
+            logger.exception("Failed to release draw scheduler lease")
+
+
+async def _main() -> None:
+    await DrawScheduler().run(asyncio.Event())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import random
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
+from typing import Protocol
 
 from fastapi import HTTPException, status
 from openpyxl import Workbook
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from docx import Document
 from docx.shared import Pt, Mm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -15,7 +22,14 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from sqlalchemy.orm import Session, selectinload
 
-from app.models.draw import DrawApplication, DrawResult
+from app.core.config import settings
+from app.core.id_codec import ids_checksum, pack_ids, unpack_ids
+from app.models.draw import (
+    DrawApplication,
+    DrawCandidateSnapshot,
+    DrawJob,
+    DrawResult,
+)
 from app.models.expert import Expert
 from app.models.expert_specialty import ExpertSpecialty
 from app.models.rule import Rule
@@ -23,32 +37,75 @@ from app.models.organization import Organization
 from app.models.specialty import Specialty
 from app.repo.draws import DrawRepo
 from app.repo.rules import RuleRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import apply_keyword, apply_sort, chunked, load_fields, paginate
+from app.services import draw_events, eligibility
 from app.services import experts as expert_service
 from app.services import specialties as specialty_service
 from app.services import titles as title_service
+from app.services.terms import split_terms, unique_ints
 from app.schemas.pagination import PageParams
-from app.schemas.draw import DrawApply, DrawUpdate
+from app.schemas.draw import DrawApply, DrawResultDelta, DrawUpdate
 
 SUPPORTED_DRAW_METHODS = {"random", "lottery"}
 CONTACT_STATUS_PENDING = "pending"
 CONTACT_STATUS_ACCEPTED = "accepted"
 CONTACT_STATUS_REJECTED = "rejected"
+CANDIDATE_POOL_CACHE_SIZE = 256
+
+
+class CandidatePoolCache:
+    """LRU of decoded candidate snapshots, keyed by draw id.
+
+    Entries remember the checksum of the snapshot they were decoded from and
+    only hit while the stored snapshot still has it, so a snapshot replaced
+    by another process is never served from here.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[str, list[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, draw_id: int, checksum: str) -> list[int] | None:
+        with self._lock:
+            entry = self._entries.get(draw_id)
+            if entry is None or entry[0] != checksum:
+                return None
+            self._entries.move_to_end(draw_id)
+            return entry[1]
+
+    def put(self, draw_id: int, checksum: str, expert_ids: list[int]) -> None:
+        with self._lock:
+            self._entries[draw_id] = (checksum, expert_ids)
+            self._entries.move_to_end(draw_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, draw_id: int, expert_ids: set[int] | None = None) -> None:
+        with self._lock:
+            if expert_ids is None:
+                self._entries.pop(draw_id, None)
+                return
+            entry = self._entries.get(draw_id)
+            if entry is not None:
+                checksum, pool = entry
+                self._entries[draw_id] = (
+                    checksum,
+                    [item for item in pool if item not in expert_ids],
+                )
 
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-def _split_terms(value: str | None) -> list[str]:
-    if not value:
-        return []
-    normalized = value
-    for sep in ["、", "，", "；", ",", ";", "|", "\n"]:
-        normalized = normalized.replace(sep, ";")
-    return [item.strip() for item in normalized.split(";") if item.strip()]
+
+candidate_pools = CandidatePoolCache(CANDIDATE_POOL_CACHE_SIZE)
 
 
 def _split_numeric_terms(value: str | None) -> tuple[list[int], list[str]]:
     numeric: list[int] = []
     text: list[str] = []
-    for item in _split_terms(value):
+    for item in split_terms(value):
         if item.isdigit():
             numeric.append(int(item))
         else:
@@ -56,24 +113,12 @@ def _split_numeric_terms(value: str | None) -> tuple[list[int], list[str]]:
     return numeric, text
 
 
-def _unique_ints(values: list[int] | None) -> list[int]:
-    unique: list[int] = []
-    for item in values or []:
-        try:
-            value = int(item)
-        except (TypeError, ValueError):
-            continue
-        if value not in unique:
-            unique.append(value)
-    return unique
-
-
 def _split_person_terms(
     value: str | None,
 ) -> tuple[list[int], list[str]]:
     expert_ids: list[int] = []
     invalid: list[str] = []
-    for item in _split_terms(value):
+    for item in split_terms(value):
         normalized = item.strip()
         if not normalized:
             continue
@@ -126,15 +171,15 @@ def _find_active_rule_by_specialties(
         return None
     stmt = select(Rule).where(Rule.is_active.is_(True)).order_by(Rule.id.desc())
     rules = db.execute(stmt).scalars().all()
-    name_terms = _split_terms(specialty_name) if specialty_name else []
+    name_terms = split_terms(specialty_name) if specialty_name else []
     specialty_id_set = set(specialty_ids)
     for rule in rules:
-        rule_ids = _unique_ints(rule.specialty_ids)
+        rule_ids = unique_ints(rule.specialty_ids)
         if specialty_id_set and rule_ids:
             if specialty_id_set.intersection(rule_ids):
                 return rule
         if name_terms:
-            rule_names = _split_terms(rule.specialty)
+            rule_names = split_terms(rule.specialty)
             if any(name in rule_names for name in name_terms):
                 return rule
     return None
@@ -148,6 +193,49 @@ def resolve_draw_method(draw: DrawApplication, rule) -> str:
     return "random"
 
 
+def as_utc(value: datetime) -> datetime:
+    # SQLite drops the offset; stored values are treated as UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _job_run_at(draw: DrawApplication) -> datetime | None:
+    if (
+        draw.status != "pending"
+        or draw.executed_at is not None
+        or draw.review_time is None
+    ):
+        return None
+    # A stable per-draw offset spreads draws sharing a review time (e.g. the
+    # 9:00 peak) across the window instead of firing them all at once.
+    spread = settings.scheduler_spread_minutes * 60
+    offset = (draw.id * 2654435761) % 2**32 * spread // 2**32
+    return (
+        as_utc(draw.review_time)
+        - timedelta(minutes=settings.scheduler_lead_minutes)
+        - timedelta(seconds=offset)
+    )
+
+
+def _sync_draw_job(draw: DrawApplication) -> None:
+    run_at = _job_run_at(draw)
+    job = draw.job
+    if run_at is None:
+        if job is not None and job.status == "queued":
+            job.status = "cancelled"
+        return
+    if job is None:
+        draw.job = DrawJob(run_at=run_at, status="queued")
+        return
+    if job.status == "running":
+        return
+    job.run_at = run_at
+    job.status = "queued"
+    job.attempts = 0
+    job.last_error = None
+
+
 def _resolve_total_count(expert_count: int, total_count: int | None) -> int:
     resolved = total_count if total_count is not None else expert_count
     if resolved < expert_count:
@@ -159,27 +247,30 @@ def _resolve_total_count(expert_count: int, total_count: int | None) -> int:
 
 
 def pick_experts(
-    candidates: list[Expert], total_needed: int, draw_method: str
-) -> list[Expert]:
+    candidates: list[int], total_needed: int, draw_method: str
+) -> list[int]:
     if draw_method == "random":
         return random.sample(candidates, total_needed)
     if draw_method == "lottery":
-        tickets = [(random.random(), expert) for expert in candidates]
+        tickets = [(random.random(), expert_id) for expert_id in candidates]
         tickets.sort(key=lambda item: item[0])
-        return [expert for _, expert in tickets[:total_needed]]
+        return [expert_id for _, expert_id in tickets[:total_needed]]
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail="Unsupported draw method",
     )
 
 
-def list_draws(db: Session, params: PageParams) -> tuple[list[DrawApplication], int]:
+def list_draws(
+    db: Session, params: PageParams, fields: set[str] | None = None
+) -> tuple[list[DrawApplication], int]:
     return DrawRepo(db).list_page(
         params.keyword,
         params.sort_by,
         params.sort_order,
         params.page,
         params.page_size,
+        fields,
     )
 
 
@@ -190,6 +281,20 @@ def get_draw(db: Session, draw_id: int) -> DrawApplication:
     return draw
 
 
+def _lock_draw(db: Session, draw_id: int) -> DrawApplication:
+    # Contact updates and replacements adjust accepted_count from the current
+    # results; the row lock serializes them per draw.
+    draw = db.execute(
+        select(DrawApplication)
+        .where(DrawApplication.id == draw_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+    if draw is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Draw not found")
+    return draw
+
+
 def create_draw(db: Session, payload: DrawApply, created_by_id: int | None) -> DrawApplication:
     data = payload.model_dump()
     rule_id = data.get("rule_id")
@@ -218,6 +323,8 @@ def create_draw(db: Session, payload: DrawApply, created_by_id: int | None) -> D
     draw.specialty = rule.specialty
 
     db.add(draw)
+    db.flush()
+    _sync_draw_job(draw)
     db.commit()
     db.refresh(draw)
     return draw
@@ -282,9 +389,19 @@ def update_draw(db: Session, draw_id: int, payload: DrawUpdate) -> DrawApplicati
         reset_results = True
     if reset_results:
         db.execute(delete(DrawResult).where(DrawResult.draw_id == draw_id))
+        draw.executed_at = None
+        draw.execution_key = None
+        draw.accepted_count = 0
+        db.execute(
+            delete(DrawCandidateSnapshot).where(
+                DrawCandidateSnapshot.draw_id == draw_id
+            )
+        )
+        candidate_pools.discard(draw_id)
         if "status" not in update_data and draw.status != "cancelled":
             draw.status = "pending"
 
+    _sync_draw_job(draw)
     db.commit()
     db.refresh(draw)
     return draw
@@ -294,6 +411,7 @@ def delete_draw(db: Session, draw_id: int) -> None:
     draw = get_draw(db, draw_id)
     db.delete(draw)
     db.commit()
+    candidate_pools.discard(draw_id)
 
 
 def delete_draws(db: Session, draw_ids: list[int]) -> dict[str, int]:
@@ -308,11 +426,29 @@ def delete_draws(db: Session, draw_ids: list[int]) -> dict[str, int]:
     if not existing:
         return {"deleted": 0, "skipped": len(unique_ids)}
     db.execute(delete(DrawResult).where(DrawResult.draw_id.in_(existing)))
+    db.execute(
+        delete(DrawCandidateSnapshot).where(
+            DrawCandidateSnapshot.draw_id.in_(existing)
+        )
+    )
+    db.execute(delete(DrawJob).where(DrawJob.draw_id.in_(existing)))
     db.execute(delete(DrawApplication).where(DrawApplication.id.in_(existing)))
     db.commit()
+    for draw_id in existing:
+        candidate_pools.discard(draw_id)
     return {"deleted": len(existing), "skipped": len(unique_ids) - len(existing)}
 
 
+def get_draw_status(db: Session, draw_id: int) -> dict:
+    draw = get_draw(db, draw_id)
+    return {
+        "draw_id": draw.id,
+        "status": draw.status,
+        "accepted_count": draw.accepted_count,
+        "executed_at": draw.executed_at,
+    }
+
+
 def list_results(db: Session, draw_id: int) -> list[DrawResult]:
     _ = get_draw(db, draw_id)
     stmt = (
@@ -550,14 +686,13 @@ def export_signin_sheet(db: Session, draw_id: int) -> BytesIO:
 
 
 def list_results_page(
-    db: Session, draw_id: int, params: PageParams
+    db: Session, draw_id: int, params: PageParams, fields: set[str] | None = None
 ) -> tuple[list[DrawResult], int]:
     _ = get_draw(db, draw_id)
-    stmt = (
-        select(DrawResult)
-        .where(DrawResult.draw_id == draw_id)
-        .options(selectinload(DrawResult.expert))
-    )
+    with_expert = fields is None or "expert" in fields
+    stmt = select(DrawResult).where(DrawResult.draw_id == draw_id)
+    if with_expert:
+        stmt = stmt.options(selectinload(DrawResult.expert))
     if params.keyword:
         stmt = stmt.join(Expert, Expert.id == DrawResult.expert_id, isouter=True)
         stmt = apply_keyword(
@@ -577,19 +712,335 @@ def list_results_page(
         )
     else:
         stmt = stmt.order_by(DrawResult.is_backup, DrawResult.ordinal, DrawResult.id)
+    stmt = load_fields(stmt, DrawResult, fields)
     items, total = paginate(db, stmt, params.page, params.page_size)
-    experts = [result.expert for result in items if result.expert]
-    expert_service._attach_expert_details(db, experts)
+    if with_expert:
+        experts = [result.expert for result in items if result.expert]
+        # DrawResultExpert carries specialties but no documents.
+        expert_service._attach_expert_details(db, experts, documents=False)
     return items, total
 
 
-def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
+@dataclass
+class CandidateCriteria:
+    specialty_ids: list[int] = field(default_factory=list)
+    specialty_names: list[str] = field(default_factory=list)
+    title_filtered: bool = False
+    title_ids: list[int] = field(default_factory=list)
+    title_names: list[str] = field(default_factory=list)
+    region_filtered: bool = False
+    region_ids: list[int] = field(default_factory=list)
+    region_names: list[str] = field(default_factory=list)
+    avoid_unit_ids: list[int] = field(default_factory=list)
+    avoid_unit_names: list[str] = field(default_factory=list)
+    avoid_person_ids: list[int] = field(default_factory=list)
+
+
+class CandidateLookup(Protocol):
+    def expand_specialties(self, specialty_ids: list[int]) -> list[int]: ...
+
+    def expand_titles(self, title_ids: list[int]) -> list[int]: ...
+
+    def organization_ids(self, names: list[str]) -> list[int]: ...
+
+    def existing_expert_ids(self, expert_ids: list[int]) -> set[int]: ...
+
+
+class _DbCandidateLookup:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def expand_specialties(self, specialty_ids: list[int]) -> list[int]:
+        return specialty_service.expand_to_leaf_ids(self.db, specialty_ids)
+
+    def expand_titles(self, title_ids: list[int]) -> list[int]:
+        return title_service.expand_to_leaf_ids(self.db, title_ids)
+
+    def organization_ids(self, names: list[str]) -> list[int]:
+        return list(
+            self.db.execute(select(Organization.id).where(Organization.name.in_(names)))
+            .scalars()
+            .all()
+        )
+
+    def existing_expert_ids(self, expert_ids: list[int]) -> set[int]:
+        return set(
+            self.db.execute(select(Expert.id).where(Expert.id.in_(expert_ids)))
+            .scalars()
+            .all()
+        )
+
+
+def build_candidate_criteria(
+    lookup: CandidateLookup,
+    rule: Rule,
+    avoid_units: str | None,
+    avoid_persons: str | None,
+) -> CandidateCriteria:
+    criteria = CandidateCriteria()
+    criteria.specialty_ids = lookup.expand_specialties(unique_ints(rule.specialty_ids))
+    if not criteria.specialty_ids:
+        criteria.specialty_names = split_terms(rule.specialty)
+
+    # Experts without any title always pass a title requirement.
+    criteria.title_ids = lookup.expand_titles(unique_ints(rule.title_required_ids))
+    criteria.title_names = split_terms(rule.title_required)
+    criteria.title_filtered = bool(criteria.title_ids or rule.title_required)
+
+    region_required_ids = unique_ints(rule.region_required_ids)
+    region_names = split_terms(rule.region_required)
+    if region_required_ids:
+        criteria.region_ids = region_required_ids
+        criteria.region_names = region_names
+    elif rule.region_required_id is not None:
+        criteria.region_ids = [rule.region_required_id]
+    elif rule.region_required:
+        criteria.region_names = region_names
+    criteria.region_filtered = bool(criteria.region_ids or rule.region_required)
+
+    avoid_unit_ids, avoid_unit_names = _split_numeric_terms(avoid_units)
+    if avoid_unit_names:
+        for org_id in lookup.organization_ids(avoid_unit_names):
+            if org_id not in avoid_unit_ids:
+                avoid_unit_ids.append(org_id)
+    criteria.avoid_unit_ids = avoid_unit_ids
+    criteria.avoid_unit_names = avoid_unit_names
+
+    avoid_person_ids, invalid_person_terms = _split_person_terms(avoid_persons)
+    if invalid_person_terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="回避人员必须选择专家",
+        )
+    if avoid_person_ids:
+        existing = lookup.existing_expert_ids(avoid_person_ids)
+        missing = [item for item in avoid_person_ids if item not in existing]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="回避人员不存在",
+            )
+    criteria.avoid_person_ids = avoid_person_ids
+    return criteria
+
+
+def _candidate_stmt(criteria: CandidateCriteria):
+    stmt = select(Expert.id).where(Expert.is_active.is_(True)).distinct()
+    if criteria.specialty_ids or criteria.specialty_names:
+        stmt = stmt.join(
+            ExpertSpecialty, ExpertSpecialty.expert_id == Expert.id
+        ).join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
+        if criteria.specialty_ids:
+            stmt = stmt.where(Specialty.id.in_(criteria.specialty_ids))
+        else:
+            stmt = stmt.where(Specialty.name.in_(criteria.specialty_names))
+
+    if criteria.title_filtered:
+        title_filters = []
+        if criteria.title_ids:
+            title_filters.append(Expert.title_id.in_(criteria.title_ids))
+        if criteria.title_names:
+            title_filters.append(Expert.title.in_(criteria.title_names))
+        title_filters.append(Expert.title_id.is_(None) & Expert.title.is_(None))
+        stmt = stmt.where(or_(*title_filters))
+
+    if criteria.region_filtered:
+        region_filters = []
+        if criteria.region_ids:
+            region_filters.append(Expert.region_id.in_(criteria.region_ids))
+        if criteria.region_names or not criteria.region_ids:
+            region_filters.append(Expert.region.in_(criteria.region_names))
+        stmt = stmt.where(or_(*region_filters))
+
+    unit_filters = []
+    if criteria.avoid_unit_ids:
+        unit_filters.append(
+            or_(
+                Expert.organization_id.is_(None),
+                ~Expert.organization_id.in_(criteria.avoid_unit_ids),
+            )
+        )
+    if criteria.avoid_unit_names:
+        unit_filters.append(
+            or_(
+                Expert.company.is_(None),
+                ~Expert.company.in_(criteria.avoid_unit_names),
+            )
+        )
+    if unit_filters:
+        stmt = stmt.where(and_(*unit_filters))
+
+    if criteria.avoid_person_ids:
+        stmt = stmt.where(~Expert.id.in_(criteria.avoid_person_ids))
+    return stmt
+
+
+def _query_candidate_ids(
+    db: Session, draw: DrawApplication, rule: Rule
+) -> list[int]:
+    criteria = build_candidate_criteria(
+        _DbCandidateLookup(db), rule, draw.avoid_units, draw.avoid_persons
+    )
+    return list(db.execute(_candidate_stmt(criteria)).scalars().all())
+
+
+def preview_candidate_pool(
+    db: Session,
+    rule_id: int,
+    avoid_units: str | None = None,
+    avoid_persons: str | None = None,
+    expert_count: int | None = None,
+    backup_count: int = 0,
+) -> dict:
+    rule = RuleRepo(db).get_by_id(rule_id)
+    if rule is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Rule not found"
+        )
+    index = eligibility.get_index(db)
+    try:
+        criteria = build_candidate_criteria(index, rule, avoid_units, avoid_persons)
+    except eligibility.StaleIndexError:
+        # The rule or draw refers to rows newer than the index: resolve them
+        # from the database (404/400 if they really are gone) and rebuild.
+        criteria = build_candidate_criteria(
+            _DbCandidateLookup(db), rule, avoid_units, avoid_persons
+        )
+        index = eligibility.rebuild(db)
+    eligible = index.eligible_ids(criteria)
+    required = expert_count + (backup_count or 0) if expert_count is not None else None
+    return {
+        "rule_id": rule.id,
+        "eligible_count": len(eligible),
+        "required_count": required,
+        "feasible": None if required is None else len(eligible) >= required,
+        **index.breakdown(eligible, criteria.specialty_ids),
+    }
+
+
+def _candidate_filters(draw: DrawApplication, rule: Rule) -> dict:
+    return {
+        "rule_id": rule.id,
+        "specialty_ids": unique_ints(rule.specialty_ids),
+        "specialty": rule.specialty,
+        "title_required_ids": unique_ints(rule.title_required_ids),
+        "title_required": rule.title_required,
+        "region_required_ids": unique_ints(rule.region_required_ids),
+        "region_required_id": rule.region_required_id,
+        "region_required": rule.region_required,
+        "avoid_units": draw.avoid_units,
+        "avoid_persons": draw.avoid_persons,
+    }
+
+
+def _filter_signature(filters: dict) -> str:
+    payload = json.dumps(filters, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_snapshot(db: Session, draw_id: int) -> DrawCandidateSnapshot | None:
+    return db.execute(
+        select(DrawCandidateSnapshot).where(DrawCandidateSnapshot.draw_id == draw_id)
+    ).scalar_one_or_none()
+
+
+def _excluded_ids(snapshot: DrawCandidateSnapshot | None) -> set[int]:
+    if snapshot is None or not snapshot.excluded_ids:
+        return set()
+    return set(unpack_ids(snapshot.excluded_ids))
+
+
+def _get_candidate_pool(
+    db: Session, draw: DrawApplication, rule: Rule
+) -> list[int]:
+    # The pool is frozen when the draw first needs it: later rule edits do not
+    # change who was eligible for this draw. The stored checksum decides
+    # whether the cached copy is still that snapshot.
+    checksum = db.execute(
+        select(DrawCandidateSnapshot.checksum).where(
+            DrawCandidateSnapshot.draw_id == draw.id
+        )
+    ).scalar_one_or_none()
+    if checksum is not None:
+        pool = candidate_pools.get(draw.id, checksum)
+        if pool is not None:
+            return pool
+        snapshot = _get_snapshot(db, draw.id)
+        if snapshot is not None:
+            pool = unpack_ids(snapshot.expert_ids)
+            candidate_pools.put(draw.id, snapshot.checksum, pool)
+            return pool
+    pool = _query_candidate_ids(db, draw, rule)
+    filters = _candidate_filters(draw, rule)
+    db.add(
+        DrawCandidateSnapshot(
+            draw_id=draw.id,
+            signature=_filter_signature(filters),
+            filters=filters,
+            expert_total=len(pool),
+            expert_ids=pack_ids(pool),
+            checksum=ids_checksum(pool),
+        )
+    )
+    return pool
+
+
+def get_candidate_snapshot(db: Session, draw_id: int, include_ids: bool) -> dict:
+    _ = get_draw(db, draw_id)
+    snapshot = _get_snapshot(db, draw_id)
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot not found"
+        )
+    expert_ids = unpack_ids(snapshot.expert_ids)
+    pool = set(expert_ids)
+    drawn_ids = (
+        db.execute(select(DrawResult.expert_id).where(DrawResult.draw_id == draw_id))
+        .scalars()
+        .all()
+    )
+    return {
+        "draw_id": draw_id,
+        "signature": snapshot.signature,
+        "filters": snapshot.filters,
+        "expert_total": snapshot.expert_total,
+        "checksum": snapshot.checksum,
+        "checksum_valid": ids_checksum(expert_ids) == snapshot.checksum,
+        "results_in_pool": all(item in pool for item in drawn_ids),
+        "created_at": snapshot.created_at,
+        "expert_ids": expert_ids if include_ids else None,
+    }
+
+
+def _claim_draw_execution(
+    db: Session, draw: DrawApplication, idempotency_key: str | None
+) -> bool:
+    # Compare-and-swap on executed_at: concurrent callers block on the row
+    # lock and see zero affected rows once the winner commits.
+    claimed = db.execute(
+        update(DrawApplication)
+        .where(
+            DrawApplication.id == draw.id,
+            DrawApplication.executed_at.is_(None),
+            DrawApplication.status != "cancelled",
+        )
+        .values(executed_at=datetime.now(timezone.utc), execution_key=idempotency_key)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    return claimed == 1
+
+
+def execute_draw(
+    db: Session, draw_id: int, idempotency_key: str | None = None
+) -> list[DrawResult]:
     draw = get_draw(db, draw_id)
     if draw.status == "cancelled":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Draw already completed or cancelled",
         )
+    if idempotency_key and draw.execution_key == idempotency_key:
+        return list_results(db, draw.id)
 
     existing_results = (
         db.execute(select(DrawResult).where(DrawResult.draw_id == draw.id))
@@ -616,8 +1067,11 @@ def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
                 if result.contact_status is None:
                     result.contact_status = CONTACT_STATUS_ACCEPTED
                     updated = True
+            if updated:
+                _recount_accepted(draw, existing_results)
         else:
             if has_confirmed:
+                _recount_accepted(draw, existing_results)
                 _apply_completion_status(db, draw)
                 updated = True
             else:
@@ -630,10 +1084,23 @@ def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
                         updated = True
         if updated:
             db.commit()
-        return list_results(db, draw.id)
+        results = list_results(db, draw.id)
+        if updated:
+            _publish_results(db, draw, results)
+        return results
     if draw.status == "completed":
         return list_results(db, draw.id)
 
+    if not _claim_draw_execution(db, draw, idempotency_key):
+        db.rollback()
+        draw = get_draw(db, draw_id)
+        if draw.status == "cancelled":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Draw already completed or cancelled",
+            )
+        return list_results(db, draw.id)
+
     rule = RuleRepo(db).get_by_id(draw.rule_id) if draw.rule_id else None
     if rule is None:
         raise HTTPException(
@@ -641,117 +1108,7 @@ def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
             detail="Rule is required",
         )
 
-    stmt = select(Expert).where(Expert.is_active.is_(True)).distinct()
-    specialty_ids = specialty_service.expand_to_leaf_ids(
-        db, _unique_ints(rule.specialty_ids)
-    )
-    specialty_names = _split_terms(rule.specialty) if not specialty_ids else []
-    if specialty_ids or specialty_names:
-        stmt = stmt.join(
-            ExpertSpecialty, ExpertSpecialty.expert_id == Expert.id
-        ).join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
-        if specialty_ids:
-            stmt = stmt.where(Specialty.id.in_(specialty_ids))
-        else:
-            stmt = stmt.where(Specialty.name.in_(specialty_names))
-
-    title_required_ids = title_service.expand_to_leaf_ids(
-        db, _unique_ints(rule.title_required_ids)
-    )
-    title_names = _split_terms(rule.title_required)
-    if title_required_ids:
-        if title_names:
-            stmt = stmt.where(
-                or_(
-                    Expert.title_id.in_(title_required_ids),
-                    Expert.title.in_(title_names),
-                    (Expert.title_id.is_(None) & Expert.title.is_(None)),
-                )
-            )
-        else:
-            stmt = stmt.where(
-                or_(
-                    Expert.title_id.in_(title_required_ids),
-                    (Expert.title_id.is_(None) & Expert.title.is_(None)),
-                )
-            )
-    elif rule.title_required:
-        stmt = stmt.where(
-            or_(
-                Expert.title.in_(title_names),
-                (Expert.title_id.is_(None) & Expert.title.is_(None)),
-            )
-        )
-
-    region_required_ids = _unique_ints(rule.region_required_ids)
-    region_names = _split_terms(rule.region_required)
-    if region_required_ids:
-        if region_names:
-            stmt = stmt.where(
-                or_(
-                    Expert.region_id.in_(region_required_ids),
-                    Expert.region.in_(region_names),
-                )
-            )
-        else:
-            stmt = stmt.where(Expert.region_id.in_(region_required_ids))
-    elif rule.region_required_id is not None:
-        stmt = stmt.where(Expert.region_id == rule.region_required_id)
-    elif rule.region_required:
-        stmt = stmt.where(Expert.region.in_(region_names))
-    avoid_unit_ids, avoid_unit_names = _split_numeric_terms(draw.avoid_units)
-    if avoid_unit_names:
-        matched_ids = (
-            db.execute(
-                select(Organization.id).where(Organization.name.in_(avoid_unit_names))
-            )
-            .scalars()
-            .all()
-        )
-        for org_id in matched_ids:
-            if org_id not in avoid_unit_ids:
-                avoid_unit_ids.append(org_id)
-    unit_filters = []
-    if avoid_unit_ids:
-        unit_filters.append(
-            or_(
-                Expert.organization_id.is_(None),
-                ~Expert.organization_id.in_(avoid_unit_ids),
-            )
-        )
-    if avoid_unit_names:
-        unit_filters.append(
-            or_(
-                Expert.company.is_(None),
-                ~Expert.company.in_(avoid_unit_names),
-            )
-        )
-    if unit_filters:
-        stmt = stmt.where(and_(*unit_filters))
-
-    avoid_person_ids, invalid_person_terms = _split_person_terms(draw.avoid_persons)
-    if invalid_person_terms:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="回避人员必须选择专家",
-        )
-    if avoid_person_ids:
-        existing = set(
-            db.execute(
-                select(Expert.id).where(Expert.id.in_(avoid_person_ids))
-            )
-            .scalars()
-            .all()
-        )
-        missing = [item for item in avoid_person_ids if item not in existing]
-        if missing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="回避人员不存在",
-            )
-        stmt = stmt.where(~Expert.id.in_(avoid_person_ids))
-
-    candidates = list(db.execute(stmt).scalars().all())
+    candidates = _get_candidate_pool(db, draw, rule)
     backup_count = draw.backup_count or 0
     total_needed = draw.expert_count + backup_count
     if len(candidates) < total_needed:
@@ -767,11 +1124,11 @@ def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
             detail="Unsupported draw method",
         )
     chosen = pick_experts(candidates, total_needed, method)
-    for index, expert in enumerate(chosen, start=1):
+    for index, expert_id in enumerate(chosen, start=1):
         is_backup = index > draw.expert_count
         result = DrawResult(
             draw_id=draw.id,
-            expert_id=expert.id,
+            expert_id=expert_id,
             is_backup=is_backup,
             contact_status=CONTACT_STATUS_PENDING,
             ordinal=index,
@@ -780,35 +1137,136 @@ def execute_draw(db: Session, draw_id: int) -> list[DrawResult]:
 
     draw.draw_method = method
     draw.status = "scheduled"
+    draw.accepted_count = 0
     db.commit()
 
-    return list_results(db, draw.id)
+    results = list_results(db, draw.id)
+    _publish_results(db, draw, results)
+    return results
 
 
-def _apply_completion_status(db: Session, draw: DrawApplication) -> None:
-    if draw.status == "cancelled":
+def _is_accepted(result: DrawResult) -> bool:
+    return not result.is_backup and result.contact_status == CONTACT_STATUS_ACCEPTED
+
+
+def _recount_accepted(draw: DrawApplication, results: list[DrawResult]) -> None:
+    draw.accepted_count = sum(1 for result in results if _is_accepted(result))
+
+
+def _adjust_accepted(db: Session, draw: DrawApplication, delta: int) -> None:
+    if not delta:
         return
-    db.flush()
-    accepted_count = (
-        db.execute(
-            select(func.count())
-            .select_from(DrawResult)
+    db.execute(
+        update(DrawApplication)
+        .where(DrawApplication.id == draw.id)
+        .values(accepted_count=DrawApplication.accepted_count + delta)
+        .execution_options(synchronize_session=False)
+    )
+    db.refresh(draw, ["accepted_count"])
+
+
+def remove_expert_results(db: Session, expert_ids: list[int]) -> None:
+    """Delete the results of experts that are being deleted.
+
+    The foreign key would cascade the rows away on its own, but accepted_count
+    is stored on the draw and must lose the accepted results explicitly.
+    """
+    accepted: dict[int, int] = defaultdict(int)
+    for chunk in chunked(expert_ids):
+        rows = db.execute(
+            select(DrawResult.draw_id, func.count())
             .where(
-                DrawResult.draw_id == draw.id,
+                DrawResult.expert_id.in_(chunk),
                 DrawResult.is_backup.is_(False),
                 DrawResult.contact_status == CONTACT_STATUS_ACCEPTED,
             )
+            .group_by(DrawResult.draw_id)
         )
-        .scalar_one()
-    )
-    if accepted_count >= draw.expert_count:
+        for draw_id, count in rows:
+            accepted[draw_id] += count
+        db.execute(delete(DrawResult).where(DrawResult.expert_id.in_(chunk)))
+    for draw_id, count in accepted.items():
+        db.execute(
+            update(DrawApplication)
+            .where(DrawApplication.id == draw_id)
+            .values(accepted_count=DrawApplication.accepted_count - count)
+            .execution_options(synchronize_session=False)
+        )
+    for chunk in chunked(list(accepted)):
+        db.execute(
+            update(DrawApplication)
+            .where(
+                DrawApplication.id.in_(chunk),
+                DrawApplication.status == "completed",
+                DrawApplication.accepted_count < DrawApplication.expert_count,
+            )
+            .values(status="scheduled")
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _apply_completion_status(db: Session, draw: DrawApplication) -> None:
+    if draw.status == "cancelled":
+        return
+    if draw.accepted_count >= draw.expert_count:
         draw.status = "completed"
     else:
         draw.status = "scheduled"
 
 
-def replace_draw_result(db: Session, draw_id: int, result_id: int) -> list[DrawResult]:
-    draw = get_draw(db, draw_id)
+def _result_delta(
+    db: Session,
+    draw: DrawApplication,
+    changed_ids: list[int],
+    removed_ids: list[int] | None = None,
+) -> dict:
+    changed: list[DrawResult] = []
+    if changed_ids:
+        changed = list(
+            db.execute(
+                select(DrawResult)
+                .where(DrawResult.id.in_(changed_ids))
+                .options(selectinload(DrawResult.expert))
+                .order_by(DrawResult.is_backup, DrawResult.ordinal)
+            )
+            .scalars()
+            .all()
+        )
+        experts = [result.expert for result in changed if result.expert]
+        expert_service._attach_expert_details(db, experts)
+    return {
+        "draw_id": draw.id,
+        "status": draw.status,
+        "accepted_count": draw.accepted_count,
+        "changed": changed,
+        "removed_ids": removed_ids or [],
+    }
+
+
+def _publish_delta(db: Session, delta: dict) -> dict:
+    payload = DrawResultDelta.model_validate(delta).model_dump(mode="json")
+    draw_events.publish(db, delta["draw_id"], "results", payload)
+    return delta
+
+
+def _publish_results(
+    db: Session, draw: DrawApplication, results: list[DrawResult]
+) -> None:
+    """Publish a full result set, e.g. after execution, as a delta event."""
+    _publish_delta(
+        db,
+        {
+            "draw_id": draw.id,
+            "status": draw.status,
+            "accepted_count": draw.accepted_count,
+            "changed": results,
+            "removed_ids": [],
+        }
+    )
+
+
+def replace_draw_result(db: Session, draw_id: int, result_id: int) -> dict:
+    draw = _lock_draw(db, draw_id)
     if draw.status == "cancelled":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -845,7 +1303,19 @@ def replace_draw_result(db: Session, draw_id: int, result_id: int) -> list[DrawR
             detail="No backup experts available",
         )
 
+    snapshot = _get_snapshot(db, draw.id)
+    rule = RuleRepo(db).get_by_id(draw.rule_id) if draw.rule_id else None
+    if snapshot is None and rule is not None:
+        # Draws executed before snapshots existed get one now, so later
+        # top-ups still know who was replaced.
+        _get_candidate_pool(db, draw, rule)
+        db.flush()
+        snapshot = _get_snapshot(db, draw.id)
+    if snapshot is not None:
+        snapshot.excluded_ids = pack_ids(_excluded_ids(snapshot) | {target.expert_id})
+
     target_ordinal = target.ordinal
+    _adjust_accepted(db, draw, -int(_is_accepted(target)))
     db.delete(target)
     backup.is_backup = False
     backup.is_replacement = True
@@ -853,9 +1323,101 @@ def replace_draw_result(db: Session, draw_id: int, result_id: int) -> list[DrawR
     if target_ordinal is not None:
         backup.ordinal = target_ordinal
     _apply_completion_status(db, draw)
+    backup_id = backup.id
     db.commit()
 
-    return list_results(db, draw.id)
+    return _publish_delta(db, _result_delta(db, draw, [backup_id], [result_id]))
+
+
+def top_up_draw_backups(db: Session, draw_id: int, count: int) -> dict:
+    draw = get_draw(db, draw_id)
+    if draw.status == "cancelled":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Draw already completed or cancelled",
+        )
+    rule = RuleRepo(db).get_by_id(draw.rule_id) if draw.rule_id else None
+    if rule is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Rule is required",
+        )
+
+    # Bumping backup_count first takes the draw row lock, so concurrent
+    # top-ups see each other's picks.
+    db.execute(
+        update(DrawApplication)
+        .where(DrawApplication.id == draw.id)
+        .values(backup_count=DrawApplication.backup_count + count)
+        .execution_options(synchronize_session=False)
+    )
+    existing = db.execute(
+        select(DrawResult.expert_id, DrawResult.ordinal).where(
+            DrawResult.draw_id == draw.id
+        )
+    ).all()
+    if not existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Draw has not been executed",
+        )
+    # Replaced experts no longer have a result row but must not come back.
+    drawn_ids = {row.expert_id for row in existing}
+    drawn_ids |= _excluded_ids(_get_snapshot(db, draw.id))
+    next_ordinal = max((row.ordinal or 0 for row in existing), default=0) + 1
+
+    method = resolve_draw_method(draw, rule)
+    if method not in SUPPORTED_DRAW_METHODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported draw method",
+        )
+    chosen: list[int] = []
+    available = [
+        item for item in _get_candidate_pool(db, draw, rule) if item not in drawn_ids
+    ]
+    while len(chosen) < count:
+        needed = count - len(chosen)
+        if len(available) < needed:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Not enough qualified experts",
+            )
+        picked = pick_experts(available, needed, method)
+        # The pool is cached for the draw's lifetime, so drop experts that
+        # were deactivated since it was built.
+        active = set(
+            db.execute(
+                select(Expert.id).where(
+                    Expert.id.in_(picked), Expert.is_active.is_(True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        inactive = {item for item in picked if item not in active}
+        if inactive:
+            candidate_pools.discard(draw.id, inactive)
+        chosen.extend(item for item in picked if item in active)
+        picked_ids = set(picked)
+        available = [item for item in available if item not in picked_ids]
+
+    results = [
+        DrawResult(
+            draw_id=draw.id,
+            expert_id=expert_id,
+            is_backup=True,
+            contact_status=CONTACT_STATUS_PENDING,
+            ordinal=ordinal,
+        )
+        for ordinal, expert_id in enumerate(chosen, start=next_ordinal)
+    ]
+    db.add_all(results)
+    db.flush()
+    result_ids = [result.id for result in results]
+    db.commit()
+
+    return _publish_delta(db, _result_delta(db, draw, result_ids))
 
 
 def get_draw_result_contact(
@@ -894,8 +1456,8 @@ def update_draw_result_contact(
     result_id: int,
     status_value: str,
     auto_replace: bool,
-) -> list[DrawResult]:
-    draw = get_draw(db, draw_id)
+) -> dict:
+    draw = _lock_draw(db, draw_id)
     if draw.status == "cancelled":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -928,7 +1490,12 @@ def update_draw_result_contact(
     if status_value == CONTACT_STATUS_REJECTED and auto_replace:
         return replace_draw_result(db, draw_id, result_id)
 
+    _adjust_accepted(
+        db,
+        draw,
+        int(status_value == CONTACT_STATUS_ACCEPTED) - int(_is_accepted(result)),
+    )
     result.contact_status = status_value
     _apply_completion_status(db, draw)
     db.commit()
-    return list_results(db, draw.id)
+    return _publish_delta(db, _result_delta(db, draw, [result_id]))
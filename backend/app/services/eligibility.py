@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.organization import Organization
+from app.models.region import Region
+from app.models.specialty import Specialty
+from app.models.title import Title
+
+if TYPE_CHECKING:
+    from app.services.draws import CandidateCriteria
+
+
+class StaleIndexError(LookupError):
+    """The index does not know an id the caller asked about.
+
+    Usually the row was created after the index was built; callers resolve
+    the ids against the database instead and rebuild.
+    """
+
+
+@dataclass
+class _ExpertRow:
+    organization_id: int | None
+    company: str | None
+    region_id: int | None
+    region: str | None
+    title_id: int | None
+    title: str | None
+    specialty_ids: tuple[int, ...] = ()
+
+
+@dataclass
+class EligibilityIndex:
+    """In-memory eligibility data for active experts, used by draw previews.
+
+    Implements the draw service's candidate lookup so rule criteria resolve
+    against the same snapshot without touching the database.
+    """
+
+    built_at: float
+    experts: dict[int, _ExpertRow]
+    all_expert_ids: set[int]
+    by_specialty: dict[int, set[int]]
+    specialty_parents: dict[int, int | None]
+    specialty_names: dict[int, str]
+    title_parents: dict[int, int | None]
+    title_names: dict[int, str]
+    region_names: dict[int, str]
+    organization_ids_by_name: dict[str, list[int]]
+    _specialty_children: dict[int | None, list[int]] = field(default_factory=dict)
+    _title_children: dict[int | None, list[int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._specialty_children = _children_map(self.specialty_parents)
+        self._title_children = _children_map(self.title_parents)
+
+    def expand_specialties(self, specialty_ids: list[int]) -> list[int]:
+        return _expand(
+            specialty_ids, self.specialty_parents, self._specialty_children, "Specialty"
+        )
+
+    def expand_titles(self, title_ids: list[int]) -> list[int]:
+        return _expand(title_ids, self.title_parents, self._title_children, "Title")
+
+    def organization_ids(self, names: list[str]) -> list[int]:
+        ids: list[int] = []
+        for name in names:
+            ids.extend(self.organization_ids_by_name.get(name, []))
+        return ids
+
+    def existing_expert_ids(self, expert_ids: list[int]) -> set[int]:
+        existing = {item for item in expert_ids if item in self.all_expert_ids}
+        if len(existing) < len(set(expert_ids)):
+            raise StaleIndexError("Expert")
+        return existing
+
+    def eligible_ids(self, criteria: CandidateCriteria) -> set[int]:
+        if criteria.specialty_ids:
+            pool: set[int] = set()
+            for specialty_id in criteria.specialty_ids:
+                pool |= self.by_specialty.get(specialty_id, set())
+        elif criteria.specialty_names:
+            names = set(criteria.specialty_names)
+            pool = set()
+            for specialty_id, name in self.specialty_names.items():
+                if name in names:
+                    pool |= self.by_specialty.get(specialty_id, set())
+        else:
+            pool = set(self.experts)
+
+        title_ids = set(criteria.title_ids)
+        title_names = set(criteria.title_names)
+        region_ids = set(criteria.region_ids)
+        region_names = set(criteria.region_names)
+        avoid_unit_ids = set(criteria.avoid_unit_ids)
+        avoid_unit_names = set(criteria.avoid_unit_names)
+        pool.difference_update(criteria.avoid_person_ids)
+
+        eligible: set[int] = set()
+        for expert_id in pool:
+            row = self.experts[expert_id]
+            if criteria.title_filtered and not (
+                row.title_id in title_ids
+                or row.title in title_names
+                or (row.title_id is None and row.title is None)
+            ):
+                continue
+            if criteria.region_filtered and not (
+                row.region_id in region_ids or row.region in region_names
+            ):
+                continue
+            if row.organization_id is not None and row.organization_id in avoid_unit_ids:
+                continue
+            if row.company is not None and row.company in avoid_unit_names:
+                continue
+            eligible.add(expert_id)
+        return eligible
+
+    def breakdown(
+        self, expert_ids: set[int], specialty_ids: list[int]
+    ) -> dict[str, list[dict[str, object]]]:
+        restrict = set(specialty_ids)
+        specialties: Counter[int] = Counter()
+        regions: Counter[tuple[int | None, str | None]] = Counter()
+        titles: Counter[tuple[int | None, str | None]] = Counter()
+        for expert_id in expert_ids:
+            row = self.experts[expert_id]
+            for specialty_id in row.specialty_ids:
+                if not restrict or specialty_id in restrict:
+                    specialties[specialty_id] += 1
+            region_name = self.region_names.get(row.region_id) if row.region_id else None
+            regions[(row.region_id, region_name or row.region)] += 1
+            title_name = self.title_names.get(row.title_id) if row.title_id else None
+            titles[(row.title_id, title_name or row.title)] += 1
+        return {
+            "by_specialty": [
+                {"id": key, "name": self.specialty_names.get(key), "count": count}
+                for key, count in specialties.most_common()
+            ],
+            "by_region": [
+                {"id": key[0], "name": key[1], "count": count}
+                for key, count in regions.most_common()
+            ],
+            "by_title": [
+                {"id": key[0], "name": key[1], "count": count}
+                for key, count in titles.most_common()
+            ],
+        }
+
+
+def _children_map(parents: dict[int, int | None]) -> dict[int | None, list[int]]:
+    children: dict[int | None, list[int]] = defaultdict(list)
+    for node_id, parent_id in parents.items():
+        children[parent_id].append(node_id)
+    return children
+
+
+def _expand(
+    selected_ids: list[int],
+    parents: dict[int, int | None],
+    children: dict[int | None, list[int]],
+    label: str,
+) -> list[int]:
+    if not selected_ids:
+        return []
+    if any(item not in parents for item in selected_ids):
+        raise StaleIndexError(label)
+    leaf_ids: set[int] = set()
+    stack = list(selected_ids)
+    while stack:
+        node_id = stack.pop()
+        node_children = children.get(node_id)
+        if node_children:
+            stack.extend(node_children)
+        else:
+            leaf_ids.add(node_id)
+    return list(leaf_ids)
+
+
+def build_index(db: Session) -> EligibilityIndex:
+    experts: dict[int, _ExpertRow] = {}
+    all_expert_ids: set[int] = set()
+    rows = db.execute(
+        select(
+            Expert.id,
+            Expert.is_active,
+            Expert.organization_id,
+            Expert.company,
+            Expert.region_id,
+            Expert.region,
+            Expert.title_id,
+            Expert.title,
+        )
+    )
+    for row in rows:
+        all_expert_ids.add(row.id)
+        if row.is_active:
+            experts[row.id] = _ExpertRow(
+                row.organization_id,
+                row.company,
+                row.region_id,
+                row.region,
+                row.title_id,
+                row.title,
+            )
+
+    by_specialty: dict[int, set[int]] = defaultdict(set)
+    expert_specialties: dict[int, list[int]] = defaultdict(list)
+    for expert_id, specialty_id in db.execute(
+        select(ExpertSpecialty.expert_id, ExpertSpecialty.specialty_id)
+    ):
+        if expert_id in experts:
+            by_specialty[specialty_id].add(expert_id)
+            expert_specialties[expert_id].append(specialty_id)
+    for expert_id, specialty_ids in expert_specialties.items():
+        experts[expert_id].specialty_ids = tuple(specialty_ids)
+
+    specialty_parents: dict[int, int | None] = {}
+    specialty_names: dict[int, str] = {}
+    for row in db.execute(select(Specialty.id, Specialty.parent_id, Specialty.name)):
+        specialty_parents[row.id] = row.parent_id
+        specialty_names[row.id] = row.name
+    title_parents: dict[int, int | None] = {}
+    title_names: dict[int, str] = {}
+    for row in db.execute(select(Title.id, Title.parent_id, Title.name)):
+        title_parents[row.id] = row.parent_id
+        title_names[row.id] = row.name
+    region_names = dict(db.execute(select(Region.id, Region.name)).all())
+    organization_ids_by_name: dict[str, list[int]] = defaultdict(list)
+    for org_id, name in db.execute(select(Organization.id, Organization.name)):
+        organization_ids_by_name[name].append(org_id)
+
+    return EligibilityIndex(
+        built_at=time.monotonic(),
+        experts=experts,
+        all_expert_ids=all_expert_ids,
+        by_specialty=dict(by_specialty),
+        specialty_parents=specialty_parents,
+        specialty_names=specialty_names,
+        title_parents=title_parents,
+        title_names=title_names,
+        region_names=region_names,
+        organization_ids_by_name=dict(organization_ids_by_name),
+    )
+
+
+_index: EligibilityIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index(db: Session) -> EligibilityIndex:
+    global _index
+    index = _index
+    ttl = settings.eligibility_cache_ttl_seconds
+    if index is not None and time.monotonic() - index.built_at < ttl:
+        return index
+    with _index_lock:
+        index = _index
+        if index is None or time.monotonic() - index.built_at >= ttl:
+            index = _index = build_index(db)
+    return index
+
+
+def rebuild(db: Session) -> EligibilityIndex:
+    global _index
+    with _index_lock:
+        index = _index = build_index(db)
+    return index
+
+
+def invalidate() -> None:
+    global _index
+    with _index_lock:
+        _index = None
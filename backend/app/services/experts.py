@@ -4,8 +4,9 @@ from io import BytesIO
 
 from fastapi import HTTPException, status
 from openpyxl import Workbook, load_workbook
-from sqlalchemy import and_, delete, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.sql import ColumnElement
 
 from app.models.expert import Expert
 from app.models.expert_document import ExpertDocument
@@ -15,15 +16,27 @@ from app.repo.experts import ExpertRepo
 from app.repo.organizations import OrganizationRepo
 from app.repo.regions import RegionRepo
 from app.repo.specialties import SpecialtyRepo
-from app.repo.utils import apply_keyword, apply_sort, paginate
+from app.repo.utils import (
+    apply_keyword,
+    apply_sort,
+    chunked,
+    load_fields,
+    missing_ids,
+    paginate,
+)
 from app.schemas.expert import ExpertQuery
+from app.services import changes, derivatives, eligibility
 from app.services import organizations as organization_service
 from app.services import titles as title_service
 from app.services import specialties as specialty_service
 from app.services import regions as region_service
-from app.schemas.expert import ExpertCreate, ExpertUpdate
+from app.services.terms import unique_ints
+from app.schemas.expert import ExpertBatchPatch, ExpertCreate, ExpertUpdate
 
 APPOINTMENT_DOC_TYPE = "appointment_letter"
+SPECIALTY_FIELDS = {"specialties", "specialty_ids"}
+DIMENSION_KEYS = {"organization_id", "company", "region_id", "region", "title_id", "title"}
+DOCUMENT_FIELDS = {"appointment_letter_urls", "appointment_letters"}
 
 EXPORT_FIELDS = [
     ("name", "姓名"),
@@ -158,121 +171,210 @@ def _ensure_id_card_unique(
         )
 
 
-def _attach_expert_details(db: Session, experts: list[Expert]) -> None:
+def _attach_expert_details(
+    db: Session,
+    experts: list[Expert],
+    specialties: bool = True,
+    documents: bool = True,
+) -> None:
     if not experts:
         return
     expert_ids = [expert.id for expert in experts if expert.id is not None]
     if not expert_ids:
         return
 
-    specialty_map: dict[int, list[Specialty]] = {expert_id: [] for expert_id in expert_ids}
-    specialty_stmt = (
-        select(ExpertSpecialty.expert_id, Specialty)
-        .join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
-        .where(ExpertSpecialty.expert_id.in_(expert_ids))
-        .order_by(Specialty.sort_order, Specialty.id)
-    )
-    for expert_id, specialty in db.execute(specialty_stmt).all():
-        specialty_map.setdefault(expert_id, []).append(specialty)
-
+    if specialties:
+        specialty_map: dict[int, list[Specialty]] = {
+            expert_id: [] for expert_id in expert_ids
+        }
+        specialty_stmt = (
+            select(ExpertSpecialty.expert_id, Specialty)
+            .join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
+            .where(ExpertSpecialty.expert_id.in_(expert_ids))
+            .order_by(Specialty.sort_order, Specialty.id)
+        )
+        for expert_id, specialty in db.execute(specialty_stmt).all():
+            specialty_map.setdefault(expert_id, []).append(specialty)
+        for expert in experts:
+            items = specialty_map.get(expert.id, [])
+            setattr(expert, "specialties", items)
+            setattr(expert, "specialty_ids", [item.id for item in items])
+
+    if not documents:
+        return
     doc_map: dict[int, list[str]] = {}
     doc_stmt = (
-        select(ExpertDocument)
+        select(ExpertDocument.expert_id, ExpertDocument.url)
         .where(
             ExpertDocument.expert_id.in_(expert_ids),
             ExpertDocument.doc_type == APPOINTMENT_DOC_TYPE,
         )
         .order_by(ExpertDocument.sort_order, ExpertDocument.id)
     )
-    for doc in db.execute(doc_stmt).scalars().all():
-        doc_map.setdefault(doc.expert_id, []).append(doc.url)
+    for expert_id, url in db.execute(doc_stmt).all():
+        doc_map.setdefault(expert_id, []).append(url)
 
     for expert in experts:
-        specialties = specialty_map.get(expert.id, [])
-        setattr(expert, "specialties", specialties)
-        setattr(expert, "specialty_ids", [item.id for item in specialties])
-        setattr(expert, "appointment_letter_urls", doc_map.get(expert.id, []))
+        letter_urls = doc_map.get(expert.id, [])
+        setattr(expert, "appointment_letter_urls", letter_urls)
+        setattr(
+            expert,
+            "appointment_letters",
+            [derivatives.describe(url) for url in letter_urls],
+        )
 
 
-def _sync_expert_specialties(
-    db: Session, expert_id: int, specialty_ids: list[int] | None
-) -> None:
-    if specialty_ids is None:
-        return
-    unique_ids: list[int] = []
-    for item in specialty_ids:
-        try:
-            value = int(item)
-        except (TypeError, ValueError):
-            continue
-        if value not in unique_ids:
-            unique_ids.append(value)
-
-    if not unique_ids:
-        db.execute(
-            delete(ExpertSpecialty).where(ExpertSpecialty.expert_id == expert_id)
-        )
+def _validate_specialty_ids(db: Session, specialty_ids: set[int]) -> None:
+    if not specialty_ids:
         return
-
-    existing = set(
-        db.execute(select(Specialty.id).where(Specialty.id.in_(unique_ids)))
-        .scalars()
-        .all()
-    )
-    missing = [item for item in unique_ids if item not in existing]
-    if missing:
+    index = specialty_service.get_leaf_index(db)
+    if not specialty_ids <= index.ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Specialty not found"
         )
+    if not specialty_ids <= index.leaf_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specialty must be a leaf",
+        )
 
-    specialty_service.ensure_leaf_ids(db, unique_ids)
 
-    current = set(
-        db.execute(
-            select(ExpertSpecialty.specialty_id).where(
-                ExpertSpecialty.expert_id == expert_id
-            )
-        )
-        .scalars()
-        .all()
-    )
-    to_remove = [item for item in current if item not in unique_ids]
-    if to_remove:
-        db.execute(
-            delete(ExpertSpecialty).where(
-                ExpertSpecialty.expert_id == expert_id,
-                ExpertSpecialty.specialty_id.in_(to_remove),
-            )
+def _read_expert_specialties(
+    db: Session, expert_ids: list[int]
+) -> dict[int, dict[int, int]]:
+    """Current links as {expert_id: {specialty_id: link row id}}."""
+    current: dict[int, dict[int, int]] = {expert_id: {} for expert_id in expert_ids}
+    for chunk in chunked(expert_ids):
+        rows = db.execute(
+            select(
+                ExpertSpecialty.id,
+                ExpertSpecialty.expert_id,
+                ExpertSpecialty.specialty_id,
+            ).where(ExpertSpecialty.expert_id.in_(chunk))
         )
-    to_add = [item for item in unique_ids if item not in current]
-    for specialty_id in to_add:
-        db.add(ExpertSpecialty(expert_id=expert_id, specialty_id=specialty_id))
+        for row_id, expert_id, specialty_id in rows:
+            current[expert_id][specialty_id] = row_id
+    return current
 
 
-def _sync_expert_documents(
-    db: Session, expert_id: int, urls: list[str] | None
+def _apply_expert_specialties(
+    db: Session,
+    current: dict[int, dict[int, int]],
+    targets: dict[int, list[int]],
 ) -> None:
-    if urls is None:
+    """Diff ``targets`` against ``current`` and write only the changes."""
+    _validate_specialty_ids(db, {item for ids in targets.values() for item in ids})
+    stale: list[int] = []
+    inserts: list[dict[str, int]] = []
+    changed: set[int] = set()
+    for expert_id, specialty_ids in targets.items():
+        links = current.get(expert_id, {})
+        wanted = set(specialty_ids)
+        removed = [row_id for item, row_id in links.items() if item not in wanted]
+        added = [
+            {"expert_id": expert_id, "specialty_id": item}
+            for item in specialty_ids
+            if item not in links
+        ]
+        if removed or added:
+            changed.add(expert_id)
+            stale.extend(removed)
+            inserts.extend(added)
+    for chunk in chunked(stale):
+        db.execute(delete(ExpertSpecialty).where(ExpertSpecialty.id.in_(chunk)))
+    if inserts:
+        db.execute(insert(ExpertSpecialty), inserts)
+    changes.record(db, "experts", changed)
+
+
+def _sync_expert_specialties(
+    db: Session, specialty_map: dict[int, list[int] | None]
+) -> None:
+    """Set each expert's specialties to its list; None leaves an expert untouched."""
+    targets = {
+        expert_id: unique_ints(ids)
+        for expert_id, ids in specialty_map.items()
+        if ids is not None
+    }
+    if not targets:
         return
-    clean_urls = [item.strip() for item in urls if isinstance(item, str) and item.strip()]
-    db.execute(
-        delete(ExpertDocument).where(
-            ExpertDocument.expert_id == expert_id,
-            ExpertDocument.doc_type == APPOINTMENT_DOC_TYPE,
-        )
-    )
-    for index, url in enumerate(clean_urls, start=1):
-        db.add(
-            ExpertDocument(
-                expert_id=expert_id,
-                doc_type=APPOINTMENT_DOC_TYPE,
-                url=url,
-                sort_order=index,
-            )
-        )
+    _apply_expert_specialties(db, _read_expert_specialties(db, list(targets)), targets)
 
 
-def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
+def _sync_expert_documents(db: Session, url_map: dict[int, list[str] | None]) -> None:
+    """Set each expert's appointment letters; unchanged lists are not rewritten."""
+    targets = {
+        expert_id: [
+            item.strip() for item in urls if isinstance(item, str) and item.strip()
+        ]
+        for expert_id, urls in url_map.items()
+        if urls is not None
+    }
+    if not targets:
+        return
+    current: dict[int, list[tuple[int, str]]] = {expert_id: [] for expert_id in targets}
+    for chunk in chunked(list(targets)):
+        rows = db.execute(
+            select(ExpertDocument.id, ExpertDocument.expert_id, ExpertDocument.url)
+            .where(
+                ExpertDocument.expert_id.in_(chunk),
+                ExpertDocument.doc_type == APPOINTMENT_DOC_TYPE,
+            )
+            .order_by(
+                ExpertDocument.expert_id,
+                ExpertDocument.sort_order,
+                ExpertDocument.id,
+            )
+        )
+        for row_id, expert_id, url in rows:
+            current[expert_id].append((row_id, url))
+
+    stale: list[int] = []
+    inserts: list[dict[str, object]] = []
+    changed: set[int] = set()
+    for expert_id, urls in targets.items():
+        existing = current[expert_id]
+        if [url for _, url in existing] == urls:
+            continue
+        changed.add(expert_id)
+        stale.extend(row_id for row_id, _ in existing)
+        inserts.extend(
+            {
+                "expert_id": expert_id,
+                "doc_type": APPOINTMENT_DOC_TYPE,
+                "url": url,
+                "sort_order": index,
+            }
+            for index, url in enumerate(urls, start=1)
+        )
+    for chunk in chunked(stale):
+        db.execute(delete(ExpertDocument).where(ExpertDocument.id.in_(chunk)))
+    if inserts:
+        db.execute(insert(ExpertDocument), inserts)
+    changes.record(db, "experts", changed)
+
+
+def _dimension_match(
+    active: ColumnElement[bool] | None,
+    id_column: InstrumentedAttribute,
+    name_column: InstrumentedAttribute,
+    target_id: int,
+    target_name: str,
+) -> ColumnElement[bool]:
+    # Rows linked by id, or legacy rows that only carry the name. The active
+    # filter is repeated inside each branch: ANDed outside the OR it leaves
+    # only the first column of the (is_active, <dimension>_id) index usable.
+    by_id = [id_column == target_id]
+    by_name = [id_column.is_(None), name_column == target_name]
+    if active is not None:
+        by_id.insert(0, active)
+        by_name.insert(0, active)
+    return or_(and_(*by_id), and_(*by_name))
+
+
+def list_experts(
+    db: Session, params: ExpertQuery, fields: set[str] | None = None
+) -> tuple[list[Expert], int]:
     stmt = select(Expert).distinct()
     stmt = apply_keyword(
         stmt,
@@ -285,6 +387,10 @@ def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
             Expert.region,
         ],
     )
+    active = (
+        Expert.is_active.is_(params.is_active) if params.is_active is not None else None
+    )
+    active_applied = False
     if params.organization_id is not None:
         organization = OrganizationRepo(db).get_by_id(params.organization_id)
         if organization is None:
@@ -293,14 +399,15 @@ def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
                 detail="Organization not found",
             )
         stmt = stmt.where(
-            or_(
-                Expert.organization_id == organization.id,
-                and_(
-                    Expert.organization_id.is_(None),
-                    Expert.company == organization.name,
-                ),
+            _dimension_match(
+                active,
+                Expert.organization_id,
+                Expert.company,
+                organization.id,
+                organization.name,
             )
         )
+        active_applied = active is not None
     if params.region_id is not None:
         region = RegionRepo(db).get_by_id(params.region_id)
         if region is None:
@@ -309,11 +416,11 @@ def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
                 detail="Region not found",
             )
         stmt = stmt.where(
-            or_(
-                Expert.region_id == region.id,
-                and_(Expert.region_id.is_(None), Expert.region == region.name),
+            _dimension_match(
+                active, Expert.region_id, Expert.region, region.id, region.name
             )
         )
+        active_applied = active is not None
     if params.title_id is not None:
         title_ids = title_service.expand_to_leaf_ids(db, [params.title_id])
         stmt = stmt.where(Expert.title_id.in_(title_ids))
@@ -325,8 +432,8 @@ def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
             ExpertSpecialty, ExpertSpecialty.expert_id == Expert.id
         ).join(Specialty, Specialty.id == ExpertSpecialty.specialty_id)
         stmt = stmt.where(Specialty.id.in_(specialty_ids))
-    if params.is_active is not None:
-        stmt = stmt.where(Expert.is_active.is_(params.is_active))
+    if active is not None and not active_applied:
+        stmt = stmt.where(active)
     if params.gender:
         stmt = stmt.where(Expert.gender == params.gender)
     sort_map = {
@@ -341,8 +448,15 @@ def list_experts(db: Session, params: ExpertQuery) -> tuple[list[Expert], int]:
         "is_active": Expert.is_active,
     }
     stmt = apply_sort(stmt, params.sort_by, params.sort_order, sort_map, Expert.id)
+    sort_column = sort_map.get(params.sort_by or "")
+    stmt = load_fields(stmt, Expert, fields, [sort_column] if sort_column else [])
     items, total = paginate(db, stmt, params.page, params.page_size)
-    _attach_expert_details(db, items)
+    _attach_expert_details(
+        db,
+        items,
+        specialties=fields is None or bool(fields & SPECIALTY_FIELDS),
+        documents=fields is None or bool(fields & DOCUMENT_FIELDS),
+    )
     return items, total
 
 
@@ -350,6 +464,12 @@ def list_experts_all(db: Session) -> list[Expert]:
     return ExpertRepo(db).list()
 
 
+def get_experts_by_ids(db: Session, ids: list[int]) -> tuple[list[Expert], list[int]]:
+    items = ExpertRepo(db).get_by_ids(ids)
+    _attach_expert_details(db, items)
+    return items, missing_ids(ids, items)
+
+
 def get_expert(db: Session, expert_id: int) -> Expert:
     expert = ExpertRepo(db).get_by_id(expert_id)
     if expert is None:
@@ -408,22 +528,58 @@ def create_expert(db: Session, payload: ExpertCreate) -> Expert:
         expert.title = title.name
     db.add(expert)
     db.flush()
-    _sync_expert_specialties(db, expert.id, specialty_ids)
-    _sync_expert_documents(db, expert.id, appointment_letter_urls)
+    _sync_expert_specialties(db, {expert.id: specialty_ids})
+    _sync_expert_documents(db, {expert.id: appointment_letter_urls})
     db.commit()
+    eligibility.invalidate()
     db.refresh(expert)
     _attach_expert_details(db, [expert])
     return expert
 
 
+def _dimension_values(db: Session, data: dict) -> dict[str, object]:
+    """Expert column values for the organization/region/title inputs in ``data``.
+
+    Only dimensions with a key present are returned; explicit nulls clear
+    both columns, ids must exist, and unknown organization/region names are
+    created.
+    """
+    values: dict[str, object] = {}
+    for id_key, name_key, resolve, create in (
+        ("organization_id", "company", organization_service.resolve_organization, True),
+        ("region_id", "region", region_service.resolve_region, True),
+        ("title_id", "title", title_service.resolve_title, False),
+    ):
+        if id_key not in data and name_key not in data:
+            continue
+        item_id = data.get(id_key)
+        name = data.get(name_key)
+        if item_id is None and name is None:
+            values[id_key] = None
+            values[name_key] = None
+            continue
+        ref = resolve(
+            db,
+            item_id,
+            name,
+            strict=item_id is not None,
+            create_if_missing=create and bool(name) and item_id is None,
+        )
+        if ref:
+            if id_key == "title_id":
+                title_service.ensure_leaf_ids(db, [ref.id])
+            values[id_key] = ref.id
+            values[name_key] = ref.name
+        else:
+            values[id_key] = item_id
+            if name_key in data:
+                values[name_key] = name
+    return values
+
+
 def update_expert(db: Session, expert_id: int, payload: ExpertUpdate) -> Expert:
     expert = get_expert(db, expert_id)
     update_data = payload.model_dump(exclude_unset=True)
-    organization_input = (
-        "organization_id" in update_data or "company" in update_data
-    )
-    region_input = "region_id" in update_data or "region" in update_data
-    title_input = "title_id" in update_data or "title" in update_data
     specialty_ids = update_data.pop("specialty_ids", None)
     appointment_letter_urls = update_data.pop("appointment_letter_urls", None)
 
@@ -435,80 +591,29 @@ def update_expert(db: Session, expert_id: int, payload: ExpertUpdate) -> Expert:
             )
         _ensure_id_card_unique(db, update_data.get("id_card_no"), exclude_id=expert_id)
 
-    if organization_input:
-        if update_data.get("organization_id") is None and update_data.get("company") is None:
-            expert.organization_id = None
-            expert.company = None
-        else:
-            organization = organization_service.resolve_organization(
-                db,
-                update_data.get("organization_id"),
-                update_data.get("company"),
-                strict=update_data.get("organization_id") is not None,
-                create_if_missing=bool(update_data.get("company"))
-                and update_data.get("organization_id") is None,
-            )
-            if organization:
-                expert.organization_id = organization.id
-                expert.company = organization.name
-            else:
-                expert.organization_id = update_data.get("organization_id")
-                if "company" in update_data:
-                    expert.company = update_data.get("company")
-
-    if region_input:
-        if update_data.get("region_id") is None and update_data.get("region") is None:
-            expert.region_id = None
-            expert.region = None
-        else:
-            region = region_service.resolve_region(
-                db,
-                update_data.get("region_id"),
-                update_data.get("region"),
-                strict=update_data.get("region_id") is not None,
-                create_if_missing=bool(update_data.get("region"))
-                and update_data.get("region_id") is None,
-            )
-            if region:
-                expert.region_id = region.id
-                expert.region = region.name
-            else:
-                expert.region_id = update_data.get("region_id")
-                if "region" in update_data:
-                    expert.region = update_data.get("region")
-
-    if title_input:
-        if update_data.get("title_id") is None and update_data.get("title") is None:
-            expert.title_id = None
-            expert.title = None
-        else:
-            title = title_service.resolve_title(
-                db,
-                update_data.get("title_id"),
-                update_data.get("title"),
-                strict=update_data.get("title_id") is not None,
-            )
-            if title:
-                title_service.ensure_leaf_ids(db, [title.id])
-                expert.title_id = title.id
-                expert.title = title.name
-            else:
-                expert.title_id = update_data.get("title_id")
-                if "title" in update_data:
-                    expert.title = update_data.get("title")
+    for key, value in _dimension_values(db, update_data).items():
+        setattr(expert, key, value)
 
     for key, value in update_data.items():
-        if key in {"organization_id", "company", "region_id", "region", "title_id", "title"}:
+        if key in DIMENSION_KEYS:
             continue
         setattr(expert, key, value)
-    _sync_expert_specialties(db, expert_id, specialty_ids)
-    _sync_expert_documents(db, expert_id, appointment_letter_urls)
+    _sync_expert_specialties(db, {expert_id: specialty_ids})
+    _sync_expert_documents(db, {expert_id: appointment_letter_urls})
     db.commit()
+    eligibility.invalidate()
     db.refresh(expert)
     _attach_expert_details(db, [expert])
     return expert
 
 
+def _remove_draw_results(db: Session, expert_ids: list[int]) -> None:
+    # Imported here: the draw service already depends on this module.
+    from app.services import draws as draw_service
+
+    draw_service.remove_expert_results(db, expert_ids)
+
+
 def delete_expert(db: Session, expert_id: int) -> None:
     expert = get_expert(db, expert_id)
     db.execute(
@@ -517,8 +622,11 @@ def delete_expert(db: Session, expert_id: int) -> None:
     db.execute(
         delete(ExpertDocument).where(ExpertDocument.expert_id == expert_id)
     )
+    _remove_draw_results(db, [expert_id])
     db.delete(expert)
+    changes.record_deletes(db, "experts", [expert_id])
     db.commit()
+    eligibility.invalidate()
 
 
 def delete_experts(db: Session, expert_ids: list[int]) -> dict[str, int]:
@@ -539,11 +647,72 @@ def delete_experts(db: Session, expert_ids: list[int]) -> dict[str, int]:
     db.execute(
         delete(ExpertDocument).where(ExpertDocument.expert_id.in_(existing))
     )
+    _remove_draw_results(db, sorted(existing))
     db.execute(delete(Expert).where(Expert.id.in_(existing)))
+    changes.record_deletes(db, "experts", existing)
     db.commit()
+    eligibility.invalidate()
     return {"deleted": len(existing), "skipped": len(unique_ids) - len(existing)}
 
 
+def update_experts(
+    db: Session, expert_ids: list[int], patch: ExpertBatchPatch
+) -> dict[str, object]:
+    """Apply one patch to many experts in a single transaction."""
+    unique_ids = list(dict.fromkeys(expert_ids))
+    existing: set[int] = set()
+    for chunk in chunked(unique_ids):
+        existing.update(
+            db.execute(select(Expert.id).where(Expert.id.in_(chunk))).scalars().all()
+        )
+    target_ids = [item for item in unique_ids if item in existing]
+    errors = [
+        {"id": item, "detail": "Expert not found"}
+        for item in unique_ids
+        if item not in existing
+    ]
+    if not target_ids:
+        return {"updated": 0, "skipped": len(errors), "updated_ids": [], "errors": errors}
+
+    data = patch.model_dump(exclude_unset=True)
+    specialty_ids = data.pop("specialty_ids", None)
+    add_specialty_ids = data.pop("add_specialty_ids", None)
+    remove_specialty_ids = data.pop("remove_specialty_ids", None)
+    values = _dimension_values(db, data)
+    if data.get("is_active") is not None:
+        values["is_active"] = data["is_active"]
+
+    if values:
+        for chunk in chunked(target_ids):
+            db.execute(
+                update(Expert)
+                .where(Expert.id.in_(chunk))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        changes.record(db, "experts", target_ids)
+    if specialty_ids is not None:
+        _sync_expert_specialties(db, dict.fromkeys(target_ids, specialty_ids))
+    elif add_specialty_ids or remove_specialty_ids:
+        added = unique_ints(add_specialty_ids or [])
+        removed = set(unique_ints(remove_specialty_ids or [])) - set(added)
+        current = _read_expert_specialties(db, target_ids)
+        targets = {
+            expert_id: [item for item in links if item not in removed]
+            + [item for item in added if item not in links]
+            for expert_id, links in current.items()
+        }
+        _apply_expert_specialties(db, current, targets)
+    db.commit()
+    eligibility.invalidate()
+    return {
+        "updated": len(target_ids),
+        "skipped": len(errors),
+        "updated_ids": target_ids,
+        "errors": errors,
+    }
+
+
 def import_experts(db: Session, file) -> dict[str, int]:
     file.file.seek(0)
     workbook = load_workbook(file.file, data_only=True)
@@ -571,63 +740,71 @@ def import_experts(db: Session, file) -> dict[str, int]:
 
     created = 0
     skipped = 0
+    candidates: list[tuple[int, dict[str, object | None], str, str]] = []
+    for row_index, row in enumerate(rows, start=2):
+        if not row or all(cell is None for cell in row):
+            continue
+        data: dict[str, object | None] = {}
+        for idx, field in index_to_field.items():
+            value = row[idx] if idx < len(row) else None
+            data[field] = value
+
+        name = _coerce_str(data.get("name"))
+        id_card_no = _coerce_str(data.get("id_card_no"))
+        if not name or not id_card_no:
+            skipped += 1
+            continue
+        candidates.append((row_index, data, name, id_card_no))
+
+    # Existing and repeated ID cards are skipped before any name is resolved,
+    # so skipped rows never create organizations, regions or titles.
+    seen_id_cards: set[str] = set()
+    for chunk in chunked(list({item[3] for item in candidates})):
+        seen_id_cards.update(
+            db.execute(select(Expert.id_card_no).where(Expert.id_card_no.in_(chunk)))
+            .scalars()
+            .all()
+        )
+    pending: list[tuple[int, dict[str, object | None], str, str]] = []
+    for candidate in candidates:
+        if candidate[3] in seen_id_cards:
+            skipped += 1
+            continue
+        seen_id_cards.add(candidate[3])
+        pending.append(candidate)
+
     try:
-        for row_index, row in enumerate(rows, start=2):
-            if not row or all(cell is None for cell in row):
-                continue
-            data: dict[str, object | None] = {}
-            for idx, field in index_to_field.items():
-                value = row[idx] if idx < len(row) else None
-                data[field] = value
-
-            name = _coerce_str(data.get("name"))
-            if not name:
-                skipped += 1
-                continue
-
-            id_card_no = _coerce_str(data.get("id_card_no"))
-            if not id_card_no:
-                skipped += 1
-                continue
-            existing = db.execute(
-                select(Expert.id).where(Expert.id_card_no == id_card_no)
-            ).first()
-            if existing:
-                skipped += 1
-                continue
-
-            region_name = _coerce_str(data.get("region"))
+        organizations = organization_service.resolve_organizations(
+            db,
+            [_coerce_str(data.get("company")) for _, data, _, _ in pending],
+            create_if_missing=True,
+        )
+        regions = region_service.resolve_regions(
+            db,
+            [_coerce_str(data.get("region")) for _, data, _, _ in pending],
+            create_if_missing=True,
+        )
+        titles = title_service.resolve_titles(
+            db,
+            [_coerce_str(data.get("title")) for _, data, _, _ in pending],
+            create_if_missing=True,
+        )
+        specialty_map: dict[int, list[int] | None] = {}
+        document_map: dict[int, list[str] | None] = {}
+        for row_index, data, name, id_card_no in pending:
             expert = Expert(
                 name=name,
                 id_card_no=id_card_no,
                 gender=_coerce_str(data.get("gender")),
                 phone=_coerce_str(data.get("phone")),
                 company=_coerce_str(data.get("company")),
-                region=region_name,
+                region=_coerce_str(data.get("region")),
                 title=_coerce_str(data.get("title")),
                 is_active=_coerce_bool(data.get("is_active"), True),
             )
-            organization = organization_service.resolve_organization(
-                db,
-                None,
-                expert.company,
-                strict=False,
-                create_if_missing=True,
-            )
-            region = region_service.resolve_region(
-                db,
-                None,
-                region_name,
-                strict=False,
-                create_if_missing=bool(region_name),
-            )
-            title = title_service.resolve_title(
-                db,
-                None,
-                expert.title,
-                strict=False,
-                create_if_missing=True,
-            )
+            organization = organizations.get(expert.company)
+            region = regions.get(expert.region)
+            title = titles.get(expert.title)
             if organization:
                 expert.organization_id = organization.id
                 expert.company = organization.name
@@ -688,13 +865,13 @@ def import_experts(db: Session, file) -> dict[str, int]:
                     detail=f"专业名称不唯一，请使用编码: {', '.join(ambiguous_names)} (第{row_index}行)",
                 )
 
-            specialty_ids = list(dict.fromkeys(specialty_ids))
-
-            _sync_expert_specialties(db, expert.id, specialty_ids)
-            appointment_letter_urls = _split_list(data.get("appointment_letter_urls"))
-            _sync_expert_documents(db, expert.id, appointment_letter_urls)
+            specialty_map[expert.id] = list(dict.fromkeys(specialty_ids))
+            document_map[expert.id] = _split_list(data.get("appointment_letter_urls"))
             created += 1
+        _sync_expert_specialties(db, specialty_map)
+        _sync_expert_documents(db, document_map)
         db.commit()
+        eligibility.invalidate()
     except Exception:
         db.rollback()
         raise
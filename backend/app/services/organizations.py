@@ -1,22 +1,17 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.orm import Session
 
-from app.core.codes import generate_code
 from app.models.expert import Expert
 from app.models.organization import Organization
 from app.repo.organizations import OrganizationRepo
+from app.repo.utils import chunked, missing_ids
 from app.schemas.pagination import PageParams
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate
-
-
-def _generate_unique_code(repo: OrganizationRepo) -> str:
-    code = generate_code(prefix="org")
-    while repo.get_by_code(code):
-        code = generate_code(prefix="org")
-    return code
+from app.services import changes, dimensions, eligibility
+from app.services.dimensions import DimensionRef
 
 
 def list_organizations(db: Session, params: PageParams) -> tuple[list[Organization], int]:
@@ -37,6 +32,14 @@ def list_organizations_all(db: Session) -> list[Organization]:
     return items
 
 
+def get_organizations_by_ids(
+    db: Session, ids: list[int]
+) -> tuple[list[Organization], list[int]]:
+    items = OrganizationRepo(db).get_by_ids(ids)
+    _attach_expert_counts(db, items)
+    return items, missing_ids(ids, items)
+
+
 def get_organization(db: Session, organization_id: int) -> Organization:
     organization = OrganizationRepo(db).get_by_id(organization_id)
     if organization is None:
@@ -70,9 +73,12 @@ def create_organization(db: Session, payload: OrganizationCreate) -> Organizatio
     _ensure_unique(db, payload.name, payload.code)
     organization = Organization(**payload.model_dump())
     if not organization.code:
-        organization.code = _generate_unique_code(OrganizationRepo(db))
+        organization.code = dimensions.organizations.reserve_code(db)
     db.add(organization)
+    db.flush()
+    dimensions.organizations.stage(db, organization)
     db.commit()
+    eligibility.invalidate()
     db.refresh(organization)
     return organization
 
@@ -92,18 +98,24 @@ def update_organization(
         setattr(organization, key, value)
 
     if name_changed:
+        changes.record_where(db, Expert, Expert.organization_id == organization_id)
         db.execute(
             Expert.__table__.update()
             .where(Expert.organization_id == organization_id)
             .values(company=organization.name)
         )
+        changes.record_where(
+            db, Expert, Expert.organization_id.is_(None), Expert.company == old_name
+        )
         db.execute(
             Expert.__table__.update()
             .where(Expert.organization_id.is_(None), Expert.company == old_name)
             .values(company=organization.name)
         )
+        dimensions.organizations.stage(db, organization)
 
     db.commit()
+    eligibility.invalidate()
     db.refresh(organization)
     return organization
 
@@ -126,30 +138,72 @@ def delete_organization(db: Session, organization_id: int) -> None:
         )
 
     db.delete(organization)
+    changes.record_deletes(db, "organizations", [organization_id])
     db.commit()
+    dimensions.organizations.invalidate()
+    eligibility.invalidate()
+
+
+def _organizations_in_use(db: Session, names: dict[int, str]) -> set[int]:
+    """Ids among ``names`` (id -> name) referenced by any expert, by id or name."""
+    in_use: set[int] = set()
+    for chunk in chunked(list(names)):
+        ids_by_name = {names[item]: item for item in chunk}
+        rows = db.execute(
+            select(Expert.organization_id, Expert.company)
+            .where(
+                or_(
+                    Expert.organization_id.in_(chunk),
+                    Expert.company.in_(list(ids_by_name)),
+                )
+            )
+            .distinct()
+        )
+        for organization_id, name in rows:
+            if organization_id in names:
+                in_use.add(organization_id)
+            if name in ids_by_name:
+                in_use.add(ids_by_name[name])
+    return in_use
 
 
-def delete_organizations(db: Session, organization_ids: list[int]) -> dict[str, int]:
-    unique_ids = []
-    for item in organization_ids:
-        if isinstance(item, int):
-            unique_ids.append(item)
+def delete_organizations(db: Session, organization_ids: list[int]) -> dict[str, object]:
+    unique_ids = list(dict.fromkeys(item for item in organization_ids if isinstance(item, int)))
     if not unique_ids:
-        return {"deleted": 0, "skipped": 0}
-
-    deleted = 0
-    skipped = 0
-    for organization_id in set(unique_ids):
-        try:
-            delete_organization(db, organization_id)
-            deleted += 1
-        except HTTPException:
-            db.rollback()
-            skipped += 1
-        except Exception:
-            db.rollback()
-            raise
-    return {"deleted": deleted, "skipped": skipped}
+        return {"deleted": 0, "skipped": 0, "deleted_ids": [], "errors": []}
+
+    names: dict[int, str] = {}
+    for chunk in chunked(unique_ids):
+        names.update(
+            db.execute(
+                select(Organization.id, Organization.name).where(Organization.id.in_(chunk))
+            ).all()
+        )
+    in_use = _organizations_in_use(db, names)
+
+    deletable: list[int] = []
+    errors: list[dict[str, object]] = []
+    for organization_id in unique_ids:
+        if organization_id not in names:
+            errors.append({"id": organization_id, "detail": "Organization not found"})
+        elif organization_id in in_use:
+            errors.append({"id": organization_id, "detail": "Organization is in use"})
+        else:
+            deletable.append(organization_id)
+
+    if deletable:
+        for chunk in chunked(deletable):
+            db.execute(delete(Organization).where(Organization.id.in_(chunk)))
+        changes.record_deletes(db, "organizations", deletable)
+        db.commit()
+        dimensions.organizations.invalidate()
+        eligibility.invalidate()
+    return {
+        "deleted": len(deletable),
+        "skipped": len(errors),
+        "deleted_ids": deletable,
+        "errors": errors,
+    }
 
 
 def resolve_organization(
@@ -158,35 +212,35 @@ def resolve_organization(
     organization_name: str | None,
     strict: bool = True,
     create_if_missing: bool = False,
-) -> Organization | None:
-    repo = OrganizationRepo(db)
+) -> DimensionRef | None:
+    cache = dimensions.organizations
     organization = None
     if organization_id is not None:
-        organization = repo.get_by_id(organization_id)
+        organization = cache.get_by_id(db, organization_id)
         if organization is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Organization not found",
             )
     elif organization_name:
-        organization = repo.get_by_name(organization_name)
+        organization = cache.get_by_name(db, organization_name)
         if organization is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Organization not found",
             )
         if organization is None and create_if_missing:
-            organization = Organization(
-                name=organization_name,
-                code=_generate_unique_code(repo),
-                is_active=True,
-                sort_order=0,
-            )
-            db.add(organization)
-            db.flush()
+            organization = cache.create_many(db, [organization_name])[organization_name]
     return organization
 
 
+def resolve_organizations(
+    db: Session, names: list[str], create_if_missing: bool = False
+) -> dict[str, DimensionRef]:
+    """Map each known (or, optionally, newly created) organization name to its ref."""
+    return dimensions.organizations.resolve_names(db, names, create_if_missing)
+
+
 def _attach_expert_counts(db: Session, items: list[Organization]) -> None:
     if not items:
         return
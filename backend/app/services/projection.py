@@ -0,0 +1,71 @@
+"""Sparse fieldsets (``?fields=id,name``) for list endpoints."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, TypeAdapter
+
+
+def parse_fields(value: str | None, model: type[BaseModel]) -> set[str] | None:
+    """Requested field names of ``model``, or None for the full representation."""
+    if value is None:
+        return None
+    names = {item.strip() for item in value.split(",") if item.strip()}
+    if not names:
+        return None
+    unknown = names - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    # Clients key rows by id.
+    if "id" in model.model_fields:
+        names.add("id")
+    return names
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(model.model_fields[name].annotation)
+
+
+def project(
+    model: type[BaseModel], items: Iterable[Any], fields: set[str]
+) -> list[dict[str, Any]]:
+    """Serialize only ``fields`` of each ORM item.
+
+    Each requested attribute is validated on its own, so unrequested (and
+    unloaded) attributes are never touched; the model's field serializers
+    (e.g. masking) still apply on dump.
+    """
+    adapters = {name: _field_adapter(model, name) for name in fields}
+    rows: list[dict[str, Any]] = []
+    for item in items:
+        values = {
+            name: adapter.validate_python(getattr(item, name), from_attributes=True)
+            for name, adapter in adapters.items()
+        }
+        rows.append(
+            model.model_construct(**values).model_dump(mode="json", include=fields)
+        )
+    return rows
+
+
+def project_page(
+    model: type[BaseModel],
+    items: Iterable[Any],
+    total: int,
+    page: int,
+    page_size: int,
+    fields: set[str],
+) -> dict[str, Any]:
+    return {
+        "items": project(model, items, fields),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    }
@@ -1,22 +1,18 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.orm import Session
 
-from app.core.codes import generate_code
 from app.models.expert import Expert
 from app.models.region import Region
 from app.repo.regions import RegionRepo
+from app.repo.utils import chunked, missing_ids
 from app.schemas.pagination import PageParams
 from app.schemas.region import RegionCreate, RegionUpdate
-
-
-def _generate_unique_code(repo: RegionRepo) -> str:
-    code = generate_code(prefix="region")
-    while repo.get_by_code(code):
-        code = generate_code(prefix="region")
-    return code
+from app.services import changes, dimensions, eligibility
+from app.services import rules as rule_service
+from app.services.dimensions import DimensionRef
 
 
 def list_regions(db: Session, params: PageParams) -> tuple[list[Region], int]:
@@ -37,6 +33,12 @@ def list_regions_all(db: Session) -> list[Region]:
     return items
 
 
+def get_regions_by_ids(db: Session, ids: list[int]) -> tuple[list[Region], list[int]]:
+    items = RegionRepo(db).get_by_ids(ids)
+    _attach_expert_counts(db, items)
+    return items, missing_ids(ids, items)
+
+
 def get_region(db: Session, region_id: int) -> Region:
     region = RegionRepo(db).get_by_id(region_id)
     if region is None:
@@ -70,9 +72,12 @@ def create_region(db: Session, payload: RegionCreate) -> Region:
     _ensure_unique(db, payload.name, payload.code)
     region = Region(**payload.model_dump())
     if not region.code:
-        region.code = _generate_unique_code(RegionRepo(db))
+        region.code = dimensions.regions.reserve_code(db)
     db.add(region)
+    db.flush()
+    dimensions.regions.stage(db, region)
     db.commit()
+    eligibility.invalidate()
     db.refresh(region)
     return region
 
@@ -90,18 +95,24 @@ def update_region(db: Session, region_id: int, payload: RegionUpdate) -> Region:
         setattr(region, key, value)
 
     if name_changed:
+        changes.record_where(db, Expert, Expert.region_id == region_id)
         db.execute(
             Expert.__table__.update()
             .where(Expert.region_id == region_id)
             .values(region=region.name)
         )
+        changes.record_where(
+            db, Expert, Expert.region_id.is_(None), Expert.region == old_name
+        )
         db.execute(
             Expert.__table__.update()
             .where(Expert.region_id.is_(None), Expert.region == old_name)
             .values(region=region.name)
         )
+        dimensions.regions.stage(db, region)
 
     db.commit()
+    eligibility.invalidate()
     db.refresh(region)
     return region
 
@@ -122,31 +133,75 @@ def delete_region(db: Session, region_id: int) -> None:
             detail="Region is in use",
         )
 
+    rule_service.detach_regions(db, {region_id})
     db.delete(region)
+    changes.record_deletes(db, "regions", [region_id])
     db.commit()
+    dimensions.regions.invalidate()
+    eligibility.invalidate()
+
+
+def _regions_in_use(db: Session, names: dict[int, str]) -> set[int]:
+    """Ids among ``names`` (id -> name) referenced by any expert, by id or name."""
+    in_use: set[int] = set()
+    for chunk in chunked(list(names)):
+        ids_by_name = {names[item]: item for item in chunk}
+        rows = db.execute(
+            select(Expert.region_id, Expert.region)
+            .where(
+                or_(
+                    Expert.region_id.in_(chunk),
+                    Expert.region.in_(list(ids_by_name)),
+                )
+            )
+            .distinct()
+        )
+        for region_id, name in rows:
+            if region_id in names:
+                in_use.add(region_id)
+            if name in ids_by_name:
+                in_use.add(ids_by_name[name])
+    return in_use
 
 
-def delete_regions(db: Session, region_ids: list[int]) -> dict[str, int]:
-    unique_ids = []
-    for item in region_ids:
-        if isinstance(item, int):
-            unique_ids.append(item)
+def delete_regions(db: Session, region_ids: list[int]) -> dict[str, object]:
+    unique_ids = list(dict.fromkeys(item for item in region_ids if isinstance(item, int)))
     if not unique_ids:
-        return {"deleted": 0, "skipped": 0}
-
-    deleted = 0
-    skipped = 0
-    for region_id in set(unique_ids):
-        try:
-            delete_region(db, region_id)
-            deleted += 1
-        except HTTPException:
-            db.rollback()
-            skipped += 1
-        except Exception:
-            db.rollback()
-            raise
-    return {"deleted": deleted, "skipped": skipped}
+        return {"deleted": 0, "skipped": 0, "deleted_ids": [], "errors": []}
+
+    names: dict[int, str] = {}
+    for chunk in chunked(unique_ids):
+        names.update(
+            db.execute(
+                select(Region.id, Region.name).where(Region.id.in_(chunk))
+            ).all()
+        )
+    in_use = _regions_in_use(db, names)
+
+    deletable: list[int] = []
+    errors: list[dict[str, object]] = []
+    for region_id in unique_ids:
+        if region_id not in names:
+            errors.append({"id": region_id, "detail": "Region not found"})
+        elif region_id in in_use:
+            errors.append({"id": region_id, "detail": "Region is in use"})
+        else:
+            deletable.append(region_id)
+
+    if deletable:
+        rule_service.detach_regions(db, set(deletable))
+        for chunk in chunked(deletable):
+            db.execute(delete(Region).where(Region.id.in_(chunk)))
+        changes.record_deletes(db, "regions", deletable)
+        db.commit()
+        dimensions.regions.invalidate()
+        eligibility.invalidate()
+    return {
+        "deleted": len(deletable),
+        "skipped": len(errors),
+        "deleted_ids": deletable,
+        "errors": errors,
+    }
 
 
 def resolve_region(
@@ -155,35 +210,35 @@ def resolve_region(
     region_name: str | None,
     strict: bool = True,
     create_if_missing: bool = False,
-) -> Region | None:
-    repo = RegionRepo(db)
+) -> DimensionRef | None:
+    cache = dimensions.regions
     region = None
     if region_id is not None:
-        region = repo.get_by_id(region_id)
+        region = cache.get_by_id(db, region_id)
         if region is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Region not found",
             )
     elif region_name:
-        region = repo.get_by_name(region_name)
+        region = cache.get_by_name(db, region_name)
         if region is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Region not found",
             )
         if region is None and create_if_missing:
-            region = Region(
-                name=region_name,
-                code=_generate_unique_code(repo),
-                is_active=True,
-                sort_order=0,
-            )
-            db.add(region)
-            db.flush()
+            region = cache.create_many(db, [region_name])[region_name]
     return region
 
 
+def resolve_regions(
+    db: Session, names: list[str], create_if_missing: bool = False
+) -> dict[str, DimensionRef]:
+    """Map each known (or, optionally, newly created) region name to its ref."""
+    return dimensions.regions.resolve_names(db, names, create_if_missing)
+
+
 def _attach_expert_counts(db: Session, items: list[Region]) -> None:
     if not items:
         return
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Table, delete, insert, select
 from sqlalchemy.orm import Session
 
+from app.models.associations import rule_regions, rule_specialties, rule_titles
 from app.models.region import Region
 from app.models.rule import Rule
 from app.models.specialty import Specialty
@@ -11,8 +12,10 @@ from app.models.title import Title
 from app.repo.rules import RuleRepo
 from app.repo.specialties import SpecialtyRepo
 from app.repo.titles import TitleRepo
+from app.repo.utils import chunked
 from app.schemas.pagination import PageParams
 from app.schemas.rule import RuleCreate, RuleUpdate
+from app.services import changes
 
 
 def list_rules(db: Session, params: PageParams) -> tuple[list[Rule], int]:
@@ -133,6 +136,109 @@ def _apply_specialty(rule: Rule, db: Session, specialty_ids: list[int]) -> None:
     rule.subcategory = None
 
 
+# Join tables are the source of truth for rule criteria. They are written from
+# the validated ids of each payload, never read back from the JSON id lists on
+# Rule, which are only a derived cache and may still hold ids deleted before the
+# join tables existed.
+_RULE_LINK_TABLES: tuple[Table, ...] = (rule_specialties, rule_titles, rule_regions)
+
+
+def _set_rule_links(
+    db: Session, rule_id: int, table: Table, column: str, ids: list[int]
+) -> None:
+    """Replace one kind of link of a rule; ``ids`` must already be validated."""
+    db.execute(delete(table).where(table.c.rule_id == rule_id))
+    if ids:
+        db.execute(
+            insert(table),
+            [
+                {"rule_id": rule_id, column: value, "position": position}
+                for position, value in enumerate(ids)
+            ],
+        )
+
+
+def _detach_links(
+    db: Session, table: Table, column: str, ids: set[int]
+) -> dict[int, list[int]]:
+    """Delete links to ``ids``; return the remaining ids of each affected rule."""
+    link_column = table.c[column]
+    rule_ids: set[int] = set()
+    for chunk in chunked(list(ids)):
+        rule_ids.update(
+            db.execute(select(table.c.rule_id).where(link_column.in_(chunk)))
+            .scalars()
+            .all()
+        )
+    if not rule_ids:
+        return {}
+    for chunk in chunked(list(ids)):
+        db.execute(delete(table).where(link_column.in_(chunk)))
+    remaining: dict[int, list[int]] = {rule_id: [] for rule_id in rule_ids}
+    for chunk in chunked(sorted(rule_ids)):
+        rows = db.execute(
+            select(table.c.rule_id, link_column)
+            .where(table.c.rule_id.in_(chunk))
+            .order_by(table.c.rule_id, table.c.position)
+        )
+        for rule_id, value in rows:
+            remaining[rule_id].append(value)
+    return remaining
+
+
+def _affected_rules(
+    db: Session, remaining: dict[int, list[int]], model
+) -> list[tuple[Rule, list[int], list[str]]]:
+    linked_ids = {item for ids in remaining.values() for item in ids}
+    names: dict[int, str] = {}
+    for chunk in chunked(list(linked_ids)):
+        names.update(
+            db.execute(select(model.id, model.name).where(model.id.in_(chunk)))
+            .tuples()
+            .all()
+        )
+    rules: list[Rule] = []
+    for chunk in chunked(list(remaining)):
+        rules.extend(db.execute(select(Rule).where(Rule.id.in_(chunk))).scalars())
+    return [
+        (
+            rule,
+            remaining[rule.id],
+            [names[item] for item in remaining[rule.id] if item in names],
+        )
+        for rule in rules
+    ]
+
+
+def detach_specialties(db: Session, specialty_ids: set[int]) -> None:
+    remaining = _detach_links(db, rule_specialties, "specialty_id", specialty_ids)
+    if not remaining:
+        return
+    for rule, ids, names in _affected_rules(db, remaining, Specialty):
+        rule.specialty_ids = ids
+        rule.specialty = _join_names(names)
+        rule.specialty_id = ids[0] if len(ids) == 1 else None
+
+
+def detach_titles(db: Session, title_ids: set[int]) -> None:
+    remaining = _detach_links(db, rule_titles, "title_id", title_ids)
+    if not remaining:
+        return
+    for rule, ids, names in _affected_rules(db, remaining, Title):
+        rule.title_required_ids = ids
+        rule.title_required = _join_names(names)
+
+
+def detach_regions(db: Session, region_ids: set[int]) -> None:
+    remaining = _detach_links(db, rule_regions, "region_id", region_ids)
+    if not remaining:
+        return
+    for rule, ids, names in _affected_rules(db, remaining, Region):
+        rule.region_required_ids = ids
+        rule.region_required = _join_names(names)
+        rule.region_required_id = ids[0] if len(ids) == 1 else None
+
+
 def create_rule(db: Session, payload: RuleCreate) -> Rule:
     data = payload.model_dump()
     specialty_ids = _normalize_ids(data.get("specialty_ids"))
@@ -156,6 +262,10 @@ def create_rule(db: Session, payload: RuleCreate) -> Rule:
     rule.region_required = _join_names(region_names)
 
     db.add(rule)
+    db.flush()
+    _set_rule_links(db, rule.id, rule_specialties, "specialty_id", specialty_ids)
+    _set_rule_links(db, rule.id, rule_titles, "title_id", title_required_ids)
+    _set_rule_links(db, rule.id, rule_regions, "region_id", region_required_ids)
     db.commit()
     db.refresh(rule)
     return rule
@@ -168,12 +278,14 @@ def update_rule(db: Session, rule_id: int, payload: RuleUpdate) -> Rule:
     if "specialty_ids" in update_data:
         specialty_ids = _normalize_ids(update_data.get("specialty_ids"))
         _apply_specialty(rule, db, specialty_ids)
+        _set_rule_links(db, rule.id, rule_specialties, "specialty_id", specialty_ids)
 
     if "title_required_ids" in update_data:
         title_required_ids = _normalize_ids(update_data.get("title_required_ids"))
         title_names = _load_titles(db, title_required_ids)
         rule.title_required_ids = title_required_ids
         rule.title_required = _join_names(title_names)
+        _set_rule_links(db, rule.id, rule_titles, "title_id", title_required_ids)
 
     if "region_required_ids" in update_data or "region_required_id" in update_data:
         region_required_ids = _normalize_ids(update_data.get("region_required_ids"))
@@ -185,6 +297,7 @@ def update_rule(db: Session, rule_id: int, payload: RuleUpdate) -> Rule:
             region_required_ids[0] if len(region_required_ids) == 1 else None
         )
         rule.region_required = _join_names(region_names)
+        _set_rule_links(db, rule.id, rule_regions, "region_id", region_required_ids)
 
     for key, value in update_data.items():
         if key in {
@@ -203,6 +316,10 @@ def update_rule(db: Session, rule_id: int, payload: RuleUpdate) -> Rule:
 
 def delete_rule(db: Session, rule_id: int) -> None:
     rule = get_rule(db, rule_id)
+    for table in _RULE_LINK_TABLES:
+        db.execute(delete(table).where(table.c.rule_id == rule.id))
     db.delete(rule)
+    changes.record_deletes(db, "rules", [rule_id])
     db.commit()
 
+
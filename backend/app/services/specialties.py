@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import threading
 from collections import defaultdict
+from dataclasses import dataclass
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from app.core.codes import generate_code
+from app.models.expert import Expert
 from app.models.expert_specialty import ExpertSpecialty
-from app.models.rule import Rule
 from app.models.specialty import Specialty
 from app.repo.specialties import SpecialtyRepo
+from app.repo.utils import missing_ids
 from app.schemas.pagination import PageParams
 from app.schemas.specialty import SpecialtyCreate, SpecialtyUpdate
+from app.services import changes, eligibility
+from app.services import rules as rule_service
 
 
 def _generate_unique_code(repo: SpecialtyRepo, prefix: str) -> str:
@@ -34,6 +39,52 @@ def _normalize_ids(values: list[int] | None) -> list[int]:
     return unique
 
 
+@dataclass(frozen=True)
+class LeafIndex:
+    fingerprint: tuple
+    ids: frozenset[int]
+    leaf_ids: frozenset[int]
+
+
+_leaf_index: LeafIndex | None = None
+_leaf_index_lock = threading.Lock()
+
+
+def _fingerprint(db: Session) -> tuple:
+    row = db.execute(
+        select(
+            func.count(Specialty.id),
+            func.max(Specialty.id),
+            func.max(Specialty.updated_at),
+        )
+    ).one()
+    return tuple(row)
+
+
+def get_leaf_index(db: Session) -> LeafIndex:
+    """Existing and leaf specialty ids, rebuilt when the table fingerprint changes."""
+    global _leaf_index
+    fingerprint = _fingerprint(db)
+    index = _leaf_index
+    if index is not None and index.fingerprint == fingerprint:
+        return index
+    with _leaf_index_lock:
+        index = _leaf_index
+        if index is None or index.fingerprint != fingerprint:
+            rows = db.execute(select(Specialty.id, Specialty.parent_id)).all()
+            ids = frozenset(row.id for row in rows)
+            parents = {row.parent_id for row in rows if row.parent_id is not None}
+            index = _leaf_index = LeafIndex(fingerprint, ids, ids - parents)
+    return index
+
+
+def invalidate_leaf_index() -> None:
+    global _leaf_index
+    with _leaf_index_lock:
+        _leaf_index = None
+    eligibility.invalidate()
+
+
 def _sort_key(item: Specialty) -> tuple[int, str, str, int]:
     code = (item.code or "").strip()
     name = item.name.strip()
@@ -89,6 +140,13 @@ def list_specialty_tree(db: Session) -> list[SpecialtyTreeOut]:
     return _build_tree(items)
 
 
+def get_specialties_by_ids(
+    db: Session, ids: list[int]
+) -> tuple[list[Specialty], list[int]]:
+    items = SpecialtyRepo(db).get_by_ids(ids)
+    return items, missing_ids(ids, items)
+
+
 def get_specialty(db: Session, specialty_id: int) -> Specialty:
     specialty = SpecialtyRepo(db).get_by_id(specialty_id)
     if specialty is None:
@@ -147,6 +205,7 @@ def create_specialty(db: Session, payload: SpecialtyCreate) -> Specialty:
     specialty = Specialty(**data)
     db.add(specialty)
     db.commit()
+    invalidate_leaf_index()
     db.refresh(specialty)
     return specialty
 
@@ -169,6 +228,7 @@ def update_specialty(db: Session, specialty_id: int, payload: SpecialtyUpdate) -
         setattr(specialty, key, value)
 
     db.commit()
+    invalidate_leaf_index()
     db.refresh(specialty)
     return specialty
 
@@ -197,37 +257,31 @@ def _collect_descendant_ids(items: list[Specialty], target_ids: list[int]) -> li
 def _cleanup_rules_for_specialties(db: Session, specialty_ids: set[int]) -> None:
     if not specialty_ids:
         return
-    rules = db.execute(select(Rule)).scalars().all()
-    if not rules:
-        return
-    specialties = {item.id: item for item in SpecialtyRepo(db).list()}
-    for rule in rules:
-        current = _normalize_ids(rule.specialty_ids)
-        if not current:
-            continue
-        if not specialty_ids.intersection(current):
-            continue
-        remaining = [item for item in current if item not in specialty_ids]
-        rule.specialty_ids = remaining
-        names = [specialties[item].name for item in remaining if item in specialties]
-        rule.specialty = ";".join(names) if names else None
-        rule.specialty_id = remaining[0] if len(remaining) == 1 else None
-
+    rule_service.detach_specialties(db, specialty_ids)
 
-def delete_specialty(db: Session, specialty_id: int) -> None:
-    items = SpecialtyRepo(db).list()
-    existing = {item.id for item in items}
-    if specialty_id not in existing:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Specialty not found")
-    to_delete = _collect_descendant_ids(items, [specialty_id])
-    delete_ids = set(to_delete)
 
+def _delete_specialty_ids(db: Session, delete_ids: set[int]) -> None:
+    linked_experts = select(ExpertSpecialty.expert_id).where(
+        ExpertSpecialty.specialty_id.in_(delete_ids)
+    )
+    # Experts losing a specialty show up in the change feed.
+    changes.record_where(db, Expert, Expert.id.in_(linked_experts))
     db.execute(
         delete(ExpertSpecialty).where(ExpertSpecialty.specialty_id.in_(delete_ids))
     )
     _cleanup_rules_for_specialties(db, delete_ids)
     db.execute(delete(Specialty).where(Specialty.id.in_(delete_ids)))
+    changes.record_deletes(db, "specialties", delete_ids)
+
+
+def delete_specialty(db: Session, specialty_id: int) -> None:
+    items = SpecialtyRepo(db).list()
+    existing = {item.id for item in items}
+    if specialty_id not in existing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Specialty not found")
+    _delete_specialty_ids(db, set(_collect_descendant_ids(items, [specialty_id])))
     db.commit()
+    invalidate_leaf_index()
 
 
 def batch_specialties(
@@ -247,17 +301,15 @@ def batch_specialties(
             .where(Specialty.id.in_(target_ids))
             .values(is_active=is_active)
         )
+        changes.record(db, "specialties", target_ids)
         db.commit()
         return {"updated": len(target_ids), "deleted": 0, "skipped": 0, "errors": []}
 
     if action == "delete":
         target_ids = set(_collect_descendant_ids(items, unique_ids))
-        db.execute(
-            delete(ExpertSpecialty).where(ExpertSpecialty.specialty_id.in_(target_ids))
-        )
-        _cleanup_rules_for_specialties(db, target_ids)
-        db.execute(delete(Specialty).where(Specialty.id.in_(target_ids)))
+        _delete_specialty_ids(db, target_ids)
         db.commit()
+        invalidate_leaf_index()
         return {"updated": 0, "deleted": len(target_ids), "skipped": 0, "errors": []}
 
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid action")
@@ -302,19 +354,14 @@ def ensure_leaf_ids(db: Session, specialty_ids: list[int]) -> None:
     normalized = _normalize_ids(specialty_ids)
     if not normalized:
         return
-    items = SpecialtyRepo(db).list()
-    existing = {item.id for item in items}
-    missing = [str(item) for item in normalized if item not in existing]
+    index = get_leaf_index(db)
+    missing = [str(item) for item in normalized if item not in index.ids]
     if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Specialty not found: {', '.join(missing)}",
         )
-    children_map: dict[int | None, list[int]] = defaultdict(list)
-    for item in items:
-        children_map[item.parent_id].append(item.id)
-    non_leaf = [item for item in normalized if children_map.get(item)]
-    if non_leaf:
+    if any(item not in index.leaf_ids for item in normalized):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Specialty must be a leaf",
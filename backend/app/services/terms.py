@@ -0,0 +1,30 @@
+"""Parsing of the free-text and id-list rule fields.
+
+Shared by the draw services and the expert service so every caller reads a
+rule's criteria exactly the same way.
+"""
+
+from __future__ import annotations
+
+TERM_SEPARATORS = ("、", "，", "；", ",", ";", "|", "\n")
+
+
+def split_terms(value: str | None) -> list[str]:
+    if not value:
+        return []
+    normalized = value
+    for sep in TERM_SEPARATORS:
+        normalized = normalized.replace(sep, ";")
+    return [item.strip() for item in normalized.split(";") if item.strip()]
+
+
+def unique_ints(values: list[int] | None) -> list[int]:
+    unique: list[int] = []
+    for item in values or []:
+        try:
+            value = int(item)
+        except (TypeError, ValueError):
+            continue
+        if value not in unique:
+            unique.append(value)
+    return unique
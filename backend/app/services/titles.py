@@ -6,20 +6,15 @@ from fastapi import HTTPException, status
 from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
-from app.core.codes import generate_code
 from app.models.expert import Expert
-from app.models.rule import Rule
 from app.models.title import Title
 from app.repo.titles import TitleRepo
+from app.repo.utils import chunked, missing_ids
 from app.schemas.pagination import PageParams
 from app.schemas.title import TitleCreate, TitleUpdate
-
-
-def _generate_unique_code(repo: TitleRepo) -> str:
-    code = generate_code(prefix="title")
-    while repo.get_by_code(code):
-        code = generate_code(prefix="title")
-    return code
+from app.services import changes, dimensions, eligibility
+from app.services import rules as rule_service
+from app.services.dimensions import DimensionRef
 
 
 def _normalize_ids(values: list[int] | None) -> list[int]:
@@ -89,6 +84,11 @@ def list_title_tree(db: Session) -> list[TitleTreeOut]:
     return _build_tree(items)
 
 
+def get_titles_by_ids(db: Session, ids: list[int]) -> tuple[list[Title], list[int]]:
+    items = TitleRepo(db).get_by_ids(ids)
+    return items, missing_ids(ids, items)
+
+
 def get_title(db: Session, title_id: int) -> Title:
     title = TitleRepo(db).get_by_id(title_id)
     if title is None:
@@ -139,14 +139,17 @@ def create_title(db: Session, payload: TitleCreate) -> Title:
     if code:
         code = code.strip()
     if not code:
-        code = _generate_unique_code(TitleRepo(db))
+        code = dimensions.titles.reserve_code(db)
     data["code"] = code
     _ensure_unique_code(db, code)
     _validate_parent(db, data.get("parent_id"))
 
     title = Title(**data)
     db.add(title)
+    db.flush()
+    dimensions.titles.stage(db, title)
     db.commit()
+    eligibility.invalidate()
     db.refresh(title)
     return title
 
@@ -171,18 +174,24 @@ def update_title(db: Session, title_id: int, payload: TitleUpdate) -> Title:
         setattr(title, key, value)
 
     if name_changed:
+        changes.record_where(db, Expert, Expert.title_id == title_id)
         db.execute(
             Expert.__table__.update()
             .where(Expert.title_id == title_id)
             .values(title=title.name)
         )
+        changes.record_where(
+            db, Expert, Expert.title_id.is_(None), Expert.title == old_name
+        )
         db.execute(
             Expert.__table__.update()
             .where(Expert.title_id.is_(None), Expert.title == old_name)
             .values(title=title.name)
         )
+        dimensions.titles.stage(db, title)
 
     db.commit()
+    eligibility.invalidate()
     db.refresh(title)
     return title
 
@@ -211,20 +220,21 @@ def _collect_descendant_ids(items: list[Title], target_ids: list[int]) -> list[i
 def _cleanup_rules_for_titles(db: Session, title_ids: set[int]) -> None:
     if not title_ids:
         return
-    rules = db.execute(select(Rule)).scalars().all()
-    if not rules:
-        return
-    titles = {item.id: item for item in TitleRepo(db).list()}
-    for rule in rules:
-        current = _normalize_ids(rule.title_required_ids)
-        if not current:
-            continue
-        if not title_ids.intersection(current):
-            continue
-        remaining = [item for item in current if item not in title_ids]
-        rule.title_required_ids = remaining
-        names = [titles[item].name for item in remaining if item in titles]
-        rule.title_required = ";".join(names) if names else None
+    rule_service.detach_titles(db, title_ids)
+
+
+def _delete_title_ids(db: Session, delete_ids: set[int]) -> None:
+    for chunk in chunked(list(delete_ids)):
+        changes.record_where(db, Expert, Expert.title_id.in_(chunk))
+        db.execute(
+            Expert.__table__.update()
+            .where(Expert.title_id.in_(chunk))
+            .values(title_id=None, title=None)
+        )
+    _cleanup_rules_for_titles(db, delete_ids)
+    for chunk in chunked(list(delete_ids)):
+        db.execute(delete(Title).where(Title.id.in_(chunk)))
+    changes.record_deletes(db, "titles", delete_ids)
 
 
 def delete_title(db: Session, title_id: int) -> None:
@@ -232,42 +242,53 @@ def delete_title(db: Session, title_id: int) -> None:
     existing = {item.id for item in items}
     if title_id not in existing:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Title not found")
-    to_delete = _collect_descendant_ids(items, [title_id])
-    delete_ids = set(to_delete)
-
-    db.execute(
-        Expert.__table__.update()
-        .where(Expert.title_id.in_(delete_ids))
-        .values(title_id=None, title=None)
-    )
-    _cleanup_rules_for_titles(db, delete_ids)
-    db.execute(delete(Title).where(Title.id.in_(delete_ids)))
+    _delete_title_ids(db, set(_collect_descendant_ids(items, [title_id])))
     db.commit()
+    dimensions.titles.invalidate()
+    eligibility.invalidate()
 
 
-def delete_titles(db: Session, title_ids: list[int]) -> dict[str, int]:
+def delete_titles(db: Session, title_ids: list[int]) -> dict[str, object]:
     unique_ids = _normalize_ids(title_ids)
     if not unique_ids:
-        return {"deleted": 0, "skipped": 0}
+        return {"deleted": 0, "skipped": 0, "deleted_ids": [], "errors": []}
 
-    deleted = 0
-    skipped = 0
-    for title_id in set(unique_ids):
-        try:
-            delete_title(db, title_id)
-            deleted += 1
-        except HTTPException:
-            db.rollback()
-            skipped += 1
-        except Exception:
-            db.rollback()
-            raise
-    return {"deleted": deleted, "skipped": skipped}
+    # Descendants are expanded once for the whole selection.
+    items = db.execute(select(Title.id, Title.parent_id)).all()
+    existing = {item.id for item in items}
+    errors = [
+        {"id": title_id, "detail": "Title not found"}
+        for title_id in unique_ids
+        if title_id not in existing
+    ]
+    target_ids = [title_id for title_id in unique_ids if title_id in existing]
+    deleted_ids = _collect_descendant_ids(items, target_ids)
+
+    if deleted_ids:
+        _delete_title_ids(db, set(deleted_ids))
+        db.commit()
+        dimensions.titles.invalidate()
+        eligibility.invalidate()
+    return {
+        "deleted": len(deleted_ids),
+        "skipped": len(errors),
+        "deleted_ids": deleted_ids,
+        "errors": errors,
+    }
 
 
 def batch_titles(
     db: Session, action: str, title_ids: list[int]
 ) -> dict[str, int | list[dict[str, object]]]:
+    if action == "delete":
+        result = delete_titles(db, title_ids)
+        return {
+            "updated": 0,
+            "deleted": result["deleted"],
+            "skipped": result["skipped"],
+            "errors": result["errors"],
+        }
+
     items = TitleRepo(db).list()
     existing = {item.id for item in items}
     unique_ids = [item for item in _normalize_ids(title_ids) if item in existing]
@@ -282,21 +303,10 @@ def batch_titles(
             .where(Title.id.in_(target_ids))
             .values(is_active=is_active)
         )
+        changes.record(db, "titles", target_ids)
         db.commit()
         return {"updated": len(target_ids), "deleted": 0, "skipped": 0, "errors": []}
 
-    if action == "delete":
-        target_ids = set(_collect_descendant_ids(items, unique_ids))
-        db.execute(
-            Expert.__table__.update()
-            .where(Expert.title_id.in_(target_ids))
-            .values(title_id=None, title=None)
-        )
-        _cleanup_rules_for_titles(db, target_ids)
-        db.execute(delete(Title).where(Title.id.in_(target_ids)))
-        db.commit()
-        return {"updated": 0, "deleted": len(target_ids), "skipped": 0, "errors": []}
-
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid action")
 
 
@@ -306,35 +316,35 @@ def resolve_title(
     title_name: str | None,
     strict: bool = True,
     create_if_missing: bool = False,
-) -> Title | None:
-    repo = TitleRepo(db)
+) -> DimensionRef | None:
+    cache = dimensions.titles
     title = None
     if title_id is not None:
-        title = repo.get_by_id(title_id)
+        title = cache.get_by_id(db, title_id)
         if title is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Title not found",
             )
     elif title_name:
-        title = repo.get_by_name(title_name)
+        title = cache.get_by_name(db, title_name)
         if title is None and strict:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Title not found",
             )
         if title is None and create_if_missing:
-            title = Title(
-                name=title_name,
-                code=_generate_unique_code(repo),
-                is_active=True,
-                sort_order=0,
-            )
-            db.add(title)
-            db.flush()
+            title = cache.create_many(db, [title_name])[title_name]
     return title
 
 
+def resolve_titles(
+    db: Session, names: list[str], create_if_missing: bool = False
+) -> dict[str, DimensionRef]:
+    """Map each known (or, optionally, newly created) title name to its ref."""
+    return dimensions.titles.resolve_names(db, names, create_if_missing)
+
+
 def expand_to_leaf_ids(db: Session, selected_ids: list[int]) -> list[int]:
     normalized = _normalize_ids(selected_ids)
     if not normalized:
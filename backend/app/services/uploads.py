@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines
+    fcntl = None
+
+ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".pdf"}
+HASH_READ_SIZE = 1024 * 1024
+
+
+@dataclass
+class StoredFile:
+    path: str
+    filename: str
+    sha256: str
+    size: int
+    deduplicated: bool
+
+
+def max_upload_bytes() -> int:
+    return settings.upload_max_mb * 1024 * 1024
+
+
+def _upload_root() -> Path:
+    return Path(settings.upload_dir).resolve()
+
+
+def _staging_root() -> Path:
+    # Kept outside the served upload dir so partial files are never public.
+    path = Path(settings.upload_staging_dir).resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def validate_suffix(filename: str | None) -> str:
+    if not filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Missing filename"
+        )
+    suffix = Path(filename).suffix.lower()
+    if suffix not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type"
+        )
+    return suffix
+
+
+def check_declared_size(size: int | None) -> None:
+    if size is not None and size > max_upload_bytes():
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"File exceeds {settings.upload_max_mb} MB",
+        )
+
+
+def _place(
+    staged: Path, digest: str, suffix: str, size: int, folder: str
+) -> StoredFile:
+    """Move a staged file to its content address, keeping an existing copy."""
+    filename = f"{digest}{suffix}"
+    relative_path = f"{folder}/{digest[:2]}/{filename}"
+    target = _upload_root() / relative_path
+    if target.exists():
+        staged.unlink(missing_ok=True)
+        return StoredFile(relative_path, filename, digest, size, True)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(staged, target)
+    except OSError:
+        # Staging and upload dirs on different filesystems.
+        shutil.move(str(staged), str(target))
+    return StoredFile(relative_path, filename, digest, size, False)
+
+
+def _write_hashed(buffer: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+
+async def store_stream(
+    chunks: AsyncIterator[bytes], suffix: str, folder: str = "experts"
+) -> StoredFile:
+    """Stream chunks to a staging file, hashing as they arrive."""
+    limit = max_upload_bytes()
+    staged = _staging_root() / f"{uuid4().hex}.tmp"
+    digest = hashlib.sha256()
+    size = 0
+    buffer: BinaryIO = await run_in_threadpool(staged.open, "wb")
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            size += len(chunk)
+            if size > limit:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail=f"File exceeds {settings.upload_max_mb} MB",
+                )
+            await run_in_threadpool(_write_hashed, buffer, digest, chunk)
+        await run_in_threadpool(buffer.close)
+        if size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Empty file"
+            )
+        return await run_in_threadpool(
+            _place, staged, digest.hexdigest(), suffix, size, folder
+        )
+    except BaseException:
+        buffer.close()
+        staged.unlink(missing_ok=True)
+        raise
+
+
+# Resumable uploads: a session is a staging file plus a small JSON sidecar, so
+# any worker sharing the staging dir can accept the next chunk. Appends and
+# completion hold an exclusive flock on the part file, so one session only
+# ever has one writer.
+
+
+def _upload_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+
+
+def _session_paths(upload_id: str) -> tuple[Path, Path]:
+    if len(upload_id) != 32 or not all(ch in "0123456789abcdef" for ch in upload_id):
+        raise _upload_not_found()
+    root = _staging_root()
+    return root / f"{upload_id}.part", root / f"{upload_id}.json"
+
+
+def _session_status(upload_id: str, meta: dict, received: int) -> dict:
+    return {
+        "upload_id": upload_id,
+        "filename": meta["filename"],
+        "size": meta["size"],
+        "received": received,
+        "chunk_size": settings.upload_chunk_mb * 1024 * 1024,
+        "complete": received == meta["size"],
+    }
+
+
+def _load_session(upload_id: str) -> tuple[Path, dict]:
+    part, sidecar = _session_paths(upload_id)
+    try:
+        meta = json.loads(sidecar.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise _upload_not_found() from None
+    return part, meta
+
+
+def _open_locked(part: Path, mode: str) -> BinaryIO:
+    try:
+        handle: BinaryIO = part.open(mode)
+    except FileNotFoundError:
+        raise _upload_not_found() from None
+    if fcntl is None:
+        return handle
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Upload is busy"
+        ) from None
+    # A completion may have moved the file between open and lock.
+    try:
+        current = part.stat().st_ino
+    except FileNotFoundError:
+        current = None
+    if current != os.fstat(handle.fileno()).st_ino:
+        handle.close()
+        raise _upload_not_found()
+    return handle
+
+
+def _purge_stale_sessions() -> None:
+    cutoff = time.time() - settings.upload_session_ttl_hours * 3600
+    for path in _staging_root().iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue
+
+
+def create_session(filename: str, size: int, folder: str = "experts") -> dict:
+    suffix = validate_suffix(filename)
+    check_declared_size(size)
+    _purge_stale_sessions()
+    upload_id = uuid4().hex
+    part, sidecar = _session_paths(upload_id)
+    part.touch()
+    meta = {"filename": filename, "suffix": suffix, "size": size, "folder": folder}
+    sidecar.write_text(json.dumps(meta), encoding="utf-8")
+    return _session_status(upload_id, meta, 0)
+
+
+def get_session(upload_id: str) -> dict:
+    part, meta = _load_session(upload_id)
+    try:
+        received = part.stat().st_size
+    except FileNotFoundError:
+        raise _upload_not_found() from None
+    return _session_status(upload_id, meta, received)
+
+
+async def append_chunk(
+    upload_id: str,
+    start: int,
+    end: int,
+    total: int | None,
+    chunks: AsyncIterator[bytes],
+) -> dict:
+    """Append the Content-Range ``start-end/total`` chunk to a session."""
+    part, meta = await run_in_threadpool(_load_session, upload_id)
+    if end < start or (total is not None and total != meta["size"]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Content-Range does not match the upload",
+        )
+    if end >= meta["size"]:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Chunk exceeds declared size",
+        )
+    buffer = await run_in_threadpool(_open_locked, part, "ab")
+    try:
+        received = os.fstat(buffer.fileno()).st_size
+        if start != received:
+            # The client resumes from the offset it is told about.
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"message": "Offset mismatch", "received": received},
+            )
+        expected = end - start + 1
+        written = 0
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            written += len(chunk)
+            if written > expected:
+                break
+            await run_in_threadpool(buffer.write, chunk)
+        if written != expected:
+            await run_in_threadpool(buffer.truncate, start)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Chunk length does not match Content-Range",
+            )
+    finally:
+        await run_in_threadpool(buffer.close)
+    return _session_status(upload_id, meta, start + written)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def complete_session(upload_id: str) -> StoredFile:
+    part, meta = _load_session(upload_id)
+    handle = _open_locked(part, "rb")
+    try:
+        received = os.fstat(handle.fileno()).st_size
+        if received != meta["size"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"message": "Upload incomplete", "received": received},
+            )
+        stored = _place(
+            part, _hash_file(part), meta["suffix"], received, meta["folder"]
+        )
+        _session_paths(upload_id)[1].unlink(missing_ok=True)
+    finally:
+        handle.close()
+    return stored
+
+
+def cancel_session(upload_id: str) -> None:
+    for path in _session_paths(upload_id):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db import seeds
+from app.db.base import Base
+from app.models.expert import Expert
+
+DATASET_SIZES = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+}
+DEFAULT_SEED = 20240101
+
+
+def _data_dir() -> Path:
+    raw = os.getenv("BENCH_DATA_DIR")
+    path = Path(raw) if raw else Path(tempfile.gettempdir()) / "pickone-bench"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def resolve_size(name: str) -> int:
+    if name in DATASET_SIZES:
+        return DATASET_SIZES[name]
+    try:
+        return int(name)
+    except ValueError as exc:
+        raise ValueError(f"Unknown dataset size: {name}") from exc
+
+
+def _schema_tag() -> str:
+    # Cached datasets are keyed by the model schema so that new columns or
+    # tables never run against a stale file.
+    digest = hashlib.sha1()
+    for table in Base.metadata.sorted_tables:
+        digest.update(table.name.encode())
+        for column in table.columns:
+            digest.update(f"{column.name}:{column.type}".encode())
+    return digest.hexdigest()[:8]
+
+
+def dataset_path(name: str, seed: int = DEFAULT_SEED) -> Path:
+    return _data_dir() / f"experts_{resolve_size(name)}_{seed}_{_schema_tag()}.db"
+
+
+def build_dataset(db: Session, expert_count: int, seed: int = DEFAULT_SEED) -> None:
+    permissions = seeds.seed_permissions(db)
+    roles = seeds.seed_roles(db, permissions)
+    seeds.seed_admin_user(db, roles)
+    seeds.seed_titles_from_json(db)
+    seeds.seed_specialties_from_json(db)
+    seeds.seed_regions_from_json(db)
+    seeds._seed_random_experts_bulk(db, target_total=expert_count, seed=seed)
+    db.commit()
+
+
+def open_dataset(
+    name: str, seed: int = DEFAULT_SEED, rebuild: bool = False
+) -> tuple[Engine, sessionmaker]:
+    """Return an engine for a cached SQLite dataset, building it on first use."""
+    path = dataset_path(name, seed)
+    if rebuild and path.exists():
+        path.unlink()
+    engine = create_engine(f"sqlite:///{path}")
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(engine)
+    expert_count = resolve_size(name)
+    with factory() as db:
+        current = db.execute(select(func.count()).select_from(Expert)).scalar_one()
+        if current < expert_count:
+            build_dataset(db, expert_count, seed)
+    return engine, factory
@@ -0,0 +1,146 @@
+"""In-process ASGI load test for the read-heavy API endpoints.
+
+Usage: python -m benchmarks.load --size 10k --requests 500 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlalchemy import select
+
+from app.apis.deps import get_db
+from app.core.security import create_access_token
+from app.main import app
+from app.models.user import User
+from app.services import draws as draw_service
+from benchmarks.datasets import DEFAULT_SEED, open_dataset, resolve_size
+from benchmarks.micro import cleanup_fixtures, prepare_fixtures
+from benchmarks.timing import build_report, summarize, write_report
+
+
+def build_scenarios(fx) -> dict[str, str]:
+    return {
+        "experts.page": "/api/v1/experts?page=1&page_size=20",
+        "experts.page.specialty": f"/api/v1/experts?specialty_id={fx.root_specialty_id}",
+        "experts.page.region": f"/api/v1/experts?region_id={fx.region_id}",
+        "experts.all": "/api/v1/experts/all",
+        "organizations.all": "/api/v1/organizations/all",
+        "regions.all": "/api/v1/regions/all",
+        "titles.tree": "/api/v1/titles/tree",
+        "categories.tree": "/api/v1/categories/tree",
+        "draws.page": "/api/v1/draws?page=1&page_size=20",
+        "draws.get": f"/api/v1/draws/{fx.draw_id}",
+        "draws.results": f"/api/v1/draws/{fx.draw_id}/results",
+        "health": "/health",
+    }
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient, path: str, requests: int, concurrency: int
+) -> dict[str, object]:
+    samples: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+
+    async def worker() -> None:
+        nonlocal errors
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            response = await client.get(path)
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    summary = summarize(samples)
+    summary["errors"] = errors
+    summary["throughput_rps"] = round(len(samples) / elapsed, 2) if elapsed else 0.0
+    return summary
+
+
+async def _run_all(
+    scenarios: dict[str, str], token: str, requests: int, concurrency: int
+) -> dict[str, object]:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    results: dict[str, object] = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers
+    ) as client:
+        for name, path in scenarios.items():
+            await client.get(path)
+            results[name] = await _run_scenario(client, path, requests, concurrency)
+    return results
+
+
+def run(
+    size: str,
+    requests: int,
+    concurrency: int,
+    seed: int,
+    only: list[str] | None,
+) -> dict[str, object]:
+    engine, factory = open_dataset(size, seed)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with factory() as db:
+        fx = prepare_fixtures(db)
+        draw_service.execute_draw(db, fx.draw_id)
+        admin = db.execute(
+            select(User).where(User.is_superuser.is_(True)).order_by(User.id)
+        ).scalars().first()
+        if admin is None:
+            raise RuntimeError("Dataset has no superuser")
+        token = create_access_token(subject=str(admin.id), scopes=["*"])
+    scenarios = {
+        name: path
+        for name, path in build_scenarios(fx).items()
+        if not only or any(name.startswith(prefix) for prefix in only)
+    }
+    try:
+        results = asyncio.run(_run_all(scenarios, token, requests, concurrency))
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        with factory() as db:
+            cleanup_fixtures(db)
+        engine.dispose()
+    report = build_report("load", size, results)
+    report["experts"] = resolve_size(size)
+    report["requests"] = requests
+    report["concurrency"] = concurrency
+    report["seed"] = seed
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the in-process ASGI load test.")
+    parser.add_argument("--size", default="1k", help="1k, 10k, 100k or an expert count")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--only", action="append", help="Run scenarios with this prefix")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+    report = run(args.size, args.requests, args.concurrency, args.seed, args.only)
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
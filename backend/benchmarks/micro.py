@@ -0,0 +1,275 @@
+"""Micro-benchmarks for the service functions on the draw and expert hot paths.
+
+Usage: python -m benchmarks.micro --size 10k --iterations 20 --output micro.json
+"""
+
+import argparse
+from dataclasses import dataclass
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Callable
+
+from openpyxl import Workbook
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.draw import DrawApplication, DrawCandidateSnapshot, DrawResult
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.rule import Rule
+from app.models.specialty import Specialty
+from app.models.title import Title
+from app.schemas.draw import DrawApply
+from app.schemas.expert import ExpertQuery
+from app.schemas.rule import RuleCreate
+from app.services import draws as draw_service
+from app.services import experts as expert_service
+from app.services import rules as rule_service
+from app.services import specialties as specialty_service
+from app.services import titles as title_service
+from benchmarks.datasets import DEFAULT_SEED, open_dataset, resolve_size
+from benchmarks.timing import build_report, measure, summarize, write_report
+
+BENCH_RULE_NAME = "__bench_rule__"
+BENCH_ID_CARD_PREFIX = "BENCH"
+IMPORT_ROWS = 200
+
+
+@dataclass
+class Fixtures:
+    rule_id: int
+    draw_id: int
+    root_specialty_id: int
+    leaf_specialty_id: int
+    organization_id: int | None
+    region_id: int | None
+    title_id: int | None
+    leaf_codes: list[str]
+
+
+def _most_common(db: Session, column) -> int | None:
+    row = db.execute(
+        select(column, func.count())
+        .where(column.is_not(None))
+        .group_by(column)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).first()
+    return row[0] if row else None
+
+
+def _root_of(db: Session, model, node_id: int) -> int:
+    parents = dict(db.execute(select(model.id, model.parent_id)).all())
+    current = node_id
+    while parents.get(current) is not None:
+        current = parents[current]
+    return current
+
+
+def prepare_fixtures(db: Session) -> Fixtures:
+    cleanup_fixtures(db)
+    leaf_specialty_id = _most_common(db, ExpertSpecialty.specialty_id)
+    if leaf_specialty_id is None:
+        raise RuntimeError("Dataset has no expert specialties")
+    parent_id = db.execute(
+        select(Specialty.parent_id).where(Specialty.id == leaf_specialty_id)
+    ).scalar_one()
+    rule = rule_service.create_rule(
+        db,
+        RuleCreate(
+            name=BENCH_RULE_NAME,
+            specialty_ids=[parent_id if parent_id is not None else leaf_specialty_id],
+        ),
+    )
+    draw = draw_service.create_draw(
+        db,
+        DrawApply(expert_count=5, backup_count=3, rule_id=rule.id),
+        None,
+    )
+    title_id = _most_common(db, Expert.title_id)
+    if title_id is not None:
+        title_id = db.execute(
+            select(Title.parent_id).where(Title.id == title_id)
+        ).scalar_one() or title_id
+    leaf_codes = list(
+        db.execute(
+            select(Specialty.code)
+            .join(ExpertSpecialty, ExpertSpecialty.specialty_id == Specialty.id)
+            .where(Specialty.code.is_not(None))
+            .distinct()
+            .limit(50)
+        )
+        .scalars()
+        .all()
+    )
+    return Fixtures(
+        rule_id=rule.id,
+        draw_id=draw.id,
+        root_specialty_id=_root_of(db, Specialty, leaf_specialty_id),
+        leaf_specialty_id=leaf_specialty_id,
+        organization_id=_most_common(db, Expert.organization_id),
+        region_id=_most_common(db, Expert.region_id),
+        title_id=title_id,
+        leaf_codes=leaf_codes,
+    )
+
+
+def cleanup_fixtures(db: Session) -> None:
+    rule_ids = list(
+        db.execute(select(Rule.id).where(Rule.name == BENCH_RULE_NAME)).scalars().all()
+    )
+    if rule_ids:
+        draw_ids = select(DrawApplication.id).where(DrawApplication.rule_id.in_(rule_ids))
+        db.execute(delete(DrawResult).where(DrawResult.draw_id.in_(draw_ids)))
+        db.execute(
+            delete(DrawCandidateSnapshot).where(
+                DrawCandidateSnapshot.draw_id.in_(draw_ids)
+            )
+        )
+        db.execute(delete(DrawApplication).where(DrawApplication.rule_id.in_(rule_ids)))
+        db.execute(delete(Rule).where(Rule.id.in_(rule_ids)))
+    _cleanup_imported(db)
+    db.commit()
+
+
+def _cleanup_imported(db: Session) -> None:
+    expert_ids = list(
+        db.execute(
+            select(Expert.id).where(Expert.id_card_no.like(f"{BENCH_ID_CARD_PREFIX}%"))
+        )
+        .scalars()
+        .all()
+    )
+    if expert_ids:
+        expert_service.delete_experts(db, expert_ids)
+
+
+def _reset_draw(db: Session, draw_id: int) -> None:
+    db.execute(delete(DrawResult).where(DrawResult.draw_id == draw_id))
+    db.execute(
+        delete(DrawCandidateSnapshot).where(DrawCandidateSnapshot.draw_id == draw_id)
+    )
+    draw_service.candidate_pools.discard(draw_id)
+    db.execute(
+        DrawApplication.__table__.update()
+        .where(DrawApplication.id == draw_id)
+        .values(status="pending", executed_at=None, execution_key=None)
+    )
+    db.commit()
+    db.expire_all()
+
+
+def _build_import_file(leaf_codes: list[str], rows: int) -> SimpleNamespace:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(expert_service.EXPORT_HEADERS)
+    for index in range(rows):
+        codes = ";".join(leaf_codes[index % len(leaf_codes) :][:2]) if leaf_codes else ""
+        worksheet.append(
+            [
+                f"导入{index}",
+                "male",
+                f"{BENCH_ID_CARD_PREFIX}{index:013d}",
+                f"139{index:08d}",
+                "Org-001",
+                None,
+                None,
+                codes,
+                None,
+                1,
+            ]
+        )
+    output = BytesIO()
+    workbook.save(output)
+    return SimpleNamespace(file=output)
+
+
+Case = tuple[Callable[[], object], Callable[[], object] | None]
+
+
+def build_cases(db: Session, fx: Fixtures) -> dict[str, Case]:
+    def list_with(**filters) -> Callable[[], object]:
+        params = ExpertQuery(page=1, page_size=20, **filters)
+        return lambda: expert_service.list_experts(db, params)
+
+    page_experts = list(
+        db.execute(select(Expert).order_by(Expert.id).limit(200)).scalars().all()
+    )
+    import_file = _build_import_file(fx.leaf_codes, IMPORT_ROWS)
+
+    cases: dict[str, Case] = {
+        "execute_draw": (
+            lambda: draw_service.execute_draw(db, fx.draw_id),
+            lambda: _reset_draw(db, fx.draw_id),
+        ),
+        "list_experts.none": (list_with(), None),
+        "list_experts.keyword": (list_with(keyword="王"), None),
+        "list_experts.organization_id": (list_with(organization_id=fx.organization_id), None),
+        "list_experts.region_id": (list_with(region_id=fx.region_id), None),
+        "list_experts.title_id": (list_with(title_id=fx.title_id), None),
+        "list_experts.specialty_id": (list_with(specialty_id=fx.root_specialty_id), None),
+        "list_experts.is_active": (list_with(is_active=True), None),
+        "list_experts.gender": (list_with(gender="female"), None),
+        "specialties.expand_to_leaf_ids": (
+            lambda: specialty_service.expand_to_leaf_ids(db, [fx.root_specialty_id]),
+            None,
+        ),
+        "titles.expand_to_leaf_ids": (
+            lambda: title_service.expand_to_leaf_ids(db, [fx.title_id] if fx.title_id else []),
+            None,
+        ),
+        "_attach_expert_details.200": (
+            lambda: expert_service._attach_expert_details(db, page_experts),
+            None,
+        ),
+        f"import_experts.{IMPORT_ROWS}": (
+            lambda: expert_service.import_experts(db, import_file),
+            lambda: _cleanup_imported(db),
+        ),
+        "export_experts": (lambda: expert_service.export_experts(db), None),
+        "export_signin_sheet": (
+            lambda: draw_service.export_signin_sheet(db, fx.draw_id),
+            None,
+        ),
+    }
+    return cases
+
+
+def run(size: str, iterations: int, seed: int, only: list[str] | None) -> dict[str, object]:
+    engine, factory = open_dataset(size, seed)
+    results: dict[str, object] = {}
+    with factory() as db:
+        fx = prepare_fixtures(db)
+        try:
+            draw_service.execute_draw(db, fx.draw_id)
+            for name, (bench, setup) in build_cases(db, fx).items():
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                runs = iterations
+                if name.startswith(("export_experts", "import_experts")):
+                    runs = max(1, iterations // 5)
+                samples = measure(bench, runs, setup=setup)
+                results[name] = summarize(samples)
+        finally:
+            db.rollback()
+            cleanup_fixtures(db)
+    engine.dispose()
+    report = build_report("micro", size, results)
+    report["experts"] = resolve_size(size)
+    report["seed"] = seed
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run service micro-benchmarks.")
+    parser.add_argument("--size", default="1k", help="1k, 10k, 100k or an expert count")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--only", action="append", help="Run cases with this prefix")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+    write_report(run(args.size, args.iterations, args.seed, args.only), args.output)
+
+
+if __name__ == "__main__":
+    main()
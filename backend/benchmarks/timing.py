@@ -0,0 +1,83 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = rank - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+def summarize(samples: list[float]) -> dict[str, float | int]:
+    """Summarize durations given in seconds as milliseconds."""
+    millis = [value * 1000 for value in samples]
+    return {
+        "count": len(millis),
+        "min_ms": round(min(millis), 3) if millis else 0.0,
+        "mean_ms": round(statistics.fmean(millis), 3) if millis else 0.0,
+        "p50_ms": round(percentile(millis, 50), 3),
+        "p95_ms": round(percentile(millis, 95), 3),
+        "p99_ms": round(percentile(millis, 99), 3),
+        "max_ms": round(max(millis), 3) if millis else 0.0,
+    }
+
+
+def measure(
+    func: Callable[[], object],
+    iterations: int,
+    warmup: int = 1,
+    setup: Callable[[], object] | None = None,
+) -> list[float]:
+    samples: list[float] = []
+    for index in range(warmup + iterations):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        if index >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def git_revision() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def build_report(kind: str, dataset: str, results: dict[str, object]) -> dict[str, object]:
+    return {
+        "kind": kind,
+        "dataset": dataset,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+
+
+def write_report(report: dict[str, object], output: str | None) -> None:
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if output:
+        Path(output).write_text(payload, encoding="utf-8")
+    print(payload)
@@ -0,0 +1,58 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+_ROOT = tempfile.mkdtemp(prefix="pickone-tests-")
+atexit.register(shutil.rmtree, _ROOT, ignore_errors=True)
+# Settings are read at import time, so point them at scratch storage first.
+os.environ["DATABASE_URL"] = f"sqlite:///{_ROOT}/test.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_ROOT, "uploads")
+os.environ["UPLOAD_STAGING_DIR"] = os.path.join(_ROOT, "uploads-staging")
+os.environ["EVENT_BROKER"] = "memory"
+
+import pytest  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import dimensions, draws, eligibility  # noqa: E402
+from app.services import specialties  # noqa: E402
+
+# Requests made through the API client are held to their @query_budget.
+pytest_plugins = ["pytester", "app.core.pytest_query_budget"]
+
+
+def _reset_caches() -> None:
+    draws.candidate_pools.clear()
+    eligibility.invalidate()
+    specialties.invalidate_leaf_index()
+    for cache in dimensions.CACHES.values():
+        cache.invalidate()
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    _reset_caches()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        _reset_caches()
+
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    user = User(username="admin", hashed_password="-", is_superuser=True)
+    db.add(user)
+    db.commit()
+    token = create_access_token(str(user.id), ["*"])
+    return TestClient(app, headers={"Authorization": f"Bearer {token}"})
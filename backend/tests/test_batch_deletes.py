@@ -0,0 +1,92 @@
+from sqlalchemy import select
+
+from app.models.associations import rule_regions
+from app.models.expert import Expert
+from app.models.organization import Organization
+from app.models.region import Region
+from app.models.title import Title
+from app.repo.utils import IN_CHUNK_SIZE
+from app.schemas.rule import RuleCreate
+from app.services import organizations as organization_service
+from app.services import regions as region_service
+from app.services import rules as rule_service
+from app.services import titles as title_service
+
+
+def test_organizations_report_each_id(db):
+    by_id, by_name, free = (Organization(name=name) for name in ("A", "B", "C"))
+    db.add_all([by_id, by_name, free])
+    db.flush()
+    db.add_all(
+        [
+            Expert(name="X", id_card_no="X1", organization_id=by_id.id),
+            # A legacy expert that only carries the company name.
+            Expert(name="Y", id_card_no="Y1", company="B"),
+        ]
+    )
+    db.commit()
+
+    result = organization_service.delete_organizations(
+        db, [free.id, by_id.id, 999, by_name.id, free.id]
+    )
+    assert result == {
+        "deleted": 1,
+        "skipped": 3,
+        "deleted_ids": [free.id],
+        "errors": [
+            {"id": by_id.id, "detail": "Organization is in use"},
+            {"id": 999, "detail": "Organization not found"},
+            {"id": by_name.id, "detail": "Organization is in use"},
+        ],
+    }
+    remaining = db.execute(select(Organization.id).order_by(Organization.id))
+    assert remaining.scalars().all() == [by_id.id, by_name.id]
+
+
+def test_regions_detach_rules_across_chunks(db):
+    regions = [Region(name=f"R{index}") for index in range(IN_CHUNK_SIZE + 2)]
+    db.add_all(regions)
+    db.commit()
+    kept, first, last = regions[0], regions[1], regions[-1]
+    rule = rule_service.create_rule(
+        db,
+        RuleCreate(name="R", region_required_ids=[first.id, kept.id, last.id]),
+    )
+
+    doomed = [region.id for region in regions[1:]]
+    result = region_service.delete_regions(db, doomed + [999])
+    assert result["deleted"] == len(doomed)
+    assert result["deleted_ids"] == doomed
+    assert result["errors"] == [{"id": 999, "detail": "Region not found"}]
+
+    links = db.execute(
+        select(rule_regions.c.region_id).where(rule_regions.c.rule_id == rule.id)
+    )
+    assert links.scalars().all() == [kept.id]
+    db.refresh(rule)
+    assert rule.region_required_ids == [kept.id]
+    assert rule.region_required == "R0"
+    assert rule.region_required_id == kept.id
+
+
+def test_titles_expand_descendants_and_detach_experts(db):
+    parent = Title(name="Engineer")
+    db.add(parent)
+    db.flush()
+    child = Title(name="Senior engineer", parent_id=parent.id)
+    db.add(child)
+    db.flush()
+    expert = Expert(name="X", id_card_no="X1", title_id=child.id, title=child.name)
+    db.add(expert)
+    db.commit()
+    parent_id, child_id = parent.id, child.id
+
+    result = title_service.delete_titles(db, [parent_id, 999])
+    assert result == {
+        "deleted": 2,
+        "skipped": 1,
+        "deleted_ids": [parent_id, child_id],
+        "errors": [{"id": 999, "detail": "Title not found"}],
+    }
+    db.refresh(expert)
+    assert (expert.title_id, expert.title) == (None, None)
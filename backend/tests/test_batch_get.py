@@ -0,0 +1,46 @@
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.region import Region
+from app.models.specialty import Specialty
+from app.schemas.batch import MAX_BATCH_GET_IDS
+
+
+def test_experts_follow_requested_order_and_report_missing(db, client):
+    specialty = Specialty(name="Bridges")
+    experts = [Expert(name=f"E{index}", id_card_no=f"ID{index}") for index in range(3)]
+    db.add_all([specialty, *experts])
+    db.flush()
+    db.add(ExpertSpecialty(expert_id=experts[2].id, specialty_id=specialty.id))
+    db.commit()
+    first, _second, third = (expert.id for expert in experts)
+
+    response = client.post(
+        "/api/v1/experts/batch-get",
+        json={"ids": [third, 999, first, third, 998]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [third, first]
+    assert body["items"][0]["specialty_ids"] == [specialty.id]
+    assert body["missing_ids"] == [999, 998]
+
+
+def test_dimension_batch_get(db, client):
+    north, south = Region(name="North"), Region(name="South")
+    db.add_all([north, south])
+    db.commit()
+
+    response = client.post(
+        "/api/v1/regions/batch-get", json={"ids": [south.id, 42, north.id]}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["name"] for item in body["items"]] == ["South", "North"]
+    assert body["missing_ids"] == [42]
+
+
+def test_batch_get_limits_request_size(db, client):
+    url = "/api/v1/experts/batch-get"
+    ids = list(range(1, MAX_BATCH_GET_IDS + 2))
+    assert client.post(url, json={"ids": ids}).status_code == 422
+    assert client.post(url, json={"ids": []}).status_code == 422
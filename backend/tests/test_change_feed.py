@@ -0,0 +1,81 @@
+from app.db.session import SessionLocal
+from app.models.expert import Expert
+from app.models.organization import Organization
+from app.schemas.organization import OrganizationCreate, OrganizationUpdate
+from app.services import changes
+from app.services import experts as expert_service
+from app.services import organizations as organization_service
+
+ENTITIES = ["experts", "organizations"]
+
+
+def _feed(db, since=None, limit=100):
+    page = changes.list_changes(db, since, limit, ENTITIES)
+    return [(item["entity"], item["op"], item["id"]) for item in page["changes"]], page
+
+
+def test_transaction_open_when_cursor_was_issued_is_delivered(db):
+    first = organization_service.create_organization(db, OrganizationCreate(name="A"))
+    writer = SessionLocal()
+    try:
+        late = Organization(name="B")
+        writer.add(late)
+        writer.flush()
+        # A client syncs while the writer's transaction is still open.
+        seen, page = _feed(db)
+        assert seen == [("organizations", "upsert", first.id)]
+        db.rollback()
+        writer.commit()
+        late_id = late.id
+    finally:
+        writer.close()
+
+    seen, _page = _feed(db, page["next_cursor"])
+    assert seen == [("organizations", "upsert", late_id)]
+
+
+def test_bulk_writes_are_logged_once_per_row(db):
+    organization = organization_service.create_organization(
+        db, OrganizationCreate(name="Acme")
+    )
+    expert = Expert(
+        name="Li", id_card_no="X0001", company="Acme", organization_id=organization.id
+    )
+    db.add(expert)
+    db.commit()
+    _seen, page = _feed(db)
+
+    # The rename cascades to the expert through a bulk update.
+    organization_service.update_organization(
+        db, organization.id, OrganizationUpdate(name="Acme Ltd")
+    )
+    seen, renamed = _feed(db, page["next_cursor"])
+    assert sorted(seen) == [
+        ("experts", "upsert", expert.id),
+        ("organizations", "upsert", organization.id),
+    ]
+    data = {item["entity"]: item["data"] for item in renamed["changes"]}
+    assert data["experts"]["company"] == "Acme Ltd"
+
+    expert_service.delete_experts(db, [expert.id])
+    organization_service.delete_organizations(db, [organization.id])
+    expected = [
+        ("experts", "delete", expert.id),
+        ("organizations", "delete", organization.id),
+    ]
+    seen, _page = _feed(db, renamed["next_cursor"])
+    assert seen == expected
+    # A sync from the start only sees each row's latest change.
+    seen, _page = _feed(db)
+    assert seen == expected
+
+
+def test_rolled_back_writes_are_not_logged(db):
+    db.add(Organization(name="Gone"))
+    db.flush()
+    db.rollback()
+    organization_service.create_organization(db, OrganizationCreate(name="Kept"))
+
+    seen, page = _feed(db, limit=1)
+    assert [op for _entity, op, _id in seen] == ["upsert"]
+    assert page["has_more"] is False
@@ -0,0 +1,35 @@
+from sqlalchemy import delete, update
+
+from app.models.organization import Organization
+from app.schemas.organization import OrganizationCreate
+from app.services import dimensions
+from app.services import organizations as organization_service
+
+
+def _create(db, name: str) -> int:
+    return organization_service.create_organization(db, OrganizationCreate(name=name)).id
+
+
+def test_deleted_row_is_not_resolved_from_snapshot(db):
+    organization_id = _create(db, "Acme")
+    cache = dimensions.organizations
+    assert cache.get_by_name(db, "Acme").id == organization_id
+    # Another worker deletes the row; this process still holds the snapshot.
+    db.execute(delete(Organization).where(Organization.id == organization_id))
+    db.commit()
+
+    assert cache.get_by_name(db, "Acme") is None
+    assert cache.get_by_id(db, organization_id) is None
+
+
+def test_recreated_row_resolves_to_new_id(db):
+    old_id = _create(db, "Acme")
+    cache = dimensions.organizations
+    assert cache.get_by_names(db, ["Acme"])["Acme"].id == old_id
+    db.execute(
+        update(Organization).where(Organization.id == old_id).values(name="Acme Old")
+    )
+    db.commit()
+    new_id = _create(db, "Acme")
+
+    assert cache.get_by_names(db, ["Acme"])["Acme"].id == new_id
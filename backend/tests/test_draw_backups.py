@@ -0,0 +1,175 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, update
+
+from app.core.id_codec import ids_checksum, pack_ids
+from app.models.draw import DrawCandidateSnapshot
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+from app.schemas.draw import DrawApply
+from app.schemas.rule import RuleCreate
+from app.services import draws as draw_service
+from app.services import experts as expert_service
+from app.services import rules as rule_service
+
+
+def _draw_with_pool(db, pool_size: int, expert_count: int, backup_count: int) -> int:
+    specialty = Specialty(name="Bridges", code="S-BRIDGE")
+    db.add(specialty)
+    db.flush()
+    for index in range(pool_size):
+        expert = Expert(name=f"Expert {index}", id_card_no=f"ID{index:04d}")
+        db.add(expert)
+        db.flush()
+        db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty.id))
+    db.commit()
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Bridge rule", specialty_ids=[specialty.id])
+    )
+    draw = draw_service.create_draw(
+        db,
+        DrawApply(expert_count=expert_count, backup_count=backup_count, rule_id=rule.id),
+        None,
+    )
+    return draw.id
+
+
+def test_top_up_skips_replaced_experts(db):
+    draw_id = _draw_with_pool(db, pool_size=2, expert_count=1, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    main = next(result for result in results if not result.is_backup)
+    rejected_expert_id = main.expert_id
+
+    draw_service.update_draw_result_contact(
+        db, draw_id, main.id, draw_service.CONTACT_STATUS_REJECTED, auto_replace=True
+    )
+
+    # The only expert left in the pool besides the promoted backup is the one
+    # who declined, so there is nobody to top up with.
+    with pytest.raises(HTTPException) as excinfo:
+        draw_service.top_up_draw_backups(db, draw_id, 1)
+    assert excinfo.value.status_code == 400
+    db.rollback()
+    drawn = {result.expert_id for result in draw_service.list_results(db, draw_id)}
+    assert rejected_expert_id not in drawn
+
+
+def test_top_up_draws_from_remaining_pool(db):
+    draw_id = _draw_with_pool(db, pool_size=3, expert_count=1, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    main = next(result for result in results if not result.is_backup)
+    rejected_expert_id = main.expert_id
+    draw_service.replace_draw_result(db, draw_id, main.id)
+
+    delta = draw_service.top_up_draw_backups(db, draw_id, 1)
+
+    (added,) = delta["changed"]
+    assert added.is_backup
+    assert added.expert_id != rejected_expert_id
+
+
+def test_top_up_ignores_pool_cached_from_replaced_snapshot(db):
+    draw_id = _draw_with_pool(db, pool_size=4, expert_count=1, backup_count=0)
+    (main,) = draw_service.execute_draw(db, draw_id)
+    # The first top-up caches the decoded snapshot in this process.
+    (backup,) = draw_service.top_up_draw_backups(db, draw_id, 1)["changed"]
+    newcomer = Expert(name="Newcomer", id_card_no="ID9999")
+    db.add(newcomer)
+    db.commit()
+    # Another worker rebuilt the snapshot; this process still caches the old pool.
+    pool = [main.expert_id, backup.expert_id, newcomer.id]
+    db.execute(
+        update(DrawCandidateSnapshot)
+        .where(DrawCandidateSnapshot.draw_id == draw_id)
+        .values(expert_ids=pack_ids(pool), checksum=ids_checksum(pool))
+    )
+    db.commit()
+
+    (added,) = draw_service.top_up_draw_backups(db, draw_id, 1)["changed"]
+
+    assert added.expert_id == newcomer.id
+
+
+def test_replace_without_snapshot_still_excludes_replaced_expert(db):
+    draw_id = _draw_with_pool(db, pool_size=3, expert_count=1, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    main = next(result for result in results if not result.is_backup)
+    # Executed before snapshots existed.
+    db.execute(delete(DrawCandidateSnapshot))
+    db.commit()
+    draw_service.candidate_pools.clear()
+
+    draw_service.replace_draw_result(db, draw_id, main.id)
+
+    (added,) = draw_service.top_up_draw_backups(db, draw_id, 1)["changed"]
+    assert added.expert_id != main.expert_id
+    with pytest.raises(HTTPException):
+        draw_service.top_up_draw_backups(db, draw_id, 1)
+
+
+def test_contact_updates_return_delta_and_keep_accepted_count(db):
+    draw_id = _draw_with_pool(db, pool_size=3, expert_count=1, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    main = next(result for result in results if not result.is_backup)
+
+    delta = draw_service.update_draw_result_contact(
+        db, draw_id, main.id, draw_service.CONTACT_STATUS_ACCEPTED, auto_replace=False
+    )
+    assert (delta["status"], delta["accepted_count"]) == ("completed", 1)
+    assert [result.id for result in delta["changed"]] == [main.id]
+    assert delta["removed_ids"] == []
+
+    # Accepting twice must not count twice.
+    delta = draw_service.update_draw_result_contact(
+        db, draw_id, main.id, draw_service.CONTACT_STATUS_ACCEPTED, auto_replace=False
+    )
+    assert delta["accepted_count"] == 1
+
+    delta = draw_service.update_draw_result_contact(
+        db, draw_id, main.id, draw_service.CONTACT_STATUS_PENDING, auto_replace=False
+    )
+    assert (delta["status"], delta["accepted_count"]) == ("scheduled", 0)
+
+
+def test_replacing_an_accepted_result_reports_swap_and_count(db):
+    draw_id = _draw_with_pool(db, pool_size=3, expert_count=1, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    main = next(result for result in results if not result.is_backup)
+    backup = next(result for result in results if result.is_backup)
+    draw_service.update_draw_result_contact(
+        db, draw_id, main.id, draw_service.CONTACT_STATUS_ACCEPTED, auto_replace=False
+    )
+
+    delta = draw_service.replace_draw_result(db, draw_id, main.id)
+
+    assert delta["removed_ids"] == [main.id]
+    (promoted,) = delta["changed"]
+    assert (promoted.id, promoted.is_backup) == (backup.id, False)
+    assert (delta["status"], delta["accepted_count"]) == ("scheduled", 0)
+
+
+def test_deleting_accepted_experts_lowers_accepted_count(db):
+    draw_id = _draw_with_pool(db, pool_size=4, expert_count=2, backup_count=1)
+    results = draw_service.execute_draw(db, draw_id)
+    first, second = (result for result in results if not result.is_backup)
+    for result in (first, second):
+        draw_service.update_draw_result_contact(
+            db,
+            draw_id,
+            result.id,
+            draw_service.CONTACT_STATUS_ACCEPTED,
+            auto_replace=False,
+        )
+    assert draw_service.get_draw(db, draw_id).status == "completed"
+
+    expert_service.delete_expert(db, first.expert_id)
+    draw = draw_service.get_draw(db, draw_id)
+    db.refresh(draw)
+    assert (draw.status, draw.accepted_count) == ("scheduled", 1)
+
+    expert_service.delete_experts(db, [second.expert_id])
+    db.refresh(draw)
+    assert draw.accepted_count == 0
+    remaining = draw_service.list_results(db, draw_id)
+    assert [result.is_backup for result in remaining] == [True]
@@ -0,0 +1,44 @@
+from sqlalchemy import insert
+
+from app.db.session import engine
+from app.models.draw import DrawEvent
+from app.services.draw_events import DatabaseBroker, Event, EventHub
+
+
+def _broker():
+    return DatabaseBroker(EventHub(queue_size=10), poll_interval=1)
+
+
+def test_publish_numbers_events_in_commit_order(db):
+    broker = _broker()
+    broker.publish(Event(None, 1, "draw_updated", {"n": 1}), engine)
+    broker.publish(Event(None, 2, "draw_updated", {"n": 2}), engine)
+    assert broker.high_water() == 2
+
+    broker._last_id = 0
+    assert [(event.id, event.draw_id) for event in broker._fetch()] == [(1, 1), (2, 2)]
+    assert [event.payload for event in broker.replay(2, 0)] == [{"n": 2}]
+    assert broker.replay(2, 2) == []
+
+
+def test_poller_keeps_rows_with_lower_ids_that_commit_later(db):
+    broker = _broker()
+    # A row inserted with a high id commits first and is polled...
+    db.execute(
+        insert(DrawEvent).values(
+            id=10, seq=1, draw_id=1, event_type="draw_updated", payload={}
+        )
+    )
+    db.commit()
+    broker._last_id = 0
+    (first,) = broker._fetch()
+    broker._last_id = first.id
+
+    # ...then a transaction that took a lower id commits.
+    db.execute(
+        insert(DrawEvent).values(
+            id=5, seq=2, draw_id=1, event_type="draw_updated", payload={}
+        )
+    )
+    db.commit()
+    assert [event.id for event in broker._fetch()] == [2]
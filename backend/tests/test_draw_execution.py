@@ -0,0 +1,72 @@
+from sqlalchemy import func, select
+
+from app.db.session import SessionLocal
+from app.models.draw import DrawResult
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+from app.schemas.draw import DrawApply
+from app.schemas.rule import RuleCreate
+from app.services import draws as draw_service
+from app.services import rules as rule_service
+
+
+def _draw(db, pool_size: int = 4) -> int:
+    specialty = Specialty(name="Bridges")
+    db.add(specialty)
+    db.flush()
+    for index in range(pool_size):
+        expert = Expert(name=f"Expert {index}", id_card_no=f"ID{index:04d}")
+        db.add(expert)
+        db.flush()
+        db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty.id))
+    db.commit()
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Bridge rule", specialty_ids=[specialty.id])
+    )
+    draw = draw_service.create_draw(
+        db, DrawApply(expert_count=2, backup_count=1, rule_id=rule.id), None
+    )
+    return draw.id
+
+
+def _result_count(db, draw_id: int) -> int:
+    return db.execute(
+        select(func.count()).where(DrawResult.draw_id == draw_id)
+    ).scalar_one()
+
+
+def test_retried_execute_with_same_key_returns_first_results(db, client):
+    draw_id = _draw(db)
+    url = f"/api/v1/draws/{draw_id}/execute"
+    headers = {"Idempotency-Key": "retry-1"}
+
+    first = client.post(url, headers=headers)
+    second = client.post(url, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert [item["id"] for item in first.json()] == [
+        item["id"] for item in second.json()
+    ]
+    assert _result_count(db, draw_id) == 3
+
+
+def test_concurrent_execute_draws_once(db, monkeypatch):
+    draw_id = _draw(db)
+    claim = draw_service._claim_draw_execution
+    winner: list[int] = []
+
+    def claim_after_other_worker(session, draw, key):
+        if key == "late-caller":
+            # Another worker executes the draw between this caller's checks
+            # and its claim.
+            with SessionLocal() as other:
+                results = draw_service.execute_draw(other, draw_id, "first-caller")
+                winner.extend(result.id for result in results)
+        return claim(session, draw, key)
+
+    monkeypatch.setattr(draw_service, "_claim_draw_execution", claim_after_other_worker)
+    results = draw_service.execute_draw(db, draw_id, "late-caller")
+
+    assert [result.id for result in results] == winner
+    assert _result_count(db, draw_id) == 3
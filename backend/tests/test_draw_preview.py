@@ -0,0 +1,52 @@
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+from app.schemas.rule import RuleCreate
+from app.schemas.specialty import SpecialtyCreate
+from app.services import draws as draw_service
+from app.services import rules as rule_service
+from app.services import specialties as specialty_service
+
+
+def _add_experts(db, specialty_id: int, count: int, offset: int = 0) -> None:
+    for index in range(offset, offset + count):
+        expert = Expert(name=f"Expert {index}", id_card_no=f"ID{index:04d}")
+        db.add(expert)
+        db.flush()
+        db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty_id))
+    db.commit()
+
+
+def _warm_index(db) -> None:
+    specialty = specialty_service.create_specialty(db, SpecialtyCreate(name="Roads"))
+    _add_experts(db, specialty.id, 1)
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Roads rule", specialty_ids=[specialty.id])
+    )
+    assert draw_service.preview_candidate_pool(db, rule.id)["eligible_count"] == 1
+
+
+def test_preview_sees_specialty_created_through_service(db):
+    _warm_index(db)
+    specialty = specialty_service.create_specialty(db, SpecialtyCreate(name="Tunnels"))
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Tunnel rule", specialty_ids=[specialty.id])
+    )
+
+    assert draw_service.preview_candidate_pool(db, rule.id)["eligible_count"] == 0
+
+
+def test_preview_falls_back_for_rows_newer_than_index(db):
+    _warm_index(db)
+    # Written behind the service's back, as another worker would.
+    specialty = Specialty(name="Bridges", code="S-BRIDGE")
+    db.add(specialty)
+    db.commit()
+    _add_experts(db, specialty.id, 2, offset=10)
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Bridge rule", specialty_ids=[specialty.id])
+    )
+
+    preview = draw_service.preview_candidate_pool(db, rule.id)
+
+    assert preview["eligible_count"] == 2
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.models.draw import DrawJob, SchedulerLease
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+from app.schemas.draw import DrawApply
+from app.schemas.rule import RuleCreate
+from app.services import draw_scheduler
+from app.services import draws as draw_service
+from app.services import rules as rule_service
+
+
+def _scheduled_draw(db, pool_size: int) -> int:
+    specialty = Specialty(name="Bridges")
+    db.add(specialty)
+    db.flush()
+    for index in range(pool_size):
+        expert = Expert(name=f"Expert {index}", id_card_no=f"ID{index:04d}")
+        db.add(expert)
+        db.flush()
+        db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty.id))
+    db.commit()
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Bridge rule", specialty_ids=[specialty.id])
+    )
+    # Inside the lead window, so the job is already due.
+    review_time = datetime.now(timezone.utc) + timedelta(minutes=5)
+    draw = draw_service.create_draw(
+        db,
+        DrawApply(
+            expert_count=2, backup_count=1, rule_id=rule.id, review_time=review_time
+        ),
+        None,
+    )
+    return draw.id
+
+
+def _job(db, draw_id: int) -> DrawJob:
+    db.expire_all()
+    return db.execute(select(DrawJob).where(DrawJob.draw_id == draw_id)).scalar_one()
+
+
+def test_only_one_holder_leads_until_the_lease_expires(db):
+    assert draw_scheduler.acquire_lease(db, "a")
+    assert not draw_scheduler.acquire_lease(db, "b")
+    assert draw_scheduler.acquire_lease(db, "a")
+
+    db.execute(
+        update(SchedulerLease).values(
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+    )
+    db.commit()
+    assert draw_scheduler.acquire_lease(db, "b")
+    assert not draw_scheduler.acquire_lease(db, "a")
+
+    draw_scheduler.release_lease(db, "b")
+    assert draw_scheduler.acquire_lease(db, "a")
+
+
+def test_claimed_job_executes_its_draw_once(db):
+    draw_id = _scheduled_draw(db, pool_size=4)
+    job_id = _job(db, draw_id).id
+
+    assert draw_scheduler.claim_due_jobs(db, "a", limit=5) == [job_id]
+    assert draw_scheduler.claim_due_jobs(db, "b", limit=5) == []
+    assert draw_scheduler.run_job(job_id, "b") == "skipped"
+
+    assert draw_scheduler.run_job(job_id, "a") == "done"
+    job = _job(db, draw_id)
+    assert (job.status, job.attempts, job.locked_by) == ("done", 1, None)
+    assert len(draw_service.list_results(db, draw_id)) == 3
+
+
+def test_job_of_a_crashed_leader_is_reclaimed(db):
+    draw_id = _scheduled_draw(db, pool_size=4)
+    job_id = _job(db, draw_id).id
+    assert draw_scheduler.claim_due_jobs(db, "crashed", limit=5) == [job_id]
+    db.execute(
+        update(DrawJob).values(
+            locked_until=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+    )
+    db.commit()
+
+    assert draw_scheduler.claim_due_jobs(db, "a", limit=5) == [job_id]
+    assert draw_scheduler.run_job(job_id, "crashed") == "skipped"
+    assert draw_scheduler.run_job(job_id, "a") == "done"
+    assert _job(db, draw_id).attempts == 2
+
+
+def test_business_failures_are_left_for_an_operator(db):
+    draw_id = _scheduled_draw(db, pool_size=2)
+    job_id = _job(db, draw_id).id
+    draw_scheduler.claim_due_jobs(db, "a", limit=5)
+
+    assert draw_scheduler.run_job(job_id, "a") == "failed"
+    job = _job(db, draw_id)
+    assert job.last_error == "Not enough qualified experts"
+    assert draw_scheduler.claim_due_jobs(db, "a", limit=5) == []
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.organization import Organization
+from app.models.specialty import Specialty
+
+URL = "/api/v1/experts/batch-update"
+
+
+def _specialties(db, expert_id: int) -> set[int]:
+    db.expire_all()
+    return set(
+        db.execute(
+            select(ExpertSpecialty.specialty_id).where(
+                ExpertSpecialty.expert_id == expert_id
+            )
+        ).scalars()
+    )
+
+
+@pytest.fixture
+def experts(db):
+    specialties = [Specialty(name=name) for name in ("Bridges", "Tunnels", "Roads")]
+    first = Expert(name="A", id_card_no="A1")
+    second = Expert(name="B", id_card_no="B1")
+    db.add_all([*specialties, first, second])
+    db.flush()
+    s1, s2, _s3 = specialties
+    db.add_all(
+        [
+            ExpertSpecialty(expert_id=first.id, specialty_id=s1.id),
+            ExpertSpecialty(expert_id=second.id, specialty_id=s1.id),
+            ExpertSpecialty(expert_id=second.id, specialty_id=s2.id),
+        ]
+    )
+    db.commit()
+    return first.id, second.id, [item.id for item in specialties]
+
+
+def test_patch_applies_to_found_experts_and_reports_missing(db, client, experts):
+    first, second, _ = experts
+    response = client.post(
+        URL,
+        json={
+            "ids": [first, 999, second, first],
+            "patch": {"is_active": False, "company": "Acme"},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "updated": 2,
+        "skipped": 1,
+        "updated_ids": [first, second],
+        "errors": [{"id": 999, "detail": "Expert not found"}],
+    }
+    # Unknown organization names are created once for the whole batch.
+    organization_id = db.execute(
+        select(Organization.id).where(Organization.name == "Acme")
+    ).scalar_one()
+    rows = db.execute(
+        select(Expert.is_active, Expert.organization_id, Expert.company).where(
+            Expert.id.in_([first, second])
+        )
+    ).all()
+    assert [tuple(row) for row in rows] == [(False, organization_id, "Acme")] * 2
+
+
+def test_add_and_remove_specialties(db, client, experts):
+    first, second, (s1, s2, s3) = experts
+    response = client.post(
+        URL,
+        json={
+            "ids": [first, second],
+            "patch": {"add_specialty_ids": [s3], "remove_specialty_ids": [s1]},
+        },
+    )
+    assert response.status_code == 200
+    assert _specialties(db, first) == {s3}
+    assert _specialties(db, second) == {s2, s3}
+
+
+def test_specialty_ids_replace_existing_links(db, client, experts):
+    first, second, (_s1, s2, _s3) = experts
+    response = client.post(
+        URL, json={"ids": [first, second], "patch": {"specialty_ids": [s2]}}
+    )
+    assert response.status_code == 200
+    assert _specialties(db, first) == {s2}
+    assert _specialties(db, second) == {s2}
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.metrics import route_template
+
+router = APIRouter()
+
+
+@router.post("/draws/{draw_id}/results/{result_id}/contact")
+def contact(draw_id: int, result_id: int, request: Request) -> dict:
+    return {"route": route_template(request.scope)}
+
+
+@router.get("/draws/")
+def draws(request: Request) -> dict:
+    return {"route": route_template(request.scope)}
+
+
+nested = APIRouter()
+
+
+@nested.get("")
+def index(request: Request) -> dict:
+    return {"route": route_template(request.scope)}
+
+
+router.include_router(nested, prefix="/experts")
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+
+
+def test_route_template_keeps_names_of_repeated_values():
+    response = TestClient(app).post("/api/v1/draws/1/results/1/contact")
+    assert response.json() == {
+        "route": "/api/v1/draws/{draw_id}/results/{result_id}/contact"
+    }
+
+
+def test_route_template_includes_root_path():
+    response = TestClient(app, root_path="/pickone").post(
+        "/api/v1/draws/7/results/3/contact"
+    )
+    assert response.json() == {
+        "route": "/pickone/api/v1/draws/{draw_id}/results/{result_id}/contact"
+    }
+
+
+def test_route_template_of_routes_without_own_path():
+    client = TestClient(app)
+    assert client.get("/api/v1/experts").json() == {"route": "/api/v1/experts"}
+    assert client.get("/api/v1/draws/").json() == {"route": "/api/v1/draws/"}
@@ -0,0 +1,43 @@
+import pytest
+
+from app.apis.v1.endpoints import organizations
+from app.core import query_budget
+from app.core.query_budget import BUDGET_ATTR, QueryBudget
+
+
+def test_budgeted_endpoint_within_budget_passes(client):
+    response = client.get("/api/v1/organizations")
+    assert response.status_code == 200
+
+
+@pytest.mark.allow_query_budget
+def test_budgeted_endpoint_over_budget_is_recorded(client, monkeypatch):
+    monkeypatch.setattr(
+        organizations.list_organizations, BUDGET_ATTR, QueryBudget(max_queries=1)
+    )
+    response = client.get("/api/v1/organizations")
+    assert response.status_code == 200
+    violations = query_budget.drain_violations()
+    assert [(v.method, v.route, v.kind) for v in violations] == [
+        ("GET", "/api/v1/organizations", "query_budget")
+    ]
+
+
+def test_plugin_fails_tests_with_violations(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+
+        from app.core.query_budget import BudgetViolation, record_violation
+
+        def test_over_budget():
+            record_violation(BudgetViolation("GET", "/x", "query_budget", "too many"))
+
+        @pytest.mark.allow_query_budget
+        def test_allowed():
+            record_violation(BudgetViolation("GET", "/x", "query_budget", "too many"))
+        """
+    )
+    result = pytester.runpytest("-p", "app.core.pytest_query_budget")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*Query budget violations:*", "*GET /x: query_budget*"])
@@ -0,0 +1,50 @@
+from sqlalchemy import and_, or_, select
+
+from app.db.query_plans import check_hot_queries, explain, find_problems
+from app.db.session import engine
+from app.models.expert import Expert
+from app.models.region import Region
+from app.schemas.expert import ExpertQuery
+from app.services import experts as expert_service
+
+
+def test_hot_queries_use_their_expected_indexes(db):
+    assert check_hot_queries(engine) == {}
+
+
+def test_active_filter_outside_the_region_or_is_flagged(db):
+    stmt = select(Expert).where(
+        Expert.is_active.is_(True),
+        or_(
+            Expert.region_id == 1,
+            and_(Expert.region_id.is_(None), Expert.region == "region"),
+        ),
+    )
+    problems = find_problems("experts.list_experts.region", explain(engine, stmt))
+    assert problems == [
+        "expected index ix_experts_active_region (is_active=? AND region_id=?) not used"
+    ]
+
+
+def test_region_filter_keeps_legacy_rows_and_active_flag(db):
+    region = Region(name="North")
+    db.add(region)
+    db.flush()
+    rows = [
+        Expert(name="A", id_card_no="A1", region_id=region.id, is_active=True),
+        Expert(name="B", id_card_no="B1", region="North", is_active=True),
+        Expert(name="C", id_card_no="C1", region="North", is_active=False),
+        Expert(name="D", id_card_no="D1", region="South", is_active=True),
+    ]
+    db.add_all(rows)
+    db.commit()
+
+    def names(**filters):
+        items, total = expert_service.list_experts(
+            db, ExpertQuery(region_id=region.id, **filters)
+        )
+        return sorted(item.name for item in items), total
+
+    assert names(is_active=True) == (["A", "B"], 2)
+    assert names(is_active=False) == (["C"], 1)
+    assert names() == (["A", "B", "C"], 3)
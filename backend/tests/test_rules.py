@@ -0,0 +1,82 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app.models.associations import rule_regions, rule_specialties, rule_titles
+from app.models.region import Region
+from app.models.rule import Rule
+from app.models.specialty import Specialty
+from app.models.title import Title
+from app.schemas.rule import RuleCreate, RuleUpdate
+from app.services import rules as rule_service
+from app.services import specialties as specialty_service
+
+
+def _links(db, table, column, rule_id):
+    return list(
+        db.execute(
+            select(table.c[column])
+            .where(table.c.rule_id == rule_id)
+            .order_by(table.c.position)
+        ).scalars()
+    )
+
+
+@pytest.fixture
+def criteria(db):
+    first, second = Specialty(name="Bridges"), Specialty(name="Tunnels")
+    title, region = Title(name="Senior"), Region(name="North")
+    db.add_all([first, second, title, region])
+    db.commit()
+    return first.id, second.id, title.id, region.id
+
+
+def test_links_are_written_from_payload_ids(db, criteria):
+    first, second, title, region = criteria
+    rule = rule_service.create_rule(
+        db,
+        RuleCreate(
+            name="R",
+            specialty_ids=[second, first, second],
+            title_required_ids=[title],
+            region_required_ids=[region],
+        ),
+    )
+    assert _links(db, rule_specialties, "specialty_id", rule.id) == [second, first]
+    assert _links(db, rule_titles, "title_id", rule.id) == [title]
+    assert _links(db, rule_regions, "region_id", rule.id) == [region]
+    assert rule.specialty_ids == [second, first]
+
+    rule_service.update_rule(db, rule.id, RuleUpdate(title_required_ids=[]))
+    assert _links(db, rule_titles, "title_id", rule.id) == []
+    assert _links(db, rule_specialties, "specialty_id", rule.id) == [second, first]
+
+
+def test_stale_json_ids_are_never_linked(db, criteria):
+    first, _second, title, _region = criteria
+    rule = rule_service.create_rule(db, RuleCreate(name="R", specialty_ids=[first]))
+    # A legacy row whose JSON cache still lists a specialty deleted long ago.
+    db.execute(update(Rule).where(Rule.id == rule.id).values(specialty_ids=[first, 999]))
+    db.commit()
+
+    rule_service.update_rule(db, rule.id, RuleUpdate(title_required_ids=[title]))
+    assert _links(db, rule_specialties, "specialty_id", rule.id) == [first]
+
+    with pytest.raises(HTTPException) as excinfo:
+        rule_service.update_rule(db, rule.id, RuleUpdate(specialty_ids=[first, 999]))
+    assert excinfo.value.status_code == 404
+    db.rollback()
+    assert _links(db, rule_specialties, "specialty_id", rule.id) == [first]
+
+
+def test_deleting_a_specialty_detaches_it_from_rules(db, criteria):
+    first, second, _title, _region = criteria
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="R", specialty_ids=[first, second])
+    )
+    specialty_service.delete_specialty(db, first)
+    db.refresh(rule)
+    assert _links(db, rule_specialties, "specialty_id", rule.id) == [second]
+    assert rule.specialty_ids == [second]
+    assert rule.specialty == "Tunnels"
+    assert rule.specialty_id == second
@@ -0,0 +1,73 @@
+from app.models.expert import Expert
+from app.models.expert_specialty import ExpertSpecialty
+from app.models.specialty import Specialty
+from app.schemas.draw import DrawApply
+from app.schemas.rule import RuleCreate
+from app.services import draws as draw_service
+from app.services import rules as rule_service
+
+
+def _executed_draw(db) -> int:
+    specialty = Specialty(name="Bridges")
+    db.add(specialty)
+    db.flush()
+    for index in range(3):
+        expert = Expert(name=f"Expert {index}", id_card_no=f"ID{index:04d}")
+        db.add(expert)
+        db.flush()
+        db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty.id))
+    db.commit()
+    rule = rule_service.create_rule(
+        db, RuleCreate(name="Bridge rule", specialty_ids=[specialty.id])
+    )
+    draw = draw_service.create_draw(
+        db, DrawApply(expert_count=1, backup_count=1, rule_id=rule.id), None
+    )
+    draw_service.execute_draw(db, draw.id)
+    return draw.id
+
+
+def test_expert_list_returns_only_requested_fields(db, client):
+    specialty = Specialty(name="Bridges")
+    expert = Expert(name="Wang Fang", id_card_no="110101199001011234")
+    db.add_all([specialty, expert])
+    db.flush()
+    db.add(ExpertSpecialty(expert_id=expert.id, specialty_id=specialty.id))
+    db.commit()
+
+    response = client.get("/api/v1/experts", params={"fields": "name,specialty_ids"})
+    assert response.status_code == 200
+    (item,) = response.json()["items"]
+    # id is always included and masking still applies.
+    assert item == {
+        "id": expert.id,
+        "name": "W*******g",
+        "specialty_ids": [specialty.id],
+    }
+
+
+def test_unknown_fields_are_rejected(db, client):
+    response = client.get("/api/v1/experts", params={"fields": "name,salary,age"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown fields: age, salary"}
+
+    response = client.get("/api/v1/draws", params={"fields": "expert"})
+    assert response.status_code == 400
+
+
+def test_draw_and_result_lists_project_fields(db, client):
+    draw_id = _executed_draw(db)
+
+    draws = client.get("/api/v1/draws", params={"fields": "status"}).json()
+    assert draws["items"] == [{"id": draw_id, "status": "scheduled"}]
+
+    results = client.get(
+        f"/api/v1/draws/{draw_id}/results", params={"fields": "is_backup"}
+    ).json()
+    assert [set(item) for item in results["items"]] == [{"id", "is_backup"}] * 2
+    assert [item["is_backup"] for item in results["items"]] == [False, True]
+
+    results = client.get(
+        f"/api/v1/draws/{draw_id}/results", params={"fields": "expert"}
+    ).json()
+    assert all(item["expert"]["name"] for item in results["items"])
@@ -0,0 +1,75 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.core.static_files import UploadStaticFiles
+from app.services import derivatives
+
+
+@pytest.fixture
+def outside_image():
+    upload_root = Path(settings.upload_dir).resolve()
+    upload_root.mkdir(parents=True, exist_ok=True)
+    outside = upload_root.parent / "outside"
+    outside.mkdir(exist_ok=True)
+    secret = outside / "secret.png"
+    Image.new("RGB", (8, 8)).save(secret)
+    yield upload_root, outside
+    for path in outside.iterdir():
+        path.unlink()
+    outside.rmdir()
+
+
+def _raw_get(app, path: str) -> int:
+    """Send ``path`` as-is, without the URL normalization an HTTP client does."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def call():
+        try:
+            await app(scope, receive, send)
+        except Exception as exc:  # StaticFiles raises HTTPException directly
+            return exc.status_code
+        return messages[0]["status"]
+
+    return asyncio.run(call())
+
+
+def test_derivative_request_cannot_leave_upload_dir(outside_image):
+    upload_root, outside = outside_image
+    app = UploadStaticFiles(directory=str(upload_root))
+
+    status = _raw_get(app, "/../outside/secret.thumb.webp")
+
+    assert status == 404
+    assert sorted(path.name for path in outside.iterdir()) == ["secret.png"]
+
+
+def test_derivative_helpers_reject_escaping_paths(outside_image):
+    upload_root, _ = outside_image
+
+    assert derivatives.parse_derivative("../outside/secret.thumb.webp") is None
+    assert derivatives.find_source("../outside/secret") is None
+    assert derivatives.schedule("../outside/secret.png") is None
+    with pytest.raises(ValueError):
+        derivatives.generate(str(upload_root), "../outside/secret.png")
@@ -0,0 +1,64 @@
+import asyncio
+import fcntl
+import hashlib
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import uploads as upload_service
+
+
+async def _stream(data: bytes):
+    yield data
+
+
+def _append(upload_id: str, start: int, data: bytes, total: int | None = None):
+    end = start + len(data) - 1
+    return asyncio.run(
+        upload_service.append_chunk(upload_id, start, end, total, _stream(data))
+    )
+
+
+def _status_code(call) -> int:
+    with pytest.raises(HTTPException) as excinfo:
+        call()
+    return excinfo.value.status_code
+
+
+def test_session_round_trip():
+    data = os.urandom(3000)
+    upload_id = upload_service.create_session("scan.pdf", len(data))["upload_id"]
+    _append(upload_id, 0, data[:1000], len(data))
+    assert _append(upload_id, 1000, data[1000:])["complete"]
+
+    stored = upload_service.complete_session(upload_id)
+
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert _status_code(lambda: upload_service.complete_session(upload_id)) == 404
+
+
+def test_chunk_must_match_content_range():
+    upload_id = upload_service.create_session("scan.pdf", 100)["upload_id"]
+
+    assert (
+        _status_code(
+            lambda: asyncio.run(
+                upload_service.append_chunk(upload_id, 0, 49, 100, _stream(b"x" * 10))
+            )
+        )
+        == 400
+    )
+    assert _status_code(lambda: _append(upload_id, 0, b"x" * 10, total=99)) == 400
+    # A rejected chunk leaves nothing behind.
+    assert upload_service.get_session(upload_id)["received"] == 0
+
+
+def test_concurrent_writer_is_rejected():
+    upload_id = upload_service.create_session("scan.pdf", 100)["upload_id"]
+    part, _ = upload_service._session_paths(upload_id)
+    with part.open("ab") as held:
+        fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+        assert _status_code(lambda: _append(upload_id, 0, b"x" * 10)) == 409
+        assert _status_code(lambda: upload_service.complete_session(upload_id)) == 409
+    assert _append(upload_id, 0, b"x" * 10)["received"] == 10
@@ -530,6 +530,7 @@ export default {
       replace: "Replace",
       batchDelete: "Batch Delete",
       exportSignin: "Export Sign-in",
+      topUp: "Add Backups",
     },
     contact: {
       name: "Name",
@@ -555,6 +556,8 @@ export default {
         avoidPersonsPlaceholder: "Select experts to avoid",
         rule: "Rule",
         status: "Status",
+        pool: "Eligible Experts",
+        poolInsufficient: "{count} eligible, {required} required",
     },
     dialog: {
       new: "New Draw",
@@ -614,6 +617,10 @@ export default {
       deleteConfirm: "Delete draw {id}?",
       executeConfirm: "Execute draw {id}?",
       replaceConfirm: "Replace {name} with a backup expert?",
+      topUpPrompt: "How many backup experts to add?",
+      topUpInvalid: "Enter a number between 1 and 100",
+      topUpSuccess: "Added {count} backup experts",
+      topUpFailed: "Failed to add backup experts",
     },
   },
   locale: {
@@ -530,6 +530,7 @@ export default {
       replace: "替补",
       batchDelete: "批量删除",
       exportSignin: "导出签到表",
+      topUp: "追加候补",
     },
     contact: {
       name: "姓名",
@@ -555,6 +556,8 @@ export default {
         avoidPersonsPlaceholder: "选择回避人员（按专家）",
         rule: "规则",
         status: "状态",
+        pool: "符合条件专家",
+        poolInsufficient: "符合条件 {count} 人，需要 {required} 人",
     },
     dialog: {
       new: "新增抽取",
@@ -614,6 +617,10 @@ export default {
       deleteConfirm: "确定删除抽取 {id}？",
       executeConfirm: "确定执行抽取 {id}？",
       replaceConfirm: "确认用替补专家替换 {name}？",
+      topUpPrompt: "请输入追加的候补专家人数",
+      topUpInvalid: "请输入 1 到 100 之间的数字",
+      topUpSuccess: "已追加 {count} 名候补专家",
+      topUpFailed: "追加候补失败",
     },
   },
   locale: {
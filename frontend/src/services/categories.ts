@@ -1,5 +1,5 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
+import type { BatchGetResult, ListParams, Page } from "../types/pagination";
 import type {
   Category,
   CategoryCreate,
@@ -22,6 +22,11 @@ export async function listCategoryTree() {
   return data;
 }
 
+export async function batchGetCategories(ids: number[]) {
+  const { data } = await http.post<BatchGetResult<Category>>("/categories/batch-get", { ids });
+  return data;
+}
+
 export async function createCategory(payload: CategoryCreate) {
   const { data } = await http.post<Category>("/categories", payload);
   return data;
@@ -1,15 +1,18 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
+import type { FieldsListParams, Page } from "../types/pagination";
 import type {
   DrawApplication,
   DrawApply,
+  DrawPoolPreview,
+  DrawPreview,
   DrawResultContact,
   DrawResultContactUpdate,
+  DrawResultDelta,
   DrawResultOut,
   DrawUpdate,
 } from "../types/domain";
 
-export async function listDraws(params: ListParams) {
+export async function listDraws(params: FieldsListParams) {
   const { data } = await http.get<Page<DrawApplication>>("/draws", { params });
   return data;
 }
@@ -24,6 +27,11 @@ export async function createDraw(payload: DrawApply) {
   return data;
 }
 
+export async function previewDraw(payload: DrawPreview) {
+  const { data } = await http.post<DrawPoolPreview>("/draws/preview", payload);
+  return data;
+}
+
 export async function updateDraw(drawId: number, payload: DrawUpdate) {
   const { data } = await http.put<DrawApplication>(`/draws/${drawId}`, payload);
   return data;
@@ -46,7 +54,7 @@ export async function executeDraw(drawId: number) {
   return data;
 }
 
-export async function listDrawResults(drawId: number, params: ListParams) {
+export async function listDrawResults(drawId: number, params: FieldsListParams) {
   const { data } = await http.get<Page<DrawResultOut>>(
     `/draws/${drawId}/results`,
     { params },
@@ -55,13 +63,36 @@ export async function listDrawResults(drawId: number, params: ListParams) {
 }
 
 export async function replaceDrawResult(drawId: number, resultId: number) {
-  const { data } = await http.post<DrawResultOut[]>(
+  const { data } = await http.post<DrawResultDelta>(
     `/draws/${drawId}/replace`,
     { result_id: resultId },
   );
   return data;
 }
 
+export async function topUpDrawBackups(drawId: number, count: number) {
+  const { data } = await http.post<DrawResultDelta>(`/draws/${drawId}/top-up`, {
+    count,
+  });
+  return data;
+}
+
+export function subscribeDrawEvents(
+  drawId: number,
+  onChange: (delta: DrawResultDelta | null) => void,
+) {
+  // EventSource cannot set headers, so the token travels as a query param.
+  const token = localStorage.getItem("access_token") ?? "";
+  const source = new EventSource(
+    `/api/v1/draws/${drawId}/events?access_token=${encodeURIComponent(token)}`,
+  );
+  source.addEventListener("results", (event) => {
+    onChange(JSON.parse((event as MessageEvent<string>).data) as DrawResultDelta);
+  });
+  source.addEventListener("resync", () => onChange(null));
+  return source;
+}
+
 export async function getDrawResultContact(drawId: number, resultId: number) {
   const { data } = await http.get<DrawResultContact>(
     `/draws/${drawId}/results/${resultId}/contact`,
@@ -74,7 +105,7 @@ export async function updateDrawResultContact(
   resultId: number,
   payload: DrawResultContactUpdate,
 ) {
-  const { data } = await http.put<DrawResultOut[]>(
+  const { data } = await http.put<DrawResultDelta>(
     `/draws/${drawId}/results/${resultId}/contact`,
     payload,
   );
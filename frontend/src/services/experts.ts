@@ -1,8 +1,18 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
-import type { Expert, ExpertCreate, ExpertUpdate } from "../types/domain";
+import type {
+  BatchGetResult,
+  BatchUpdateResult,
+  FieldsListParams,
+  Page,
+} from "../types/pagination";
+import type {
+  Expert,
+  ExpertBatchPatch,
+  ExpertCreate,
+  ExpertUpdate,
+} from "../types/domain";
 
-export interface ExpertListParams extends ListParams {
+export interface ExpertListParams extends FieldsListParams {
   organization_id?: number;
   region_id?: number;
   title_id?: number;
@@ -21,6 +31,11 @@ export async function listExpertsAll() {
   return data;
 }
 
+export async function batchGetExperts(ids: number[]) {
+  const { data } = await http.post<BatchGetResult<Expert>>("/experts/batch-get", { ids });
+  return data;
+}
+
 export async function getExpert(expertId: number) {
   const { data } = await http.get<Expert>(`/experts/${expertId}`);
   return data;
@@ -36,6 +51,14 @@ export async function updateExpert(expertId: number, payload: ExpertUpdate) {
   return data;
 }
 
+export async function batchUpdateExperts(ids: number[], patch: ExpertBatchPatch) {
+  const { data } = await http.post<BatchUpdateResult>("/experts/batch-update", {
+    ids,
+    patch,
+  });
+  return data;
+}
+
 export async function deleteExpert(expertId: number) {
   await http.delete(`/experts/${expertId}`);
 }
@@ -1,5 +1,10 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
+import type {
+  BatchDeleteResult,
+  BatchGetResult,
+  ListParams,
+  Page,
+} from "../types/pagination";
 import type {
   Organization,
   OrganizationCreate,
@@ -16,6 +21,11 @@ export async function listOrganizationsAll() {
   return data;
 }
 
+export async function batchGetOrganizations(ids: number[]) {
+  const { data } = await http.post<BatchGetResult<Organization>>("/organizations/batch-get", { ids });
+  return data;
+}
+
 export async function createOrganization(payload: OrganizationCreate) {
   const { data } = await http.post<Organization>("/organizations", payload);
   return data;
@@ -37,6 +47,6 @@ export async function deleteOrganization(organizationId: number) {
 }
 
 export async function deleteOrganizations(ids: number[]) {
-  const { data } = await http.post("/organizations/batch-delete", { ids });
-  return data as { deleted: number; skipped: number };
+  const { data } = await http.post<BatchDeleteResult>("/organizations/batch-delete", { ids });
+  return data;
 }
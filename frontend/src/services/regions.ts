@@ -1,5 +1,10 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
+import type {
+  BatchDeleteResult,
+  BatchGetResult,
+  ListParams,
+  Page,
+} from "../types/pagination";
 import type { Region, RegionCreate, RegionUpdate } from "../types/domain";
 
 export async function listRegions(params: ListParams) {
@@ -12,6 +17,11 @@ export async function listRegionsAll() {
   return data;
 }
 
+export async function batchGetRegions(ids: number[]) {
+  const { data } = await http.post<BatchGetResult<Region>>("/regions/batch-get", { ids });
+  return data;
+}
+
 export async function createRegion(payload: RegionCreate) {
   const { data } = await http.post<Region>("/regions", payload);
   return data;
@@ -27,6 +37,6 @@ export async function deleteRegion(regionId: number) {
 }
 
 export async function deleteRegions(ids: number[]) {
-  const { data } = await http.post("/regions/batch-delete", { ids });
-  return data as { deleted: number; skipped: number };
+  const { data } = await http.post<BatchDeleteResult>("/regions/batch-delete", { ids });
+  return data;
 }
@@ -1,6 +1,11 @@
 import http from "../apis/http";
 import type { ListParams, Page } from "../types/pagination";
-import type { Rule, RuleCreate, RuleUpdate } from "../types/domain";
+import type {
+  DrawPoolPreview,
+  Rule,
+  RuleCreate,
+  RuleUpdate,
+} from "../types/domain";
 
 export async function listRules(params: ListParams) {
   const { data } = await http.get<Page<Rule>>("/rules", { params });
@@ -17,6 +22,11 @@ export async function getRule(ruleId: number) {
   return data;
 }
 
+export async function getRulePoolSize(ruleId: number) {
+  const { data } = await http.get<DrawPoolPreview>(`/rules/${ruleId}/pool-size`);
+  return data;
+}
+
 export async function createRule(payload: RuleCreate) {
   const { data } = await http.post<Rule>("/rules", payload);
   return data;
@@ -1,5 +1,5 @@
 import http from "../apis/http";
-import type { ListParams, Page } from "../types/pagination";
+import type { BatchGetResult, ListParams, Page } from "../types/pagination";
 import type { Title, TitleCreate, TitleUpdate } from "../types/domain";
 
 export type TitleBatchAction = "enable" | "disable" | "delete";
@@ -23,6 +23,11 @@ export async function listTitlesAll() {
   return data;
 }
 
+export async function batchGetTitles(ids: number[]) {
+  const { data } = await http.post<BatchGetResult<Title>>("/titles/batch-get", { ids });
+  return data;
+}
+
 export async function createTitle(payload: TitleCreate) {
   const { data } = await http.post<Title>("/titles", payload);
   return data;
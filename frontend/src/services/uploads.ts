@@ -1,10 +1,75 @@
 import http from "../apis/http";
 
+export interface UploadResult {
+  url: string;
+  filename: string;
+  path: string;
+  sha256?: string | null;
+  size?: number | null;
+  deduplicated?: boolean;
+}
+
+interface UploadSession {
+  upload_id: string;
+  filename: string;
+  size: number;
+  received: number;
+  chunk_size: number;
+  complete: boolean;
+}
+
+const RESUMABLE_THRESHOLD = 8 * 1024 * 1024;
+const CHUNK_RETRIES = 3;
+
 export async function uploadExpertCredential(file: File) {
-  const formData = new FormData();
-  formData.append("file", file);
-  const { data } = await http.post("/uploads/expert-credential", formData, {
-    headers: { "Content-Type": "multipart/form-data" },
+  if (file.size > RESUMABLE_THRESHOLD) {
+    return uploadResumable(file);
+  }
+  const { data } = await http.put<UploadResult>("/uploads/expert-credential", file, {
+    params: { filename: file.name },
+    headers: { "Content-Type": "application/octet-stream" },
+  });
+  return data;
+}
+
+async function uploadResumable(file: File) {
+  const { data: created } = await http.post<UploadSession>("/uploads/sessions", {
+    filename: file.name,
+    size: file.size,
   });
-  return data as { url: string; filename: string; path: string };
+  let session = created;
+  let failures = 0;
+  while (!session.complete) {
+    const start = session.received;
+    const end = Math.min(start + session.chunk_size, file.size);
+    try {
+      const { data } = await http.put<UploadSession>(
+        `/uploads/sessions/${session.upload_id}`,
+        file.slice(start, end),
+        {
+          headers: {
+            "Content-Type": "application/octet-stream",
+            "Content-Range": `bytes ${start}-${end - 1}/${file.size}`,
+          },
+          timeout: 0,
+        },
+      );
+      session = data;
+      failures = 0;
+    } catch (error) {
+      failures += 1;
+      if (failures > CHUNK_RETRIES) {
+        throw error;
+      }
+      // Resume from whatever the server actually stored.
+      const { data } = await http.get<UploadSession>(
+        `/uploads/sessions/${session.upload_id}`,
+      );
+      session = data;
+    }
+  }
+  const { data } = await http.post<UploadResult>(
+    `/uploads/sessions/${session.upload_id}/complete`,
+  );
+  return data;
 }
@@ -13,9 +13,16 @@ export interface Expert {
   specialties?: Specialty[];
   specialty_ids?: number[];
   appointment_letter_urls?: string[];
+  appointment_letters?: AppointmentLetter[];
   is_active: boolean;
 }
 
+export interface AppointmentLetter {
+  url: string;
+  thumb_url?: string | null;
+  preview_url?: string | null;
+}
+
 export interface ExpertCreate {
   name: string;
   id_card_no: string;
@@ -48,6 +55,19 @@ export interface ExpertUpdate {
   is_active?: boolean | null;
 }
 
+export interface ExpertBatchPatch {
+  is_active?: boolean;
+  company?: string | null;
+  organization_id?: number | null;
+  region?: string | null;
+  region_id?: number | null;
+  title?: string | null;
+  title_id?: number | null;
+  specialty_ids?: number[];
+  add_specialty_ids?: number[];
+  remove_specialty_ids?: number[];
+}
+
 export interface Rule {
   id: number;
   name: string;
@@ -116,6 +136,7 @@ export interface DrawApplication {
   expert_count: number;
   total_count: number;
   backup_count: number;
+  accepted_count?: number;
   draw_method: string;
   review_time?: string | null;
   review_location?: string | null;
@@ -187,6 +208,38 @@ export interface DrawResultOut {
   expert?: DrawResultExpert | null;
 }
 
+export interface DrawPreview {
+  rule_id: number;
+  expert_count?: number | null;
+  backup_count?: number;
+  avoid_units?: string | null;
+  avoid_persons?: string | null;
+}
+
+export interface PoolBucket {
+  id?: number | null;
+  name?: string | null;
+  count: number;
+}
+
+export interface DrawPoolPreview {
+  rule_id: number;
+  eligible_count: number;
+  required_count?: number | null;
+  feasible?: boolean | null;
+  by_specialty: PoolBucket[];
+  by_region: PoolBucket[];
+  by_title: PoolBucket[];
+}
+
+export interface DrawResultDelta {
+  draw_id: number;
+  status: string;
+  accepted_count: number;
+  changed: DrawResultOut[];
+  removed_ids: number[];
+}
+
 export interface DrawResultContact {
   name: string;
   phone?: string | null;
@@ -5,6 +5,25 @@ export interface Page<T> {
   page_size: number;
 }
 
+export interface BatchGetResult<T> {
+  items: T[];
+  missing_ids: number[];
+}
+
+export interface BatchUpdateResult {
+  updated: number;
+  skipped: number;
+  updated_ids: number[];
+  errors: { id: number; detail: string }[];
+}
+
+export interface BatchDeleteResult {
+  deleted: number;
+  skipped: number;
+  deleted_ids: number[];
+  errors: { id: number; detail: string }[];
+}
+
 export interface ListParams {
   page?: number;
   page_size?: number;
@@ -12,3 +31,9 @@ export interface ListParams {
   sort_order?: "asc" | "desc";
   keyword?: string;
 }
+
+export interface FieldsListParams extends ListParams {
+  // Comma-separated sparse fieldset, e.g. "id,name"; the response then only
+  // carries those fields.
+  fields?: string;
+}
@@ -1,8 +1,50 @@
-import { defineConfig } from "vite";
+import { readFileSync, readdirSync, writeFileSync } from "node:fs";
+import { join, resolve } from "node:path";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+import { defineConfig, type Plugin } from "vite";
 import vue from "@vitejs/plugin-vue";
 
+const COMPRESSIBLE = /\.(css|html|js|json|map|mjs|svg|txt)$/;
+const MIN_COMPRESS_BYTES = 1024;
+
+function listFiles(dir: string): string[] {
+  return readdirSync(dir, { withFileTypes: true }).flatMap((entry) =>
+    entry.isDirectory() ? listFiles(join(dir, entry.name)) : [join(dir, entry.name)],
+  );
+}
+
+// Writes .br/.gz next to text assets; the backend picks one by Accept-Encoding.
+function precompress(): Plugin {
+  let outDir = "dist";
+  return {
+    name: "pickone-precompress",
+    apply: "build",
+    configResolved(config) {
+      outDir = resolve(config.root, config.build.outDir);
+    },
+    closeBundle() {
+      for (const file of listFiles(outDir)) {
+        if (!COMPRESSIBLE.test(file)) {
+          continue;
+        }
+        const content = readFileSync(file);
+        if (content.length < MIN_COMPRESS_BYTES) {
+          continue;
+        }
+        writeFileSync(
+          `${file}.br`,
+          brotliCompressSync(content, {
+            params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY },
+          }),
+        );
+        writeFileSync(`${file}.gz`, gzipSync(content, { level: 9 }));
+      }
+    },
+  };
+}
+
 export default defineConfig({
-  plugins: [vue()],
+  plugins: [vue(), precompress()],
   server: {
     port: 5173,
     proxy: {